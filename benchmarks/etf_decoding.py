@@ -0,0 +1,74 @@
+"""Compares decode time of ETF gateway payloads against JSON on synthetic ``GUILD_CREATE`` payloads.
+
+Pass ``--payloads`` with a JSON file holding a list of recorded gateway payloads to benchmark real data instead.
+
+Usage: ``python benchmarks/etf_decoding.py [--guilds N] [--members N] [--payloads FILE]``
+"""
+
+import argparse
+import json
+import time
+import typing
+
+from gateway_compression import make_guild_create
+
+from wyvern.internals import etf
+from wyvern.internals.codecs import get_codec
+
+
+def snowflakes_to_int(obj: typing.Any) -> typing.Any:
+    # The gateway sends snowflakes as integers when using ETF.
+    if isinstance(obj, dict):
+        return {
+            k: int(v)
+            if (k == "id" or k.endswith("_id")) and isinstance(v, str) and v.isdigit()
+            else snowflakes_to_int(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [snowflakes_to_int(v) for v in obj]
+    return obj
+
+
+def timed(loads: typing.Callable[[typing.Any], typing.Any], frames: list[typing.Any], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for frame in frames:
+            loads(frame)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--guilds", type=int, default=50)
+    parser.add_argument("--members", type=int, default=250)
+    parser.add_argument("--payloads", type=str, default=None)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.payloads:
+        with open(args.payloads) as f:
+            payloads = json.load(f)
+    else:
+        payloads = [make_guild_create(1 << 40 | i << 20, args.members) for i in range(args.guilds)]
+
+    json_frames = [json.dumps(p, separators=(",", ":")) for p in payloads]
+    etf_frames = [etf.dumps(snowflakes_to_int(p)) for p in payloads]
+
+    print(f"{len(payloads)} payloads, best of {args.rounds} rounds")
+    print(f"{'codec':<8} {'size KiB':>10} {'decode ms':>10}")
+    for name in ("json", "orjson", "ujson"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        elapsed = timed(codec.loads, json_frames, args.rounds)
+        print(f"{name:<8} {sum(map(len, json_frames)) / 1024:>10.1f} {elapsed * 1000:>10.1f}")
+    elapsed = timed(etf.loads, etf_frames, args.rounds)
+    print(f"{'etf':<8} {sum(map(len, etf_frames)) / 1024:>10.1f} {elapsed * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compares bytes on the wire and decode time of plain JSON gateway frames against ``zlib-stream`` frames.
+
+Usage: ``python benchmarks/gateway_compression.py [--guilds N] [--members N]``
+"""
+
+import argparse
+import json
+import random
+import time
+import zlib
+
+from wyvern.internals.gateway import Gateway
+
+
+def make_guild_create(guild_id: int, members: int) -> dict:
+    return {
+        "op": 0,
+        "s": guild_id,
+        "t": "GUILD_CREATE",
+        "d": {
+            "id": str(guild_id),
+            "name": f"guild-{guild_id}",
+            "member_count": members,
+            "roles": [
+                {"id": str(guild_id + r), "name": f"role-{r}", "permissions": "1071698660929", "position": r}
+                for r in range(20)
+            ],
+            "channels": [
+                {"id": str(guild_id + c), "name": f"channel-{c}", "type": 0, "position": c, "nsfw": False}
+                for c in range(40)
+            ],
+            "members": [
+                {
+                    "user": {
+                        "id": str(random.getrandbits(63)),
+                        "username": f"user{m}",
+                        "discriminator": f"{m % 10000:04}",
+                        "avatar": "%032x" % random.getrandbits(128),
+                        "public_flags": 0,
+                    },
+                    "roles": [str(guild_id + r) for r in range(m % 4)],
+                    "joined_at": "2021-06-01T12:00:00.000000+00:00",
+                    "deaf": False,
+                    "mute": False,
+                }
+                for m in range(members)
+            ],
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--guilds", type=int, default=200)
+    parser.add_argument("--members", type=int, default=250)
+    args = parser.parse_args()
+
+    frames = [json.dumps(make_guild_create(1 << 40 | i << 20, args.members)) for i in range(args.guilds)]
+
+    compressor = zlib.compressobj()
+    compressed = [compressor.compress(f.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH) for f in frames]
+
+    plain_size = sum(len(f.encode()) for f in frames)
+    compressed_size = sum(len(f) for f in compressed)
+
+    start = time.perf_counter()
+    for frame in frames:
+        json.loads(frame)
+    plain_time = time.perf_counter() - start
+
+    gateway = Gateway(None, compress=True)  # type: ignore
+    gateway._inflator = zlib.decompressobj()
+    start = time.perf_counter()
+    for frame in compressed:
+        json.loads(gateway.decompress(frame))  # type: ignore
+    compressed_time = time.perf_counter() - start
+
+    print(f"{args.guilds} GUILD_CREATE frames, {args.members} members each")
+    print(f"json        : {plain_size / 1024:>10.1f} KiB  {plain_time * 1000:>8.1f} ms")
+    print(f"zlib-stream : {compressed_size / 1024:>10.1f} KiB  {compressed_time * 1000:>8.1f} ms")
+    print(f"wire ratio  : {compressed_size / plain_size:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measures the memory held by cached :class:`~wyvern.models.members.GuildMember` s with ``tracemalloc``.
+
+Members are spread over several guilds so users are shared between them, like in a bot's member cache.
+
+Usage: ``python benchmarks/member_memory.py [--members N] [--guilds N] [--retain-raw]``
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+import wyvern
+from wyvern.api.cache import CacheConfig
+
+
+def make_member(user_id: int, roles: int) -> dict:
+    return {
+        "user": {
+            "id": str(user_id),
+            "username": f"user{user_id % 100000}",
+            "discriminator": f"{user_id % 10000:04}",
+            "avatar": f"{user_id:032x}",
+            "public_flags": 0,
+        },
+        "roles": [str(1 << 40 | r) for r in range(roles)],
+        "joined_at": "2021-06-01T12:00:00.000000+00:00",
+        "deaf": False,
+        "mute": False,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=1_000_000)
+    parser.add_argument("--guilds", type=int, default=10)
+    parser.add_argument("--retain-raw", action="store_true")
+    args = parser.parse_args()
+
+    bot = wyvern.GatewayBot("TOKEN", cache_config=CacheConfig(retain_raw=args.retain_raw))
+    users = args.members // 2
+    guild_ids = [1 << 41 | g for g in range(args.guilds)]
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(args.members):
+        # Payloads are dropped right after being cached, only what the cache retains is measured.
+        guild_id = wyvern.Snowflake(guild_ids[i * args.guilds // args.members])
+        bot.cache.store_member(guild_id, make_member(1 << 42 | i % users, i % 4))
+    gc.collect()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{len(bot.cache.members)} members of {len(bot.cache.users)} users in {args.guilds} guilds")
+    print(f"retained   : {(after - before) / 1024 / 1024:>10.1f} MiB")
+    print(f"per member : {(after - before) / len(bot.cache.members):>10.1f} B")
+    print(f"peak       : {(peak - before) / 1024 / 1024:>10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+
+import attrs
+
+from wyvern.api.event_handler import EventListener
+from wyvern.api.event_scheduler import EventScheduler, OverflowPolicy
+from wyvern.events.base import Event
+
+
+@attrs.define(kw_only=True)
+class ChannelEvent(Event):
+    channel_id: int
+    number: int
+
+
+def test_shed_oldest_drops_backlogged_lane_events() -> None:
+    async def main() -> None:
+        scheduler = EventScheduler(max_queue_size=5, overflow=OverflowPolicy.SHED_OLDEST)
+        delivered: list[int] = []
+
+        async def callback(event: ChannelEvent) -> None:
+            delivered.append(event.number)
+            await asyncio.sleep(0)
+
+        listener = EventListener(type=ChannelEvent, callback=callback, partition="channel_id")
+        for number in range(20):
+            scheduler.submit_nowait(listener, ChannelEvent(bot=None, channel_id=1, number=number))  # type: ignore
+        await scheduler.join()
+        while scheduler.running:
+            await scheduler.join()
+
+        # The first event was already running, the newest five replaced the older backlogged ones.
+        assert delivered == [0, 15, 16, 17, 18, 19]
+        assert scheduler.dropped == 14
+        assert scheduler.queued == 0 and not scheduler.lanes
+
+    asyncio.run(main())
+
+
+def test_shed_oldest_prefers_the_oldest_event_across_queues() -> None:
+    async def main() -> None:
+        scheduler = EventScheduler(max_concurrency=1, max_queue_size=3, overflow=OverflowPolicy.SHED_OLDEST)
+        delivered: list[int] = []
+
+        async def callback(event: ChannelEvent) -> None:
+            delivered.append(event.number)
+            await asyncio.sleep(0)
+
+        lanes = EventListener(type=ChannelEvent, callback=callback, partition="channel_id")
+        plain = EventListener(type=ChannelEvent, callback=callback)
+        for number in range(8):
+            listener = lanes if number % 2 else plain
+            scheduler.submit_nowait(listener, ChannelEvent(bot=None, channel_id=1, number=number))  # type: ignore
+        while scheduler.running:
+            await scheduler.join()
+
+        # Listeners take turns, so only which events survived is fixed, not their order across listeners.
+        assert sorted(delivered) == [0, 5, 6, 7]
+        assert scheduler.dropped == 4
+
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import typing
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+import wyvern
+from wyvern.internals import rest
+from wyvern.internals.rest import Endpoints, RequestRoute
+from wyvern.internals.retries import RetryBudget, RetryPolicy
+
+
+@contextlib.asynccontextmanager
+async def stand_in(statuses: list[int]) -> typing.AsyncIterator[list[str]]:
+    """Serves ``statuses`` in order, then ``200`` s, and yields the methods of the requests it got."""
+    hits: list[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.method)
+        status = statuses[len(hits) - 1] if len(hits) <= len(statuses) else 200
+        return web.json_response({"id": "1", "username": "wyvern", "discriminator": "0001"}, status=status)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(rest, "api_prefix", lambda version: f"http://127.0.0.1:{port}/api/v{version}/")
+        try:
+            yield hits
+        finally:
+            await runner.cleanup()
+
+
+def make_bot(**policy: typing.Any) -> wyvern.GatewayBot:
+    return wyvern.GatewayBot("TOKEN", retry_policy=RetryPolicy(**{"base_delay": 0.01, **policy}))
+
+
+def test_get_is_retried_after_server_error() -> None:
+    async def main() -> None:
+        bot = make_bot()
+        async with stand_in([503]) as hits, bot:
+            user = await bot.rest.fetch_user(1)
+        assert user.username == "wyvern"
+        assert hits == ["GET", "GET"]
+        assert sum(bot.rest.metrics.retries.values()) == 1
+
+    asyncio.run(main())
+
+
+def test_post_is_not_retried() -> None:
+    async def main() -> None:
+        bot = make_bot()
+        async with stand_in([503]) as hits, bot:
+            with pytest.raises(aiohttp.ClientResponseError) as error:
+                await bot.rest.create_message(1, "hello")
+        assert error.value.status == 503
+        assert hits == ["POST"]
+
+    asyncio.run(main())
+
+
+def test_retries_stop_at_deadline() -> None:
+    async def main() -> None:
+        bot = make_bot(max_retries=100, base_delay=0.05, max_delay=0.05)
+        async with stand_in([503] * 100) as hits, bot:
+            start = time.monotonic()
+            # Either the last response's error or a timeout of the attempt cut short by the deadline.
+            with pytest.raises((aiohttp.ClientResponseError, asyncio.TimeoutError)):
+                await bot.rest.request(RequestRoute(Endpoints.get_user(1), deadline=0.3))
+            assert time.monotonic() - start < 0.35
+        assert 1 < len(hits) < 100
+
+    asyncio.run(main())
+
+
+def test_retries_stop_when_budget_is_spent() -> None:
+    async def main() -> None:
+        bot = make_bot(budget=RetryBudget(ratio=0, min_per_second=1, max_tokens=0))
+        async with stand_in([503] * 10) as hits, bot:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await bot.rest.fetch_user(1)
+        assert hits == ["GET", "GET"]
+
+    asyncio.run(main())
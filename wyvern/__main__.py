@@ -31,6 +31,12 @@ parser = argparse.ArgumentParser(
     prog="wyvern", description="Commands related to the library and it's usage.", add_help=True
 )
 parser.add_argument("-V", "-v", "--version", help="Check the version of library.", action="store_true")
+subparsers = parser.add_subparsers(dest="command")
+
+cluster_parser = subparsers.add_parser("cluster", help="Run the shards of a bot across several processes.")
+cluster_parser.add_argument("factory", help="Import path of the bot factory, as 'module:callable'.")
+cluster_parser.add_argument("-w", "--workers", type=int, default=None, help="Number of worker processes.")
+cluster_parser.add_argument("-s", "--shards", type=int, default=None, help="Total number of shards.")
 
 
 def main() -> None:
@@ -47,6 +53,15 @@ def main() -> None:
             sys.version,
             colorama.Style.RESET_ALL,
         )
+    elif args.command == "cluster":
+        from wyvern.api.cluster import Cluster
+
+        sys.path.insert(0, ".")
+        cluster = Cluster(factory=args.factory, shard_count=args.shards)
+        if args.workers is not None:
+            cluster.workers = args.workers
+        cluster.run()
 
 
-main()
+if __name__ == "__main__":
+    main()
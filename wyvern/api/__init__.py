@@ -21,4 +21,8 @@
 # SOFTWARE.
 
 from .bot import *
+from .cache import *
+from .cluster import *
+from .cooldowns import *
 from .intents import *
+from .sharding import *
@@ -28,14 +28,29 @@ import typing
 import aiohttp
 
 from wyvern import logger, types
+from wyvern.api.cache import Cache, CacheConfig
 from wyvern.api.event_decos import ImplementsEventDecos
-from wyvern.api.event_handler import EventHandler, EventListener
+from wyvern.api.event_handler import EventHandler, EventListener, EventT
+from wyvern.api.event_scheduler import EventScheduler, OverflowPolicy
 from wyvern.api.gateway import GatewayImpl
 from wyvern.api.intents import Intents
 from wyvern.api.rest_client import RESTClientImpl
+from wyvern.api.sharding import ShardManager
 from wyvern.events.base import Event
+from wyvern.internals.codecs import JSONCodec, get_codec
+from wyvern.internals.connection import ConnectorConfig, SharedSession
+from wyvern.internals.gateway import GatewayCloseError
+from wyvern.internals.ratelimits import GlobalRateLimitBackend, RateLimiter
+from wyvern.internals.response_cache import ResponseCache
+from wyvern.internals.retries import RetryPolicy
+from wyvern.models.members import GuildMember
+from wyvern.models.snowflake import Snowflake
+from wyvern.models.users import User
 from wyvern.utils.consts import UNDEFINED, Undefined
 
+if typing.TYPE_CHECKING:
+    import discord_typings
+
 __all__: tuple[str, ...] = ("GatewayBot",)
 
 
@@ -51,6 +66,37 @@ class GatewayBot(ImplementsEventDecos):
         Discord API version in usage, defaults to 10.
     intents: typing.SupportsInt | Intents
         Library's :class:`Intents` builder or any object that returns the intent value when passed to :class:`int`
+    gateway_compression: bool
+        Set to true to receive gateway payloads with ``zlib-stream`` transport compression.
+        This cuts down bandwidth considerably for bots in a large number of guilds.
+    gateway_encoding: str
+        Payload encoding used by the gateway, either ``"json"`` or ``"etf"`` ( Erlang term format ).
+        ETF payloads are smaller and carry snowflakes as integers.
+    shard_count: int | None
+        Total number of shards, defaults to the count recommended by discord.
+    shard_ids: typing.Sequence[int] | None
+        IDs of the shards to run in this process, defaults to all of them.
+    codec: JSONCodec | None
+        The JSON codec used to encode and decode gateway and REST payloads.
+        Defaults to the fastest of ``orjson``, ``ujson`` and :mod:`json` that is installed.
+    global_ratelimit: GlobalRateLimitBackend | None
+        Backend for discord's global requests per second limit. Use a
+        :class:`~wyvern.internals.ratelimits.SharedMemoryGlobalRateLimitBackend` when several processes
+        run with the same token, defaults to a limiter local to this process.
+    retry_policy: RetryPolicy | None
+        Policy for retrying REST requests that failed with a server error or a dropped connection.
+    connector: ConnectorConfig | None
+        Settings of the connection pool, ignored if ``session`` is passed.
+    session: SharedSession | None
+        A session shared with other bots in the process, to reuse one connection pool across all of them.
+    response_cache: ResponseCache | None
+        Cache for GET responses of slow changing endpoints, responses aren't cached if not passed.
+    event_scheduler: EventScheduler | None
+        Scheduler running the listener callbacks, sets the concurrency limits and the overflow
+        policy applied during event floods.
+    cache_config: CacheConfig | None
+        Policies of the entity cache filled from gateway events, every entity type except messages
+        is cached without limits if not passed.
 
     Example
     -------
@@ -74,29 +120,159 @@ class GatewayBot(ImplementsEventDecos):
             asyncio.run(bot.start())
 
     """
+
     rest: RESTClientImpl
     """The REST handler attached to the instance."""
     intents: Intents
     """Intents being used by the bot."""
     event_handler: EventHandler
     """The :class:`.EventHandler` attached to the instance."""
+    cache: Cache
+    """The :class:`.Cache` holding the entities received over the gateway."""
+    shards: ShardManager
+    """The :class:`.ShardManager` running the bot's gateway connections."""
+    codec: JSONCodec
+    """The JSON codec shared by the gateway and REST handlers."""
+    connector: ConnectorConfig
+    """Settings of the bot's connection pool."""
+    shared_session: SharedSession | None
+    """The session shared with other bots, if any."""
+
     def __init__(
-        self, token: str, *, api_version: int = 10, intents: typing.SupportsInt | Intents = Intents.UNPRIVILEGED
+        self,
+        token: str,
+        *,
+        api_version: int = 10,
+        intents: typing.SupportsInt | Intents = Intents.UNPRIVILEGED,
+        gateway_compression: bool = False,
+        gateway_encoding: typing.Literal["json", "etf"] = "json",
+        shard_count: int | None = None,
+        shard_ids: typing.Sequence[int] | None = None,
+        codec: JSONCodec | None = None,
+        global_ratelimit: GlobalRateLimitBackend | None = None,
+        retry_policy: RetryPolicy | None = None,
+        connector: ConnectorConfig | None = None,
+        session: SharedSession | None = None,
+        response_cache: ResponseCache | None = None,
+        event_scheduler: EventScheduler | None = None,
+        cache_config: CacheConfig | None = None,
     ) -> None:
         self.logger = logger.main_logger
+        if gateway_encoding not in ("json", "etf"):
+            raise ValueError(f"gateway_encoding must be 'json' or 'etf', got {gateway_encoding!r}.")
+        self.codec = codec or get_codec()
+        self.connector = connector or ConnectorConfig()
+        self.shared_session = session
         self.intents = Intents(int(intents))
-        self.rest = RESTClientImpl(token=token, bot=self, api_version=api_version)
-        self.gateway = GatewayImpl(self)
-        self.event_handler = EventHandler(bot=self)
+        self.rest = RESTClientImpl(
+            token=token,
+            bot=self,
+            api_version=api_version,
+            ratelimiter=RateLimiter(global_backend=global_ratelimit) if global_ratelimit else RateLimiter(),
+            retry_policy=retry_policy or RetryPolicy(),
+            response_cache=response_cache,
+        )
+        self.shards = ShardManager(
+            bot=self,
+            shard_count=shard_count,
+            shard_ids=shard_ids,
+            compress=gateway_compression,
+            encoding=gateway_encoding,
+        )
+        self.event_handler = EventHandler(bot=self, scheduler=event_scheduler or EventScheduler())
+        self.cache = Cache(bot=self, config=cache_config or CacheConfig())
+
+    @property
+    def gateway(self) -> GatewayImpl | None:
+        """The connection of the first running shard, ``None`` before the bot starts."""
+        return next(iter(self.shards.shards.values()), None)
+
+    @property
+    def latency(self) -> float:
+        """Average heartbeat latency of the running shards in seconds."""
+        latencies = list(self.shards.latencies.values())
+        return sum(latencies) / len(latencies) if latencies else float("nan")
+
+    async def get_user(self, user_id: int) -> User:
+        """|coro|
+
+        Gets a user from the cache, fetching it if it isn't cached.
+
+        Parameters
+        ----------
+        user_id: int
+            ID of the user.
+
+        Returns
+        -------
+        User
+            The user.
+        """
+        if (user := self.cache.get_user(user_id)) is None:
+            user = self.cache.add_user(await self.rest.fetch_user(user_id))
+        return user
+
+    async def get_member(self, guild_id: int, user_id: int) -> GuildMember:
+        """|coro|
+
+        Gets a guild member from the cache, fetching it if it isn't cached.
+
+        Parameters
+        ----------
+        guild_id: int
+            ID of the guild.
+        user_id: int
+            ID of the member.
+
+        Returns
+        -------
+        GuildMember
+            The member.
+        """
+        if (member := self.cache.get_member(guild_id, user_id)) is None:
+            member = self.cache.add_member(await self.rest.fetch_member(guild_id, user_id))
+        return member
+
+    async def get_guild(self, guild_id: int) -> discord_typings.GuildData:
+        """|coro|
+
+        Gets a raw guild payload from the cache, fetching it if it isn't cached.
+
+        Parameters
+        ----------
+        guild_id: int
+            ID of the guild.
+
+        Returns
+        -------
+        discord_typings.GuildData
+            The raw guild data.
+        """
+        if (guild := self.cache.get_guild(guild_id)) is None:
+            guild = await self.rest.fetch_guild(guild_id)
+            self.cache.guilds.set(Snowflake(guild_id), guild)
+        return guild
 
     async def __aenter__(self) -> None:
-        self.rest.client_session = aiohttp.ClientSession()
+        if self.shared_session is not None:
+            self.rest.client_session = self.shared_session.acquire()
+        else:
+            self.rest.client_session = self.connector.create_session()
 
     async def __aexit__(self, *args: typing.Any) -> None:
-        await self.rest.client_session.close()  # type: ignore
+        if self.shared_session is not None:
+            await self.shared_session.release()
+        else:
+            await self.rest.client_session.close()  # type: ignore
 
     def listener(
-        self, event: type[Event], *, max_trigger: int | Undefined = UNDEFINED
+        self,
+        event: type[Event],
+        *,
+        max_trigger: int | Undefined = UNDEFINED,
+        max_concurrency: int | None = None,
+        partition: str | typing.Callable[[Event], typing.Hashable] | None = None,
+        **kwargs: typing.Any,
     ) -> typing.Callable[[types.EventListenerCallbackT], EventListener]:
         """Adds a listener to the bot's event handler
 
@@ -106,6 +282,13 @@ class GatewayBot(ImplementsEventDecos):
             Type of the event.
         max_trigger : int
             Maximum number of times this event should be triggered.
+        max_concurrency : int | None
+            Maximum number of callbacks running at the same time.
+        partition : str | typing.Callable[[Event], typing.Hashable] | None
+            Attribute name or callable giving the key events are ordered by, for example ``"channel_id"``.
+        **kwargs : typing.Any
+            Filters and middleware of the listener, such as ``checks``, ``guild_ids``, ``channel_ids``,
+            ``cooldown`` and ``middleware``. See :class:`.EventListener`.
 
         Returns
         -------
@@ -115,12 +298,57 @@ class GatewayBot(ImplementsEventDecos):
 
         def decorator(callback: types.EventListenerCallbackT) -> EventListener:
             self.event_handler.add_listener(
-                lsnr := EventListener(type=event, max_trigger=max_trigger, callback=callback, bot=self)
+                lsnr := EventListener(
+                    type=event,
+                    max_trigger=max_trigger,
+                    max_concurrency=max_concurrency,
+                    partition=partition,
+                    callback=callback,
+                    bot=self,
+                    **kwargs,
+                )
             )
             return lsnr
 
         return decorator
 
+    async def wait_for(
+        self,
+        event_type: type[EventT],
+        *,
+        check: typing.Callable[[EventT], bool] | None = None,
+        timeout: float | None = None,
+        **attributes: typing.Hashable,
+    ) -> EventT:
+        """|coro|
+
+        Waits for the next event of a type, see :meth:`.EventHandler.wait_for`.
+
+        Example
+        -------
+            .. highlight:: python
+            .. code-block:: python
+
+                event = await bot.wait_for(wyvern.MessageCreateEvent, channel_id=channel_id, timeout=30)
+        """
+        return await self.event_handler.wait_for(event_type, check=check, timeout=timeout, **attributes)
+
+    def stream(
+        self,
+        event_type: type[EventT],
+        *,
+        check: typing.Callable[[EventT], bool] | None = None,
+        timeout: float | None = None,
+        limit: int | None = None,
+        max_size: int = 100,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        **attributes: typing.Hashable,
+    ) -> typing.AsyncIterator[EventT]:
+        """Iterates over the events of a type as they arrive, see :meth:`.EventHandler.stream`."""
+        return self.event_handler.stream(
+            event_type, check=check, timeout=timeout, limit=limit, max_size=max_size, overflow=overflow, **attributes
+        )
+
     async def start(self, raise_exception: bool = False) -> None:
         """|coro|
 
@@ -136,12 +364,16 @@ class GatewayBot(ImplementsEventDecos):
 
         """
         try:
-            await self.gateway.connect()
+            await self.shards.start()
         except aiohttp.ClientResponseError as e:
             self.logger.error("".join(traceback.format_exception(e)))  # type: ignore
             self.logger.critical("Invalid token was passed to the GatewayBot constructor.")
             if raise_exception is True:
                 raise e
+        except GatewayCloseError as e:
+            self.logger.critical(str(e))
+            if raise_exception is True:
+                raise e
         except AssertionError as e:
             self.logger.error("GatewayBot.start() should be used inside an async context manager. Example:")
             self.logger.error("async with bot:")
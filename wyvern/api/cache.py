@@ -0,0 +1,368 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import collections
+import operator
+import time
+import typing
+import weakref
+
+import attrs
+
+from wyvern.models.members import GuildMember
+from wyvern.models.snowflake import Snowflake
+from wyvern.models.users import User
+
+if typing.TYPE_CHECKING:
+    import discord_typings
+
+    from wyvern.api.bot import GatewayBot
+
+__all__: tuple[str, ...] = ("CachePolicy", "CacheConfig", "EntityStore", "Cache")
+
+KeyT = typing.TypeVar("KeyT", bound=typing.Hashable)
+ValueT = typing.TypeVar("ValueT")
+
+
+@attrs.define(kw_only=True, frozen=True)
+class CachePolicy:
+    """How entities of one type are cached, use the classmethods to create policies."""
+
+    enabled: bool = True
+    """Whether the entities are cached at all."""
+    max_size: int | None = None
+    """Maximum number of entities, the least recently used ones are evicted first."""
+    ttl: float | None = None
+    """Seconds an entity stays in the cache after it was last updated."""
+
+    @classmethod
+    def disabled(cls) -> CachePolicy:
+        """Entities aren't cached."""
+        return cls(enabled=False)
+
+    @classmethod
+    def unbounded(cls) -> CachePolicy:
+        """Entities are kept until discord reports their deletion."""
+        return cls()
+
+    @classmethod
+    def lru(cls, max_size: int) -> CachePolicy:
+        """Keeps the ``max_size`` most recently used entities."""
+        return cls(max_size=max_size)
+
+    @classmethod
+    def expiring(cls, ttl: float, *, max_size: int | None = None) -> CachePolicy:
+        """Entities expire ``ttl`` seconds after they were last updated."""
+        return cls(ttl=ttl, max_size=max_size)
+
+
+@attrs.define(kw_only=True, frozen=True)
+class CacheConfig:
+    """Cache policies of every entity type."""
+
+    users: CachePolicy = CachePolicy.unbounded()
+    """Policy of :class:`.User` s."""
+    members: CachePolicy = CachePolicy.unbounded()
+    """Policy of :class:`.GuildMember` s."""
+    guilds: CachePolicy = CachePolicy.unbounded()
+    """Policy of raw guild payloads."""
+    messages: CachePolicy = CachePolicy.lru(1000)
+    """Policy of raw message payloads."""
+    retain_raw: bool = False
+    """Whether cached users and members keep their raw payloads."""
+
+
+@attrs.define
+class EntityStore(typing.Generic[KeyT, ValueT]):
+    """Entities of one type, stored according to a :class:`CachePolicy`."""
+
+    policy: CachePolicy
+    """The policy applied to the entities."""
+    group_by: typing.Callable[[KeyT], typing.Hashable] | None = None
+    """Derives the group of a key, the entities of a group can be removed at once with :meth:`delete_group`."""
+    entries: collections.OrderedDict[KeyT, tuple[ValueT, float]] = attrs.field(
+        init=False, factory=collections.OrderedDict
+    )
+    """The entities mapped to the time they were stored at, least recently used first."""
+    groups: dict[typing.Hashable, set[KeyT]] = attrs.field(init=False, factory=dict)
+    """Keys of the stored entities mapped by their group, empty without :attr:`group_by`."""
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: KeyT) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """Returns a cached entity, ``None`` if it isn't cached or expired."""
+        if (entry := self.entries.get(key)) is None:
+            return None
+        if self.policy.ttl is not None and time.monotonic() - entry[1] > self.policy.ttl:
+            self.delete(key)
+            return None
+        if self.policy.max_size is not None:
+            self.entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        """Stores an entity, does nothing if the policy is disabled."""
+        if not self.policy.enabled:
+            return
+        now = time.monotonic()
+        if key not in self.entries and self.group_by is not None:
+            self.groups.setdefault(self.group_by(key), set()).add(key)
+        self.entries[key] = (value, now)
+        self.entries.move_to_end(key)
+        if self.policy.ttl is not None:
+            self._purge_expired(now)
+        if self.policy.max_size is not None and len(self.entries) > self.policy.max_size:
+            self.delete(next(iter(self.entries)))
+
+    def _purge_expired(self, now: float) -> None:
+        # Entries are in the order they were last stored or read, so expired ones pile up at the front.
+        # Entries that were read are behind their expiry order and go once they reach the front.
+        entries = self.entries
+        while entries and now - next(iter(entries.values()))[1] > self.policy.ttl:  # type: ignore
+            self.delete(next(iter(entries)))
+
+    def delete(self, key: KeyT) -> ValueT | None:
+        """Removes an entity, returning it if it was cached."""
+        if (entry := self.entries.pop(key, None)) is None:
+            return None
+        if self.group_by is not None:
+            group = self.group_by(key)
+            keys = self.groups[group]
+            keys.discard(key)
+            if not keys:
+                del self.groups[group]
+        return entry[0]
+
+    def delete_group(self, group: typing.Hashable) -> None:
+        """Removes the entities of a group, see :attr:`group_by`."""
+        for key in self.groups.pop(group, ()):
+            del self.entries[key]
+
+    def values(self) -> list[ValueT]:
+        """Returns the cached entities, including expired ones not cleaned up yet."""
+        return [value for value, _ in self.entries.values()]
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.groups.clear()
+
+
+@attrs.define(kw_only=True)
+class Cache:
+    """In memory cache of discord entities, filled from gateway dispatches.
+
+    Members are keyed by ``(guild_id, user_id)``, all other entities by their ID.
+    """
+
+    bot: GatewayBot
+    """The bot the cache belongs to."""
+    config: CacheConfig = attrs.field(factory=CacheConfig)
+    """Policies of the cached entity types."""
+    users: EntityStore[Snowflake, User] = attrs.field(init=False)
+    """Cached users."""
+    members: EntityStore[tuple[Snowflake, Snowflake], GuildMember] = attrs.field(init=False)
+    """Cached guild members, grouped by guild ID."""
+    guilds: EntityStore[Snowflake, discord_typings.GuildData] = attrs.field(init=False)
+    """Cached raw guild payloads, without their members."""
+    messages: EntityStore[Snowflake, discord_typings.MessageData] = attrs.field(init=False)
+    """Cached raw message payloads."""
+    _wanted: frozenset[str] = attrs.field(init=False, factory=frozenset)
+    _shared_users: weakref.WeakValueDictionary[Snowflake, User] = attrs.field(
+        init=False, factory=weakref.WeakValueDictionary
+    )
+
+    def __attrs_post_init__(self) -> None:
+        self.users = EntityStore(self.config.users)
+        self.members = EntityStore(self.config.members, group_by=operator.itemgetter(0))
+        self.guilds = EntityStore(self.config.guilds)
+        self.messages = EntityStore(self.config.messages)
+        self._wanted = frozenset(
+            name
+            for name, stores in _UPDATED_STORES.items()
+            if any(getattr(self.config, store).enabled for store in stores)
+        )
+
+    def wants(self, name: str) -> bool:
+        """Whether the cache is updated from a gateway dispatch.
+
+        Parameters
+        ----------
+        name: str
+            The dispatch name ( ``t`` field ).
+        """
+        return name in self._wanted
+
+    def update(self, name: str, payload: dict[str, typing.Any]) -> None:
+        """Updates the cache from a gateway dispatch.
+
+        Parameters
+        ----------
+        name: str
+            The dispatch name ( ``t`` field ).
+        payload: dict[str, typing.Any]
+            The event data ( ``d`` field ).
+        """
+        if name in self._wanted:
+            _UPDATERS[name](self, payload)
+
+    def get_user(self, user_id: int) -> User | None:
+        """Returns a cached user, ``None`` if it isn't cached."""
+        return self.users.get(Snowflake(user_id))
+
+    def get_member(self, guild_id: int, user_id: int) -> GuildMember | None:
+        """Returns a cached guild member, ``None`` if it isn't cached."""
+        return self.members.get((Snowflake(guild_id), Snowflake(user_id)))
+
+    def get_guild(self, guild_id: int) -> discord_typings.GuildData | None:
+        """Returns a cached raw guild payload, ``None`` if it isn't cached."""
+        return self.guilds.get(Snowflake(guild_id))
+
+    def get_message(self, message_id: int) -> discord_typings.MessageData | None:
+        """Returns a cached raw message payload, ``None`` if it isn't cached."""
+        return self.messages.get(Snowflake(message_id))
+
+    def clear(self) -> None:
+        """Empties every store."""
+        self.users.clear()
+        self.members.clear()
+        self.guilds.clear()
+        self.messages.clear()
+
+    def store_user(self, payload: discord_typings.UserData) -> User:
+        """Caches a user from its payload, see :meth:`add_user`."""
+        return self.add_user(User.from_data(self.bot, payload, retain_raw=self.config.retain_raw))
+
+    def add_user(self, user: User) -> User:
+        """Caches a user and returns the instance members should reference.
+
+        There is one :class:`.User` per ID as long as anything references it, even if the users store evicted
+        it or is disabled. Changes are applied to that object in place, so every cached member of the user
+        sees them.
+        """
+        if (shared := self._shared_users.get(user.id)) is None:
+            self._shared_users[user.id] = shared = user
+        elif shared != user:
+            for field in attrs.fields(User):
+                setattr(shared, field.name, getattr(user, field.name))
+        self.users.set(shared.id, shared)
+        return shared
+
+    def add_member(self, member: GuildMember) -> GuildMember:
+        """Caches a guild member, pointing it to the shared instance of its user."""
+        member.user = self.add_user(member.user)
+        self.members.set((member.guild_id, member.id), member)
+        return member
+
+    def store_member(self, guild_id: Snowflake, payload: discord_typings.GuildMemberData) -> None:
+        """Caches a guild member along with its user."""
+        user = self.store_user(payload["user"])  # type: ignore
+        if self.config.members.enabled:
+            self.members.set(
+                (guild_id, user.id),
+                GuildMember.from_payload(self.bot, guild_id, payload, user=user, retain_raw=self.config.retain_raw),
+            )
+
+    def _on_ready(self, payload: dict[str, typing.Any]) -> None:
+        self.store_user(payload["user"])
+
+    def _on_guild_create(self, payload: dict[str, typing.Any]) -> None:
+        guild_id = Snowflake(payload["id"])
+        if self.config.guilds.enabled:
+            guild = {k: v for k, v in payload.items() if k not in ("members", "presences")}
+            self.guilds.set(guild_id, guild)  # type: ignore
+        for member in payload.get("members", ()):
+            self.store_member(guild_id, member)
+
+    def _on_guild_update(self, payload: dict[str, typing.Any]) -> None:
+        guild_id = Snowflake(payload["id"])
+        self.guilds.set(guild_id, {**(self.guilds.get(guild_id) or {}), **payload})  # type: ignore
+
+    def _on_guild_delete(self, payload: dict[str, typing.Any]) -> None:
+        guild_id = Snowflake(payload["id"])
+        self.guilds.delete(guild_id)
+        # Unavailable guilds come back with a GUILD_CREATE holding fresh members.
+        self.members.delete_group(guild_id)
+
+    def _on_guild_member_add(self, payload: dict[str, typing.Any]) -> None:
+        self.store_member(Snowflake(payload["guild_id"]), payload)  # type: ignore
+
+    def _on_guild_member_update(self, payload: dict[str, typing.Any]) -> None:
+        guild_id = Snowflake(payload["guild_id"])
+        # Updates leave out some fields, they are taken from the cached member when there is one.
+        if (cached := self.members.get((guild_id, Snowflake(payload["user"]["id"])))) is not None:
+            payload = {"deaf": cached.deaf, "mute": cached.mute, **payload}
+            payload["joined_at"] = payload.get("joined_at") or cached.joined_at.isoformat()
+        elif payload.get("joined_at") is None:
+            self.store_user(payload["user"])
+            return
+        self.store_member(guild_id, payload)  # type: ignore
+
+    def _on_guild_member_remove(self, payload: dict[str, typing.Any]) -> None:
+        self.members.delete((Snowflake(payload["guild_id"]), Snowflake(payload["user"]["id"])))
+
+    def _on_message_create(self, payload: dict[str, typing.Any]) -> None:
+        self.messages.set(Snowflake(payload["id"]), payload)  # type: ignore
+        if (member := payload.get("member")) is not None and (guild_id := payload.get("guild_id")) is not None:
+            self.store_member(Snowflake(guild_id), {**member, "user": payload["author"]})
+        elif "webhook_id" not in payload:
+            self.store_user(payload["author"])
+
+    def _on_message_update(self, payload: dict[str, typing.Any]) -> None:
+        message_id = Snowflake(payload["id"])
+        if (cached := self.messages.get(message_id)) is not None:
+            self.messages.set(message_id, {**cached, **payload})  # type: ignore
+
+    def _on_message_delete(self, payload: dict[str, typing.Any]) -> None:
+        self.messages.delete(Snowflake(payload["id"]))
+
+
+_UPDATERS: dict[str, typing.Callable[[Cache, dict[str, typing.Any]], None]] = {
+    "READY": Cache._on_ready,
+    "GUILD_CREATE": Cache._on_guild_create,
+    "GUILD_UPDATE": Cache._on_guild_update,
+    "GUILD_DELETE": Cache._on_guild_delete,
+    "GUILD_MEMBER_ADD": Cache._on_guild_member_add,
+    "GUILD_MEMBER_UPDATE": Cache._on_guild_member_update,
+    "GUILD_MEMBER_REMOVE": Cache._on_guild_member_remove,
+    "MESSAGE_CREATE": Cache._on_message_create,
+    "MESSAGE_UPDATE": Cache._on_message_update,
+    "MESSAGE_DELETE": Cache._on_message_delete,
+}
+
+_UPDATED_STORES: dict[str, tuple[str, ...]] = {
+    "READY": ("users",),
+    "GUILD_CREATE": ("guilds", "members", "users"),
+    "GUILD_UPDATE": ("guilds",),
+    "GUILD_DELETE": ("guilds", "members"),
+    "GUILD_MEMBER_ADD": ("members", "users"),
+    "GUILD_MEMBER_UPDATE": ("members", "users"),
+    "GUILD_MEMBER_REMOVE": ("members",),
+    "MESSAGE_CREATE": ("messages", "members", "users"),
+    "MESSAGE_UPDATE": ("messages",),
+    "MESSAGE_DELETE": ("messages",),
+}
@@ -0,0 +1,228 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import multiprocessing
+import time
+import typing
+
+import aiohttp
+import attrs
+
+from wyvern.internals.gateway import GatewayCloseError
+from wyvern.logger import main_logger
+
+if typing.TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.synchronize import Lock
+
+    from wyvern.api.bot import GatewayBot
+
+__all__: tuple[str, ...] = ("BotFactory", "ProcessIdentifyGate", "Cluster", "shard_ranges")
+
+BotFactory = typing.Callable[..., "GatewayBot"]
+"""Callable building a :class:`.GatewayBot` from the ``shard_ids`` and ``shard_count`` keyword arguments."""
+
+_FATAL_EXIT_CODE = 78
+# Exit code of workers which can't succeed by restarting, like with an invalid token or disallowed intents.
+
+
+def shard_ranges(shard_count: int, workers: int) -> list[range]:
+    """Splits the shards in contiguous ranges, one per worker.
+
+    Parameters
+    ----------
+    shard_count: int
+        Total number of shards.
+    workers: int
+        Number of worker processes, capped at ``shard_count``.
+
+    Returns
+    -------
+    list[range]
+        Shard IDs of every worker, sizes differ by at most one.
+    """
+    workers = max(1, min(workers, shard_count))
+    size, extra = divmod(shard_count, workers)
+    ranges: list[range] = []
+    start = 0
+    for index in range(workers):
+        stop = start + size + (index < extra)
+        ranges.append(range(start, stop))
+        start = stop
+    return ranges
+
+
+@attrs.define(kw_only=True)
+class ProcessIdentifyGate:
+    """:class:`.IdentifyGate` shared by the worker processes of a :class:`Cluster`.
+
+    The supervisor owns the lock and the per bucket timestamps, every IDENTIFY reserves the next
+    free slot of its bucket under the lock and sleeps outside of it.
+    """
+
+    max_concurrency: int
+    """Number of shards which may identify at the same time."""
+    lock: Lock
+    """Lock guarding the shared timestamps."""
+    next_identify: typing.MutableSequence[float]
+    """Wall clock time at which each bucket may identify next."""
+    interval: float = 5
+    """Seconds between two IDENTIFY payloads of one bucket."""
+
+    @classmethod
+    def create(cls, max_concurrency: int, *, context: BaseContext | None = None) -> ProcessIdentifyGate:
+        """Creates a gate which can be passed to worker processes of ``context``."""
+        context = context or multiprocessing.get_context()
+        return cls(
+            max_concurrency=max_concurrency,
+            lock=context.Lock(),
+            next_identify=context.Array("d", max_concurrency, lock=False),
+        )
+
+    async def acquire(self, shard_id: int) -> None:
+        bucket = shard_id % len(self.next_identify)
+        with self.lock:
+            now = time.time()
+            slot = max(now, self.next_identify[bucket])
+            self.next_identify[bucket] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _resolve_factory(factory: BotFactory | str) -> BotFactory:
+    if not isinstance(factory, str):
+        return factory
+    module, _, name = factory.partition(":")
+    if not name:
+        raise ValueError(f"bot factory must be given as 'module:callable', got {factory!r}.")
+    return getattr(importlib.import_module(module), name)
+
+
+async def _run_bot(factory: BotFactory, shard_ids: range, shard_count: int, gate: ProcessIdentifyGate) -> None:
+    bot = factory(shard_ids=shard_ids, shard_count=shard_count)
+    bot.shards.identify_gate = gate
+    async with bot:
+        await bot.start(raise_exception=True)
+
+
+def _worker_main(factory: BotFactory | str, shard_ids: range, shard_count: int, gate: ProcessIdentifyGate) -> None:
+    main_logger.info(f"Worker for shards {shard_ids.start}-{shard_ids.stop - 1} started.")
+    try:
+        asyncio.run(_run_bot(_resolve_factory(factory), shard_ids, shard_count, gate))
+    except GatewayCloseError:
+        raise SystemExit(_FATAL_EXIT_CODE)
+    except aiohttp.ClientResponseError as e:
+        if e.status != 401:
+            raise
+        raise SystemExit(_FATAL_EXIT_CODE)
+
+
+@attrs.define(kw_only=True)
+class Cluster:
+    """Runs the shards of a bot across several worker processes.
+
+    Every worker builds its own :class:`.GatewayBot` through ``factory`` and runs a contiguous range
+    of shards, IDENTIFY payloads of all workers are spaced out by one :class:`ProcessIdentifyGate`.
+    Workers exiting with a non zero code are restarted, unless they stopped because of an invalid token
+    or a fatal gateway close code such as disallowed intents.
+
+    Example
+    -------
+        .. highlight:: python
+        .. code-block:: python
+
+            # bot.py
+            import wyvern
+
+            def create_bot(**kwargs) -> wyvern.GatewayBot:
+                return wyvern.GatewayBot("BOT_TOKEN_HERE", **kwargs)
+
+        .. code-block:: console
+
+            $ python -m wyvern cluster bot:create_bot --workers 4
+    """
+
+    factory: BotFactory | str
+    """The bot factory, or its ``"module:callable"`` import path."""
+    workers: int = attrs.field(factory=multiprocessing.cpu_count)
+    """Number of worker processes."""
+    shard_count: int | None = None
+    """Total number of shards, ``None`` to use the count discord recommends."""
+    restart_delay: float = 5
+    """Seconds waited before restarting a crashed worker."""
+    context: BaseContext = attrs.field(factory=multiprocessing.get_context)
+    """The multiprocessing context workers are started with."""
+    processes: dict[range, BaseProcess] = attrs.field(init=False, factory=dict)
+    """Mapping of shard ranges to the worker running them."""
+
+    async def _fetch_gateway_info(self) -> tuple[int, int]:
+        bot = _resolve_factory(self.factory)()
+        async with bot:
+            info = await bot.rest.fetch_gateway_bot()
+        return self.shard_count or info["shards"], info["session_start_limit"]["max_concurrency"]
+
+    def _spawn(self, shard_ids: range, shard_count: int, gate: ProcessIdentifyGate) -> None:
+        process = self.context.Process(
+            target=_worker_main,
+            args=(self.factory, shard_ids, shard_count, gate),
+            name=f"wyvern-shards-{shard_ids.start}-{shard_ids.stop - 1}",
+        )
+        process.start()
+        self.processes[shard_ids] = process
+
+    def run(self) -> None:
+        """Starts the workers and supervises them until all of them exited cleanly."""
+        shard_count, max_concurrency = asyncio.run(self._fetch_gateway_info())
+        gate = ProcessIdentifyGate.create(max_concurrency, context=self.context)
+        ranges = shard_ranges(shard_count, self.workers)
+        main_logger.info(f"Starting {len(ranges)} workers for {shard_count} shards.")
+        for shard_ids in ranges:
+            self._spawn(shard_ids, shard_count, gate)
+        restarts: dict[range, float] = {}
+        try:
+            while self.processes:
+                for shard_ids, process in list(self.processes.items()):
+                    if process.is_alive():
+                        continue
+                    if process.exitcode == 0:
+                        del self.processes[shard_ids]
+                    elif process.exitcode == _FATAL_EXIT_CODE:
+                        main_logger.critical(f"{process.name} stopped on a fatal error, not restarting it.")
+                        del self.processes[shard_ids]
+                    elif (restart_at := restarts.get(shard_ids)) is None:
+                        main_logger.error(f"{process.name} exited with code {process.exitcode}, restarting.")
+                        restarts[shard_ids] = time.monotonic() + self.restart_delay
+                    elif restart_at <= time.monotonic():
+                        del restarts[shard_ids]
+                        self._spawn(shard_ids, shard_count, gate)
+                time.sleep(0.5)
+        finally:
+            for process in self.processes.values():
+                if process.is_alive():
+                    process.terminate()
+            for process in self.processes.values():
+                process.join()
@@ -0,0 +1,89 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import collections
+import time
+import typing
+
+import attrs
+
+if typing.TYPE_CHECKING:
+    from wyvern.events.base import Event
+
+__all__: tuple[str, ...] = ("Cooldown",)
+
+
+@attrs.define(kw_only=True)
+class Cooldown:
+    """Limits how often a listener is triggered, per key or for all events.
+
+    Example
+    -------
+        .. highlight:: python
+        .. code-block:: python
+
+            @bot.listener(wyvern.MessageCreateEvent, cooldown=wyvern.Cooldown(rate=5, per=10, key="channel_id"))
+            async def on_message(event: wyvern.MessageCreateEvent) -> None:
+                ...
+    """
+
+    rate: int
+    """Number of events allowed in every ``per`` seconds."""
+    per: float
+    """Length of the window in seconds."""
+    key: str | typing.Callable[[Event], typing.Hashable] | None = None
+    """Attribute name or callable giving the key events are limited by, ``None`` to share one limit."""
+    max_keys: int = 10_000
+    """Maximum number of keys tracked, the least recently used ones are forgotten first."""
+    _buckets: collections.OrderedDict[typing.Hashable, tuple[float, float]] = attrs.field(
+        init=False, factory=collections.OrderedDict
+    )
+
+    def try_acquire(self, event: Event) -> bool:
+        """Takes a token from the event's bucket.
+
+        Returns
+        -------
+        bool
+            False if the event is on cooldown.
+        """
+        if self.key is None:
+            key = None
+        elif isinstance(self.key, str):
+            key = getattr(event, self.key, None)
+        else:
+            key = self.key(event)
+        now = time.monotonic()
+        if (bucket := self._buckets.get(key)) is None:
+            tokens = float(self.rate)
+            if len(self._buckets) >= self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            tokens = min(float(self.rate), bucket[0] + (now - bucket[1]) * self.rate / self.per)
+            self._buckets.move_to_end(key)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return False
+        self._buckets[key] = (tokens - 1, now)
+        return True
@@ -23,12 +23,20 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import functools
+import inspect
 import typing
 
 import attrs
 
 from wyvern import types
+from wyvern.api.cooldowns import Cooldown
+from wyvern.api.event_scheduler import EventScheduler, OverflowPolicy
+from wyvern.api.waiters import FutureWaiter, StreamWaiter, Waiter, WaiterIndex
 from wyvern.events.base import Event
+from wyvern.events.gateway_events import DISPATCH_EVENTS
+from wyvern.logger import main_logger
 from wyvern.utils.consts import UNDEFINED, Undefined
 
 if typing.TYPE_CHECKING:
@@ -36,8 +44,14 @@ if typing.TYPE_CHECKING:
 
 __all__: tuple[str, ...] = ("EventListener", "EventHandler", "listener")
 
+EventT = typing.TypeVar("EventT", bound=Event)
+Middleware = typing.Callable[
+    [typing.Any, typing.Callable[[typing.Any], typing.Awaitable[typing.Any]]], typing.Awaitable[typing.Any]
+]
+"""Coroutine function wrapping a listener callback, called with the event and the next callable of the chain."""
 
-@attrs.define(kw_only=True)
+
+@attrs.define(kw_only=True, eq=False)
 class EventListener:
     """Represents an event listener, the callback of this class gets triggered whenever the event
     this listener is bound to gets triggered."""
@@ -46,12 +60,119 @@ class EventListener:
     """Type of event this listener listens to."""
     max_trigger: int | Undefined = UNDEFINED
     """Maximum number of times this event can get triggered."""
+    max_concurrency: int | None = None
+    """Maximum number of callbacks of this listener running at the same time, ``None`` for no limit."""
+    partition: str | typing.Callable[[Event], typing.Hashable] | None = None
+    """Attribute name or callable giving the ordering key of an event, such as ``"channel_id"``.
+    Events with the same key are handled one after another in the order they were received."""
     callback: types.EventListenerCallbackT
-    """The callback for listener."""
+    """The callback for listener, a coroutine function or a plain function. Plain functions run inline in the
+    event loop, or in :attr:`executor` with :attr:`offload`."""
     bot: GatewayBot | Undefined = UNDEFINED
+    checks: typing.Sequence[typing.Callable[[typing.Any], bool]] = ()
+    """Synchronous predicates an event has to pass to trigger the listener."""
+    guild_ids: typing.Collection[int] | None = None
+    """Guilds the listener is triggered for, ``None`` for all. Events without a ``guild_id`` are rejected."""
+    channel_ids: typing.Collection[int] | None = None
+    """Channels the listener is triggered for, ``None`` for all. Events without a ``channel_id`` are rejected."""
+    cooldown: Cooldown | None = None
+    """Cooldown applied to events which passed all other filters."""
+    middleware: typing.Sequence[Middleware] = ()
+    """Middleware wrapping the callback, the first one is the outermost."""
+    offload: bool = False
+    """Run a synchronous callback in :attr:`executor` instead of inline in the event loop, for blocking
+    or CPU heavy callbacks."""
+    executor: concurrent.futures.Executor | None = None
+    """Executor offloaded callbacks run in, ``None`` for the event loop's default thread pool."""
+    prepare: typing.Callable[[typing.Any], tuple[typing.Any, ...]] | None = None
+    """Converts the event into the arguments an offloaded callback is called with. Needed with a
+    :class:`~concurrent.futures.ProcessPoolExecutor`, since events hold the bot and can't be pickled."""
+    triggers: int = attrs.field(init=False, default=0)
+    """Number of events this listener was dispatched."""
+    removed: bool = attrs.field(init=False, default=False)
+    """True once the listener was removed from its handler."""
+    accepts: typing.Callable[[Event], bool] | None = attrs.field(init=False, default=None)
+    """All filters compiled into one predicate, ``None`` if the listener has no filters."""
+    inline: bool = attrs.field(init=False, default=False)
+    """True if the callback is synchronous and called right away on dispatch, without a task."""
+    _invoke: typing.Callable[[Event], typing.Any] = attrs.field(init=False, default=None)
+
+    def __attrs_post_init__(self) -> None:
+        self.compile()
 
     def __call__(self, event: Event) -> typing.Any:
-        return self.callback(event)
+        return self._invoke(event)
+
+    def compile(self) -> None:
+        """Flattens the filters into :attr:`accepts` and the middleware chain into a single callable.
+
+        Called by :meth:`EventHandler.add_listener`, filters changed afterwards only take effect
+        after calling this again.
+        """
+        predicates: list[typing.Callable[[Event], bool]] = []
+        if self.guild_ids is not None:
+            guild_ids = frozenset(self.guild_ids)
+            predicates.append(lambda event: getattr(event, "guild_id", None) in guild_ids)
+        if self.channel_ids is not None:
+            channel_ids = frozenset(self.channel_ids)
+            predicates.append(lambda event: getattr(event, "channel_id", None) in channel_ids)
+        predicates.extend(self.checks)
+        # The cooldown goes last so rejected events don't use up its tokens.
+        if self.cooldown is not None:
+            predicates.append(self.cooldown.try_acquire)
+        if not predicates:
+            self.accepts = None
+        elif len(predicates) == 1:
+            self.accepts = predicates[0]
+        else:
+            chain = tuple(predicates)
+
+            def accepts(event: Event) -> bool:
+                for predicate in chain:
+                    if not predicate(event):
+                        return False
+                return True
+
+            self.accepts = accepts
+
+        invoke: typing.Callable[[Event], typing.Any] = self.callback
+        is_sync = not inspect.iscoroutinefunction(self.callback)
+        if is_sync and self.offload:
+            invoke = functools.partial(_call_offloaded, self.callback, self.executor, self.prepare)
+        elif is_sync and self.middleware:
+            invoke = functools.partial(_call_sync, self.callback)
+        self.inline = is_sync and not self.offload and not self.middleware
+        for middleware in reversed(self.middleware):
+            invoke = functools.partial(_call_middleware, middleware, invoke)
+        self._invoke = invoke
+
+    def partition_key(self, event: Event) -> typing.Hashable | None:
+        """Returns the ordering key of an event, ``None`` if the event isn't ordered."""
+        if self.partition is None:
+            return None
+        if isinstance(self.partition, str):
+            return getattr(event, self.partition, None)
+        return self.partition(event)
+
+
+async def _call_offloaded(
+    callback: typing.Callable[..., typing.Any],
+    executor: concurrent.futures.Executor | None,
+    prepare: typing.Callable[[typing.Any], tuple[typing.Any, ...]] | None,
+    event: Event,
+) -> typing.Any:
+    arguments = prepare(event) if prepare is not None else (event,)
+    return await asyncio.get_event_loop().run_in_executor(executor, functools.partial(callback, *arguments))
+
+
+async def _call_sync(callback: typing.Callable[[Event], typing.Any], event: Event) -> typing.Any:
+    return callback(event)
+
+
+def _call_middleware(
+    middleware: Middleware, call_next: typing.Callable[[Event], typing.Any], event: Event
+) -> typing.Any:
+    return middleware(event, call_next)
 
 
 @attrs.define(kw_only=True)
@@ -61,8 +182,16 @@ class EventHandler:
     """
 
     bot: GatewayBot
-    listeners: dict[type[Event], list[EventListener]] = {}
-    """Mapping of :class:`.Event` types to list of :class:`EventListener` s listening to the event."""
+    scheduler: EventScheduler = attrs.field(factory=EventScheduler)
+    """The scheduler running the listener callbacks."""
+    listeners: dict[type[Event], dict[EventListener, None]] = attrs.field(factory=dict)
+    """Mapping of :class:`.Event` types to the :class:`EventListener` s listening to the event,
+    in insertion order."""
+    compact_threshold: int = 64
+    """Number of removed listeners after which the dispatch table is rebuilt."""
+    _dispatch_table: dict[type[Event], tuple[EventListener, ...]] = attrs.field(init=False, factory=dict)
+    _stale: int = attrs.field(init=False, default=0)
+    _waiters: dict[type[Event], WaiterIndex] = attrs.field(init=False, factory=dict)
 
     def add_listener(self, lsnr: EventListener) -> None:
         """Adds a listener to the container.
@@ -74,14 +203,304 @@ class EventHandler:
         """
         if lsnr.bot == UNDEFINED:
             lsnr.bot = self.bot
-        self.listeners.setdefault(lsnr.type, []).append(lsnr)
+        lsnr.removed = False
+        lsnr.compile()
+        self.listeners.setdefault(lsnr.type, {})[lsnr] = None
+        self._refresh_dispatch_table(lsnr.type)
+
+    def remove_listener(self, lsnr: EventListener) -> None:
+        """Removes a listener from the container.
+
+        Parameters
+        ----------
+        lsnr: EventListener
+            The listener to remove.
+
+        Raises
+        ------
+        ValueError
+            The listener isn't registered.
+        """
+        if lsnr.removed or lsnr not in self.listeners.get(lsnr.type, ()):
+            raise ValueError(f"{lsnr!r} is not registered.")
+        self._discard(lsnr)
+
+    def _discard(self, lsnr: EventListener) -> None:
+        # Removed listeners stay in the dispatch table and are skipped while dispatching, the
+        # table is only rebuilt once enough of them piled up.
+        lsnr.removed = True
+        listeners = self.listeners[lsnr.type]
+        del listeners[lsnr]
+        if not listeners:
+            del self.listeners[lsnr.type]
+            self._refresh_dispatch_table(lsnr.type)
+        elif (stale := self._stale + 1) >= self.compact_threshold:
+            self._dispatch_table.clear()
+            self._stale = 0
+        else:
+            self._stale = stale
+
+    def _claim(self, lsnr: EventListener, event: Event) -> bool:
+        # Counting happens when the event is dispatched, not when the callback runs, so a listener
+        # can't be scheduled more than max_trigger times however many callbacks are pending.
+        if lsnr.removed:
+            return False
+        if lsnr.accepts is not None:
+            try:
+                if not lsnr.accepts(event):
+                    return False
+            except Exception as e:
+                main_logger.error(f"Filter of {lsnr!r} raised an exception.", exc_info=e)
+                return False
+        lsnr.triggers += 1
+        if lsnr.max_trigger is not UNDEFINED and lsnr.triggers >= lsnr.max_trigger:  # type: ignore
+            self._discard(lsnr)
+        return True
+
+    def _resolve_listeners(self, event_type: type[Event]) -> tuple[EventListener, ...]:
+        return tuple(lsnr for base in event_type.__mro__ if base in self.listeners for lsnr in self.listeners[base])
+
+    def _refresh_dispatch_table(self, event_type: type[Event]) -> None:
+        # Only event types dispatched so far have an entry, the ones inheriting from the changed
+        # type are dropped and rebuilt on their next dispatch, all others are left untouched.
+        for cached_type in [cached_type for cached_type in self._dispatch_table if issubclass(cached_type, event_type)]:
+            del self._dispatch_table[cached_type]
+
+    def listeners_for(self, event_type: type[Event]) -> tuple[EventListener, ...]:
+        """Returns the listeners an event type is dispatched to.
+
+        Parameters
+        ----------
+        event_type: type[Event]
+            The event type.
+
+        Returns
+        -------
+        tuple[EventListener, ...]
+            Listeners of the type and of all its base classes, most specific type first.
+        """
+        try:
+            return self._dispatch_table[event_type]
+        except KeyError:
+            listeners = self._dispatch_table[event_type] = self._resolve_listeners(event_type)
+            return listeners
+
+    def wants(self, name: str) -> bool:
+        """Whether a gateway dispatch has to be decoded for the registered listeners.
+
+        Parameters
+        ----------
+        name: str
+            The dispatch name ( ``t`` field ).
+        """
+        return (event_type := DISPATCH_EVENTS.get(name)) is not None and (
+            any(not lsnr.removed for lsnr in self.listeners_for(event_type)) or self._has_waiters(event_type)
+        )
+
+    def _has_waiters(self, event_type: type[Event]) -> bool:
+        return bool(self._waiters) and any(base in self._waiters for base in event_type.__mro__)
+
+    def _add_waiter(self, waiter: Waiter) -> None:
+        if (index := self._waiters.get(waiter.type)) is None:
+            index = self._waiters[waiter.type] = WaiterIndex()
+        index.add(waiter)
+
+    def _remove_waiter(self, waiter: Waiter) -> None:
+        if waiter.removed:
+            return
+        waiter.removed = True
+        if isinstance(waiter, StreamWaiter):
+            waiter.close()
+        index = self._waiters[waiter.type]
+        index.remove(waiter)
+        if not index:
+            del self._waiters[waiter.type]
+
+    def _collect_waiters(self, event: Event) -> list[Waiter]:
+        matched: list[Waiter] = []
+        for base in type(event).__mro__:
+            if (index := self._waiters.get(base)) is not None:
+                index.collect(event, matched)
+        # Futures are resolved right away, so that no later event can match them again.
+        for waiter in matched:
+            if isinstance(waiter, FutureWaiter):
+                if not waiter.future.done():
+                    waiter.future.set_result(event)
+                self._remove_waiter(waiter)
+        return matched
+
+    async def wait_for(
+        self,
+        event_type: type[EventT],
+        *,
+        check: typing.Callable[[EventT], bool] | None = None,
+        timeout: float | None = None,
+        **attributes: typing.Hashable,
+    ) -> EventT:
+        """|coro|
+
+        Waits for the next event of a type.
+
+        Parameters
+        ----------
+        event_type: type[EventT]
+            Type of the event, events of its subclasses match as well.
+        check: typing.Callable[[EventT], bool] | None
+            Predicate the event has to pass.
+        timeout: float | None
+            Seconds to wait before giving up, ``None`` to wait forever.
+        **attributes: typing.Hashable
+            Attribute values the event has to match, such as ``channel_id=...``. Waiters are indexed by
+            the first one, so waiting on many different values costs nothing per event.
+
+        Returns
+        -------
+        EventT
+            The event.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            No matching event arrived within the timeout.
+        """
+        waiter = FutureWaiter(type=event_type, check=check, attributes=attributes)
+        self._add_waiter(waiter)
+        try:
+            return await asyncio.wait_for(waiter.future, timeout)
+        finally:
+            self._remove_waiter(waiter)
+
+    async def stream(
+        self,
+        event_type: type[EventT],
+        *,
+        check: typing.Callable[[EventT], bool] | None = None,
+        timeout: float | None = None,
+        limit: int | None = None,
+        max_size: int = 100,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        **attributes: typing.Hashable,
+    ) -> typing.AsyncIterator[EventT]:
+        """Iterates over the events of a type as they arrive.
+
+        Events are buffered from the first iteration on, until the iteration stops.
+
+        Parameters
+        ----------
+        event_type: type[EventT]
+            Type of the events, events of its subclasses match as well.
+        check: typing.Callable[[EventT], bool] | None
+            Predicate events have to pass.
+        timeout: float | None
+            Seconds without a matching event after which the iteration stops.
+        limit: int | None
+            Number of events after which the iteration stops.
+        max_size: int
+            Maximum number of buffered events.
+        overflow: OverflowPolicy
+            Policy applied when the buffer is full, :attr:`.OverflowPolicy.BLOCK` holds the gateway back
+            until the buffer is consumed.
+        **attributes: typing.Hashable
+            Attribute values events have to match, such as ``channel_id=...``.
+
+        Example
+        -------
+            .. highlight:: python
+            .. code-block:: python
+
+                async for event in bot.stream(wyvern.MessageCreateEvent, channel_id=channel_id, timeout=60):
+                    ...
+        """
+        waiter = StreamWaiter(type=event_type, check=check, attributes=attributes, max_size=max_size, overflow=overflow)
+        self._add_waiter(waiter)
+        try:
+            received = 0
+            while limit is None or received < limit:
+                try:
+                    item = await asyncio.wait_for(waiter.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                received += 1
+                yield item
+        finally:
+            self._remove_waiter(waiter)
+
+    async def dispatch_payload(self, shard_id: int, name: str, payload: dict[str, typing.Any]) -> None:
+        """|coro|
+
+        Dispatches a gateway DISPATCH payload as its event class.
+
+        The event is only built if a listener is registered for it, waits for room in the
+        scheduler's queue with the :attr:`.OverflowPolicy.BLOCK` policy.
+
+        Parameters
+        ----------
+        shard_id: int
+            ID of the shard that received the payload.
+        name: str
+            The dispatch name ( ``t`` field ).
+        payload: dict[str, typing.Any]
+            The event data ( ``d`` field ).
+        """
+        if (event_type := DISPATCH_EVENTS.get(name)) is None:
+            return
+        listeners = self.listeners_for(event_type)
+        if not listeners and not self._has_waiters(event_type):
+            return
+        event = event_type(bot=self.bot, shard_id=shard_id, payload=payload)
+        # Every listener is claimed before the first await, a concurrent dispatch can't trigger them
+        # past their limit while this one waits for room in the queue.
+        claimed = [lsnr for lsnr in listeners if self._claim(lsnr, event)]
+        if self._waiters:
+            for waiter in self._collect_waiters(event):
+                if isinstance(waiter, StreamWaiter):
+                    await waiter.put(event)
+        for lsnr in claimed:
+            if lsnr.inline:
+                self._run_inline(lsnr, event)
+            else:
+                await self.scheduler.submit(lsnr, event)
 
     def dispatch(self, event: Event) -> None:
-        asyncio.gather(*list(map(lambda elistener: elistener(event), self.listeners.get(type(event), []))))
+        """Schedules the callbacks of all listeners of an event.
+
+        Parameters
+        ----------
+        event: Event
+            The event to dispatch.
+        """
+        if self._waiters:
+            for waiter in self._collect_waiters(event):
+                if isinstance(waiter, StreamWaiter):
+                    waiter.offer(event)
+        for lsnr in self.listeners_for(type(event)):
+            if not self._claim(lsnr, event):
+                continue
+            if lsnr.inline:
+                self._run_inline(lsnr, event)
+            else:
+                self.scheduler.submit_nowait(lsnr, event)
+
+    def _run_inline(self, lsnr: EventListener, event: Event) -> None:
+        try:
+            result = lsnr(event)
+        except Exception as e:
+            self.scheduler.report_exception(lsnr, e)
+            return
+        # Plain functions returning an awaitable look synchronous, their result still has to run.
+        if inspect.isawaitable(result):
+            self.scheduler.adopt(lsnr, event, result)
 
 
 def listener(
-    event: type[Event], *, max_trigger: int | Undefined = UNDEFINED
+    event: type[Event],
+    *,
+    max_trigger: int | Undefined = UNDEFINED,
+    max_concurrency: int | None = None,
+    partition: str | typing.Callable[[Event], typing.Hashable] | None = None,
+    **kwargs: typing.Any,
 ) -> typing.Callable[[types.EventListenerCallbackT], EventListener]:
     """Used to create an :class:`EventListener`.
 
@@ -91,6 +510,13 @@ def listener(
         Class of the event this listener is bound to.
     max_trigger: int
         Maximum trigger limit of the event callback.
+    max_concurrency: int | None
+        Maximum number of callbacks running at the same time.
+    partition: str | typing.Callable[[Event], typing.Hashable] | None
+        Attribute name or callable giving the key events are ordered by.
+    **kwargs: typing.Any
+        Filters and middleware of the listener, such as ``checks``, ``guild_ids``, ``channel_ids``,
+        ``cooldown`` and ``middleware``.
 
     Returns
     -------
@@ -102,7 +528,10 @@ def listener(
         return EventListener(
             type=event,
             max_trigger=max_trigger,
+            max_concurrency=max_concurrency,
+            partition=partition,
             callback=callback,
+            **kwargs,
         )
 
     return decorator
@@ -0,0 +1,300 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import enum
+import heapq
+import itertools
+import typing
+
+import attrs
+
+from wyvern.logger import main_logger
+
+if typing.TYPE_CHECKING:
+    from wyvern.api.event_handler import EventListener
+    from wyvern.events.base import Event
+
+__all__: tuple[str, ...] = ("OverflowPolicy", "EventScheduler")
+
+_Item = typing.Tuple["EventListener", "Event", typing.Optional[typing.Tuple[int, typing.Hashable]], int]
+
+
+class OverflowPolicy(enum.Enum):
+    """What an :class:`EventScheduler` does with events submitted while its queue is full."""
+
+    DROP = enum.auto()
+    """The new event is dropped."""
+    SHED_OLDEST = enum.auto()
+    """The oldest queued event is dropped to make room for the new one."""
+    BLOCK = enum.auto()
+    """:meth:`EventScheduler.submit` waits until there is room, which stops the gateway from reading
+    further payloads. Events submitted without waiting are dropped."""
+
+
+@attrs.define(kw_only=True)
+class EventScheduler:
+    """Runs listener callbacks as tasks with bounded concurrency.
+
+    Callbacks beyond the concurrency limits wait in a bounded queue, in FIFO order per listener. Listeners
+    with waiting callbacks take turns, and a listener at its own :attr:`.EventListener.max_concurrency` limit
+    sits out until one of its callbacks finishes, so it doesn't hold back queued events of other listeners.
+
+    Events of a listener with a :attr:`.EventListener.partition` are sorted in lanes by their key,
+    a lane runs one callback at a time in submission order while different lanes run in parallel.
+    """
+
+    max_concurrency: int = 256
+    """Maximum number of callbacks running at the same time."""
+    max_queue_size: int = 10_000
+    """Maximum number of callbacks waiting to run."""
+    overflow: OverflowPolicy = OverflowPolicy.DROP
+    """Policy applied when the queue is full."""
+    pending: dict[EventListener, collections.deque[_Item]] = attrs.field(init=False, factory=dict)
+    """Callbacks waiting for a free slot, mapped by listener, oldest first."""
+    ready: collections.deque[EventListener] = attrs.field(init=False, factory=collections.deque)
+    """Listeners with pending callbacks that are below their concurrency limit, in the order they are served."""
+    lanes: dict[tuple[int, typing.Hashable], collections.deque[_Item]] = attrs.field(init=False, factory=dict)
+    """Active lanes mapped to the callbacks waiting for the current callback of the lane to finish."""
+    running: dict[asyncio.Future[typing.Any], _Item] = attrs.field(init=False, factory=dict)
+    """Running callback tasks."""
+    dropped: int = attrs.field(init=False, default=0)
+    """Number of events dropped because the queue was full."""
+    _active: dict[int, int] = attrs.field(init=False, factory=dict)
+    _ready: set[EventListener] = attrs.field(init=False, factory=set)
+    _waiting: int = attrs.field(init=False, default=0)
+    _backlog: int = attrs.field(init=False, default=0)
+    _sequence: typing.Iterator[int] = attrs.field(init=False, factory=itertools.count)
+    _lane_heads: list[tuple[int, tuple[int, typing.Hashable]]] = attrs.field(init=False, factory=list)
+    _space: asyncio.Event | None = attrs.field(init=False, default=None)
+    _overflowing: bool = attrs.field(init=False, default=False)
+
+    def submit_nowait(self, listener: EventListener, event: Event) -> bool:
+        """Schedules a listener callback, applying the overflow policy if the queue is full.
+
+        Parameters
+        ----------
+        listener: EventListener
+            The listener to call.
+        event: Event
+            The event to pass to the listener.
+
+        Returns
+        -------
+        bool
+            False if the event was dropped.
+        """
+        if self.queued >= self.max_queue_size:
+            if not self._overflowing:
+                self._overflowing = True
+                main_logger.warning(f"Event queue is full, applying the {self.overflow.name} overflow policy.")
+            self.dropped += 1
+            if self.overflow is not OverflowPolicy.SHED_OLDEST or self.queued == 0:
+                return False
+            self._shed_oldest()
+        item: _Item = (listener, event, None, next(self._sequence))
+        if (key := listener.partition_key(event)) is not None:
+            item = (listener, event, lane := (id(listener), key), item[3])
+            if (backlog := self.lanes.get(lane)) is not None:
+                backlog.append(item)
+                self._backlog += 1
+                if len(backlog) == 1:
+                    self._push_lane_head(lane)
+                return True
+            self.lanes[lane] = collections.deque()
+        self._enqueue(item)
+        self._pump()
+        return True
+
+    @property
+    def queued(self) -> int:
+        """Number of callbacks waiting to run."""
+        return self._waiting + self._backlog
+
+    async def submit(self, listener: EventListener, event: Event) -> bool:
+        """|coro|
+
+        Schedules a listener callback, waiting for room in the queue with the
+        :attr:`OverflowPolicy.BLOCK` policy.
+
+        Returns
+        -------
+        bool
+            False if the event was dropped.
+        """
+        while self.overflow is OverflowPolicy.BLOCK and self.queued >= self.max_queue_size:
+            if self._space is None:
+                self._space = asyncio.Event()
+            self._space.clear()
+            await self._space.wait()
+        return self.submit_nowait(listener, event)
+
+    def _enqueue(self, item: _Item, *, first: bool = False) -> None:
+        listener = item[0]
+        if (pending := self.pending.get(listener)) is None:
+            pending = self.pending[listener] = collections.deque()
+        if first:
+            pending.appendleft(item)
+        else:
+            pending.append(item)
+        self._waiting += 1
+        self._mark_ready(listener, first=first)
+
+    def _mark_ready(self, listener: EventListener, *, first: bool = False) -> None:
+        if listener in self._ready or listener not in self.pending:
+            return
+        if listener.max_concurrency is not None and self._active.get(id(listener), 0) >= listener.max_concurrency:
+            return
+        self._ready.add(listener)
+        if first:
+            self.ready.appendleft(listener)
+        else:
+            self.ready.append(listener)
+
+    def _dequeue(self, listener: EventListener) -> _Item:
+        pending = self.pending[listener]
+        item = pending.popleft()
+        self._waiting -= 1
+        if not pending:
+            del self.pending[listener]
+        return item
+
+    def _push_lane_head(self, lane: tuple[int, typing.Hashable]) -> None:
+        # Heap of the oldest backlogged callback of every lane, entries of lanes whose head changed since are
+        # skipped when they surface, and the heap is rebuilt once they make up most of it.
+        if backlog := self.lanes.get(lane):
+            heapq.heappush(self._lane_heads, (backlog[0][3], lane))
+        if len(self._lane_heads) > 2 * len(self.lanes) + 64:
+            self._lane_heads = [(backlog[0][3], lane) for lane, backlog in self.lanes.items() if backlog]
+            heapq.heapify(self._lane_heads)
+
+    def _oldest_lane_head(self) -> tuple[int, tuple[int, typing.Hashable]] | None:
+        heads = self._lane_heads
+        while heads:
+            sequence, lane = heads[0]
+            if (backlog := self.lanes.get(lane)) and backlog[0][3] == sequence:
+                return heads[0]
+            heapq.heappop(heads)
+        return None
+
+    def _shed_oldest(self) -> None:
+        # Only the heads of the per listener queues need to be compared, there are few listeners.
+        listener = min(self.pending, key=lambda lsnr: self.pending[lsnr][0][3], default=None)
+        head = self._oldest_lane_head()
+        if head is not None and (listener is None or head[0] < self.pending[listener][0][3]):
+            heapq.heappop(self._lane_heads)
+            self.lanes[head[1]].popleft()
+            self._backlog -= 1
+            self._push_lane_head(head[1])
+            return
+        assert listener is not None
+        item = self._dequeue(listener)
+        if listener not in self.pending and listener in self._ready:
+            self._ready.remove(listener)
+            self.ready.remove(listener)
+        self._advance_lane(item)
+
+    def _pump(self) -> None:
+        while self.ready and len(self.running) < self.max_concurrency:
+            listener = self.ready.popleft()
+            self._ready.remove(listener)
+            self._start(self._dequeue(listener))
+            # Back of the line, so listeners with many queued events don't starve the others.
+            self._mark_ready(listener)
+        if self.queued < self.max_queue_size:
+            self._overflowing = False
+            if self._space is not None:
+                self._space.set()
+
+    def _advance_lane(self, item: _Item) -> None:
+        # Moves the next callback of a finished lane callback to the front of the queue,
+        # it already waited its turn behind the finished one.
+        if (lane := item[2]) is None:
+            return
+        if backlog := self.lanes[lane]:
+            self._backlog -= 1
+            self._enqueue(backlog.popleft(), first=True)
+            self._push_lane_head(lane)
+        else:
+            del self.lanes[lane]
+
+    def _start(self, item: _Item) -> None:
+        listener, event, _, _ = item
+        try:
+            task = asyncio.ensure_future(listener(event))
+        except Exception as e:
+            self.report_exception(listener, e)
+            self._advance_lane(item)
+            return
+        self._track(task, item)
+
+    def adopt(self, listener: EventListener, event: Event, awaitable: typing.Awaitable[typing.Any]) -> None:
+        """Runs an awaitable a listener callback already returned, bypassing the queue.
+
+        Parameters
+        ----------
+        listener: EventListener
+            The listener that returned the awaitable.
+        event: Event
+            The event the listener was called with.
+        awaitable: typing.Awaitable[typing.Any]
+            The awaitable to run.
+        """
+        self._track(asyncio.ensure_future(awaitable), (listener, event, None, -1))
+
+    def _track(self, task: asyncio.Future[typing.Any], item: _Item) -> None:
+        listener = item[0]
+        self.running[task] = item
+        self._active[id(listener)] = self._active.get(id(listener), 0) + 1
+        task.add_done_callback(self._finish)
+
+    def _finish(self, task: asyncio.Future[typing.Any]) -> None:
+        item = self.running.pop(task)
+        listener = item[0]
+        if (active := self._active[id(listener)] - 1) == 0:
+            del self._active[id(listener)]
+        else:
+            self._active[id(listener)] = active
+        if not task.cancelled() and (exception := task.exception()) is not None:
+            self.report_exception(listener, exception)
+        self._advance_lane(item)
+        self._mark_ready(listener)
+        self._pump()
+
+    def report_exception(self, listener: EventListener, exception: BaseException) -> None:
+        """Logs an exception raised by a listener callback."""
+        name = getattr(listener.callback, "__qualname__", repr(listener.callback))
+        main_logger.error(
+            f"Listener {name} for {listener.type.__name__} raised an exception.",
+            exc_info=(type(exception), exception, exception.__traceback__),
+        )
+
+    async def join(self) -> None:
+        """|coro|
+
+        Waits until the queue is empty and no callback is running.
+        """
+        while self.running:
+            await asyncio.wait(list(self.running))
@@ -26,6 +26,7 @@ import typing
 
 from wyvern import builders, models, types
 from wyvern.internals.rest import Endpoints, RequestRoute, RESTClient
+from wyvern.models.members import GuildMember
 from wyvern.utils.consts import NULL, Null
 
 if typing.TYPE_CHECKING:
@@ -37,7 +38,7 @@ __all__: tuple[str, ...] = ("RESTClientImpl",)
 class RESTClientImpl(RESTClient):
     """Class handling operations related to REST/HTTP requests to the discord API.
     An instance of this class is binded with the :class:`.GatewayBot` instance."""
-    
+
     async def fetch_current_user(self) -> models.BotUser:
         """|coro|
 
@@ -49,7 +50,78 @@ class RESTClientImpl(RESTClient):
             The bot user.
         """
         data: discord_typings.UserData = await self.request(RequestRoute(Endpoints.get_current_user()))
-        return models.BotUser.from_partial(self.bot, models.PartialUser.from_payload(data))
+        return models.BotUser.from_data(self.bot, data)
+
+    async def fetch_user(self, user_id: types.Snowflakish[models.User]) -> models.User:
+        """|coro|
+
+        Gets a user by their ID.
+
+        Parameters
+        ----------
+        user_id: Snowflakish[User]
+            ID of the user.
+
+        Returns
+        -------
+        User
+            The user.
+        """
+        data: discord_typings.UserData = await self.request(
+            RequestRoute(Endpoints.get_user(user_id if isinstance(user_id, int) else user_id.id))
+        )
+        return models.User.from_data(self.bot, data)
+
+    async def fetch_member(self, guild_id: int, user_id: types.Snowflakish[models.User]) -> GuildMember:
+        """|coro|
+
+        Gets a member of a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+            ID of the guild.
+        user_id: Snowflakish[User]
+            ID of the member.
+
+        Returns
+        -------
+        GuildMember
+            The member.
+        """
+        data: discord_typings.GuildMemberData = await self.request(
+            RequestRoute(Endpoints.get_guild_member(guild_id, user_id if isinstance(user_id, int) else user_id.id))
+        )
+        return GuildMember.from_payload(self.bot, guild_id, data)
+
+    async def fetch_guild(self, guild_id: int) -> discord_typings.GuildData:
+        """|coro|
+
+        Gets a guild by its ID.
+
+        Parameters
+        ----------
+        guild_id: int
+            ID of the guild.
+
+        Returns
+        -------
+        discord_typings.GuildData
+            The raw guild data.
+        """
+        return await self.request(RequestRoute(Endpoints.get_guild(guild_id)))
+
+    async def fetch_gateway_bot(self) -> discord_typings.GetGatewayBotData:
+        """|coro|
+
+        Gets the gateway URL along with the recommended shard count and session start limits.
+
+        Returns
+        -------
+        discord_typings.GetGatewayBotData
+            The raw gateway information.
+        """
+        return await self.request(RequestRoute(Endpoints.get_gateway_bot(), cache=False))
 
     async def create_message(
         self,
@@ -81,7 +153,6 @@ class RESTClientImpl(RESTClient):
         await self.request(
             RequestRoute(
                 Endpoints.create_message(channel_id if isinstance(channel_id, int) else channel_id.id),
-                type="POST",
                 json=data,
             ),
         )
@@ -0,0 +1,164 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+import attrs
+
+from wyvern.api.gateway import GatewayImpl
+from wyvern.events import lib_events
+from wyvern.internals.gateway import ShardStatus
+from wyvern.internals.heartbeat import HeartbeatScheduler
+from wyvern.logger import main_logger
+
+if typing.TYPE_CHECKING:
+    from wyvern.api.bot import GatewayBot
+
+__all__: tuple[str, ...] = ("ShardStatus", "IdentifyGate", "LocalIdentifyGate", "ShardManager")
+
+
+class IdentifyGate(typing.Protocol):
+    """Spaces out IDENTIFY payloads according to discord's ``max_concurrency``.
+
+    Shard ``i`` falls in the rate limit bucket ``i % max_concurrency``, and each bucket allows
+    one IDENTIFY every 5 seconds.
+    """
+
+    max_concurrency: int
+
+    async def acquire(self, shard_id: int) -> None:
+        """|coro|
+
+        Waits until the shard is allowed to identify.
+        """
+        ...
+
+
+@attrs.define(kw_only=True)
+class LocalIdentifyGate:
+    """:class:`IdentifyGate` for shards running in a single event loop."""
+
+    max_concurrency: int = 1
+    """Number of shards which may identify at the same time."""
+    interval: float = 5
+    """Seconds between two IDENTIFY payloads of one bucket."""
+    _locks: dict[int, asyncio.Lock] = attrs.field(init=False, factory=dict)
+    _last_identify: dict[int, float] = attrs.field(init=False, factory=dict)
+
+    async def acquire(self, shard_id: int) -> None:
+        bucket = shard_id % self.max_concurrency
+        if (lock := self._locks.get(bucket)) is None:
+            lock = self._locks[bucket] = asyncio.Lock()
+        async with lock:
+            if (delay := self._last_identify.get(bucket, -self.interval) + self.interval - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+            self._last_identify[bucket] = time.monotonic()
+
+
+@attrs.define(kw_only=True)
+class ShardManager:
+    """Runs the gateway shards of a :class:`.GatewayBot` in one event loop.
+
+    Every shard dispatches its events to the bot's shared :class:`.EventHandler`.
+    """
+
+    bot: GatewayBot
+    """The bot the shards belong to."""
+    shard_count: int | None = None
+    """Total number of shards, ``None`` to use the count discord recommends."""
+    shard_ids: typing.Sequence[int] | None = None
+    """IDs of the shards to run, ``None`` to run all of them."""
+    compress: bool = False
+    """Whether shards use ``zlib-stream`` transport compression."""
+    encoding: typing.Literal["json", "etf"] = "json"
+    """Payload encoding of the shards."""
+    identify_gate: IdentifyGate = attrs.field(factory=LocalIdentifyGate)
+    """Gate the shards wait on before identifying."""
+    heartbeat_scheduler: HeartbeatScheduler = attrs.field(factory=HeartbeatScheduler)
+    """Scheduler driving the heartbeats of every shard."""
+    shards: dict[int, GatewayImpl] = attrs.field(init=False, factory=dict)
+    """Mapping of shard IDs to the running shards."""
+
+    @property
+    def latencies(self) -> dict[int, float]:
+        """Mapping of shard IDs to their heartbeat latency in seconds."""
+        return {shard_id: shard.latency for shard_id, shard in self.shards.items()}
+
+    @property
+    def statuses(self) -> dict[int, ShardStatus]:
+        """Mapping of shard IDs to their connection status."""
+        return {shard_id: shard.status for shard_id, shard in self.shards.items()}
+
+    def shard_for_guild(self, guild_id: int) -> GatewayImpl | None:
+        """Returns the shard receiving events of a guild, if it is run by this manager."""
+        if not self.shards:
+            return None
+        return self.shards.get((guild_id >> 22) % next(iter(self.shards.values())).shard_count)
+
+    async def start(self) -> None:
+        """|coro|
+
+        Fetches the recommended shard count and ``max_concurrency``, then connects every shard.
+        Returns once all shards have disconnected.
+        """
+        self.bot.event_handler.dispatch(lib_events.StartingEvent(bot=self.bot))
+        user = await self.bot.rest.fetch_current_user()
+        info = await self.bot.rest.fetch_gateway_bot()
+        shard_count = self.shard_count or info["shards"]
+        shard_ids = list(self.shard_ids) if self.shard_ids is not None else list(range(shard_count))
+        self.identify_gate.max_concurrency = info["session_start_limit"]["max_concurrency"]
+        if (remaining := info["session_start_limit"]["remaining"]) < len(shard_ids):
+            main_logger.warning(
+                f"Only {remaining} session starts are left for the day, {len(shard_ids)} shards are starting."
+            )
+        main_logger.info(f"Starting shards {shard_ids} of {shard_count}.")
+        for shard_id in shard_ids:
+            self.shards[shard_id] = GatewayImpl(
+                self.bot,
+                shard_id=shard_id,
+                shard_count=shard_count,
+                compress=self.compress,
+                encoding=self.encoding,
+                identify_gate=self.identify_gate,
+                heartbeat_scheduler=self.heartbeat_scheduler,
+            )
+        tasks = [asyncio.ensure_future(shard.connect()) for shard in self.shards.values()]
+        hello = [asyncio.ensure_future(shard.hello_received.wait()) for shard in self.shards.values()]
+        try:
+            await asyncio.wait([*tasks, *hello], return_when=asyncio.FIRST_COMPLETED)
+            if any(waiter.done() for waiter in hello):
+                self.bot.event_handler.dispatch(lib_events.StartedEvent(bot=self.bot, user=user))
+            await asyncio.gather(*tasks)
+        finally:
+            for task in (*tasks, *hello):
+                task.cancel()
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the connection of every shard.
+        """
+        await asyncio.gather(*(shard.close() for shard in self.shards.values()))
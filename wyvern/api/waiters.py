@@ -0,0 +1,183 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import typing
+
+import attrs
+
+from wyvern.api.event_scheduler import OverflowPolicy
+
+if typing.TYPE_CHECKING:
+    from wyvern.events.base import Event
+
+__all__: tuple[str, ...] = ("Waiter", "FutureWaiter", "StreamWaiter", "WaiterIndex")
+
+
+@attrs.define(kw_only=True, eq=False)
+class Waiter(abc.ABC):
+    """Base of the one off and streaming waiters of an :class:`.EventHandler`."""
+
+    type: type[Event]
+    """Type of event waited for."""
+    check: typing.Callable[[typing.Any], bool] | None = None
+    """Predicate events have to pass."""
+    attributes: dict[str, typing.Hashable] = attrs.field(factory=dict)
+    """Attribute values events have to match, the first one is used to index the waiter."""
+    removed: bool = attrs.field(init=False, default=False)
+
+    @property
+    def key(self) -> tuple[str, typing.Hashable] | None:
+        """The attribute and value the waiter is indexed by."""
+        return next(iter(self.attributes.items()), None)
+
+    def matches(self, event: Event) -> bool:
+        for name, value in self.attributes.items():
+            if getattr(event, name, None) != value:
+                return False
+        return self.check is None or self.check(event)
+
+    @abc.abstractmethod
+    def fail(self, exception: BaseException) -> None:
+        """Hands an exception to the waiting coroutine, for example one raised by :attr:`check`.
+
+        Parameters
+        ----------
+        exception: BaseException
+            The exception to raise in the waiting coroutine.
+        """
+
+
+@attrs.define(kw_only=True, eq=False)
+class FutureWaiter(Waiter):
+    """Waiter resolved by the first matching event."""
+
+    future: asyncio.Future[typing.Any] = attrs.field(factory=lambda: asyncio.get_event_loop().create_future())
+
+    def fail(self, exception: BaseException) -> None:
+        if not self.future.done():
+            self.future.set_exception(exception)
+
+
+@attrs.define(kw_only=True, eq=False)
+class StreamWaiter(Waiter):
+    """Waiter buffering every matching event until it is consumed."""
+
+    max_size: int = 100
+    """Maximum number of buffered events."""
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    """Policy applied when the buffer is full."""
+    queue: asyncio.Queue[typing.Any] = attrs.field(
+        init=False, default=attrs.Factory(lambda self: asyncio.Queue(self.max_size), takes_self=True)  # type: ignore
+    )
+    dropped: int = attrs.field(init=False, default=0)
+    """Number of events dropped because the buffer was full."""
+
+    def offer(self, event: Event) -> bool:
+        """Buffers an event without waiting, returns False if it was dropped."""
+        if self.queue.full():
+            self.dropped += 1
+            if self.overflow is not OverflowPolicy.SHED_OLDEST:
+                return False
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+        return True
+
+    async def put(self, event: Event) -> bool:
+        """|coro|
+
+        Buffers an event, waiting for room with the :attr:`.OverflowPolicy.BLOCK` policy.
+        """
+        if self.overflow is OverflowPolicy.BLOCK:
+            await self.queue.put(event)
+            return True
+        return self.offer(event)
+
+    def close(self) -> None:
+        """Empties the buffer, releasing dispatches blocked on it."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def fail(self, exception: BaseException) -> None:
+        # The consumer raises the exception once it reaches it in the buffer.
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(exception)
+
+
+@attrs.define
+class WaiterIndex:
+    """Waiters of one event type, indexed by the attribute value they wait for."""
+
+    unkeyed: dict[Waiter, None] = attrs.field(factory=dict)
+    """Waiters without attributes to match."""
+    keyed: dict[tuple[str, typing.Hashable], dict[Waiter, None]] = attrs.field(factory=dict)
+    """Waiters mapped by their indexed attribute and value."""
+    key_names: dict[str, int] = attrs.field(factory=dict)
+    """Number of waiters indexed by each attribute."""
+
+    def __bool__(self) -> bool:
+        return bool(self.unkeyed or self.keyed)
+
+    def add(self, waiter: Waiter) -> None:
+        if (key := waiter.key) is None:
+            self.unkeyed[waiter] = None
+            return
+        self.keyed.setdefault(key, {})[waiter] = None
+        self.key_names[key[0]] = self.key_names.get(key[0], 0) + 1
+
+    def remove(self, waiter: Waiter) -> None:
+        if (key := waiter.key) is None:
+            self.unkeyed.pop(waiter, None)
+            return
+        if (waiters := self.keyed.get(key)) is None or waiter not in waiters:
+            return
+        del waiters[waiter]
+        if not waiters:
+            del self.keyed[key]
+        if (count := self.key_names[key[0]] - 1) == 0:
+            del self.key_names[key[0]]
+        else:
+            self.key_names[key[0]] = count
+
+    def collect(self, event: Event, matched: list[Waiter]) -> None:
+        """Appends the waiters matching an event to ``matched``."""
+        for waiter in self.unkeyed:
+            self._match(waiter, event, matched)
+        for name in self.key_names:
+            try:
+                waiters = self.keyed.get((name, getattr(event, name, None)))
+            except TypeError:
+                continue
+            for waiter in waiters or ():
+                self._match(waiter, event, matched)
+
+    @staticmethod
+    def _match(waiter: Waiter, event: Event, matched: list[Waiter]) -> None:
+        try:
+            if waiter.matches(event):
+                matched.append(waiter)
+        except Exception as e:
+            waiter.fail(e)
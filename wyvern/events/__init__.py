@@ -21,4 +21,5 @@
 # SOFTWARE.
 
 from .base import *
+from .gateway_events import *
 from .lib_events import *
@@ -0,0 +1,348 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import datetime
+import typing
+
+import attrs
+
+from wyvern.events.base import Event
+from wyvern.models.members import GuildMember
+from wyvern.models.snowflake import Snowflake
+from wyvern.models.users import User
+from wyvern.utils.lazy import lazy_property
+
+__all__: tuple[str, ...] = (
+    "GatewayEvent",
+    "ReadyEvent",
+    "ResumedEvent",
+    "GuildCreateEvent",
+    "GuildUpdateEvent",
+    "GuildDeleteEvent",
+    "GuildMemberAddEvent",
+    "GuildMemberUpdateEvent",
+    "GuildMemberRemoveEvent",
+    "MessageCreateEvent",
+    "MessageUpdateEvent",
+    "MessageDeleteEvent",
+    "TypingStartEvent",
+    "PresenceUpdateEvent",
+    "DISPATCH_EVENTS",
+)
+
+
+@attrs.define(kw_only=True)
+class GatewayEvent(Event):
+    """Base class of the events dispatched by discord through the gateway.
+
+    Models are built from :attr:`payload` on first access of the matching attribute, so
+    listeners only pay for the fields they use.
+    """
+
+    name: typing.ClassVar[str]
+    """Dispatch name ( ``t`` field ) of the event."""
+
+    shard_id: int
+    """ID of the shard that received the event."""
+    payload: dict[str, typing.Any]
+    """The raw event data ( ``d`` field )."""
+    _lazy_cache: dict[str, typing.Any] = attrs.field(init=False, factory=dict, repr=False, eq=False)
+
+
+class _GuildEventMixin:
+    __slots__ = ()
+
+    payload: dict[str, typing.Any]
+
+    @property
+    def guild_id(self) -> Snowflake | None:
+        """ID of the guild the event happened in, ``None`` outside of guilds."""
+        return Snowflake(guild_id) if (guild_id := self.payload.get("guild_id")) is not None else None
+
+
+@attrs.define(kw_only=True)
+class ReadyEvent(GatewayEvent):
+    """Dispatched when a shard identified and its session is ready."""
+
+    name = "READY"
+
+    @property
+    def session_id(self) -> str:
+        """ID of the new session."""
+        return self.payload["session_id"]
+
+    @lazy_property
+    def user(self) -> User:
+        """The bot user."""
+        return User.from_data(self.bot, self.payload["user"])
+
+    @lazy_property
+    def guild_ids(self) -> list[Snowflake]:
+        """IDs of the guilds the shard is in, their data follows as :class:`GuildCreateEvent` s."""
+        return [Snowflake(guild["id"]) for guild in self.payload["guilds"]]
+
+
+@attrs.define(kw_only=True)
+class ResumedEvent(GatewayEvent):
+    """Dispatched when a shard resumed its previous session."""
+
+    name = "RESUMED"
+
+
+@attrs.define(kw_only=True)
+class GuildCreateEvent(GatewayEvent):
+    """Dispatched when a guild becomes available or the bot joins a guild."""
+
+    name = "GUILD_CREATE"
+
+    @property
+    def guild_id(self) -> Snowflake:
+        """ID of the guild."""
+        return Snowflake(self.payload["id"])
+
+    @lazy_property
+    def members(self) -> list[GuildMember]:
+        """Members of the guild sent along with the guild."""
+        guild_id = self.guild_id
+        return [GuildMember.from_payload(self.bot, guild_id, member) for member in self.payload.get("members", ())]
+
+
+@attrs.define(kw_only=True)
+class GuildUpdateEvent(GatewayEvent):
+    """Dispatched when a guild is updated."""
+
+    name = "GUILD_UPDATE"
+
+    @property
+    def guild_id(self) -> Snowflake:
+        """ID of the guild."""
+        return Snowflake(self.payload["id"])
+
+
+@attrs.define(kw_only=True)
+class GuildDeleteEvent(GatewayEvent):
+    """Dispatched when a guild becomes unavailable or the bot is removed from it."""
+
+    name = "GUILD_DELETE"
+
+    @property
+    def guild_id(self) -> Snowflake:
+        """ID of the guild."""
+        return Snowflake(self.payload["id"])
+
+    @property
+    def unavailable(self) -> bool:
+        """True if the guild went down because of an outage, False if the bot was removed from it."""
+        return self.payload.get("unavailable", False)
+
+
+@attrs.define(kw_only=True)
+class GuildMemberAddEvent(GatewayEvent):
+    """Dispatched when a user joins a guild. Requires the ``GUILD_MEMBERS`` intent."""
+
+    name = "GUILD_MEMBER_ADD"
+
+    @property
+    def guild_id(self) -> Snowflake:
+        """ID of the guild the member joined."""
+        return Snowflake(self.payload["guild_id"])
+
+    @lazy_property
+    def member(self) -> GuildMember:
+        """The member that joined."""
+        return GuildMember.from_payload(self.bot, self.guild_id, self.payload)  # type: ignore
+
+
+@attrs.define(kw_only=True)
+class GuildMemberUpdateEvent(GatewayEvent):
+    """Dispatched when a member is updated. Requires the ``GUILD_MEMBERS`` intent."""
+
+    name = "GUILD_MEMBER_UPDATE"
+
+    @property
+    def guild_id(self) -> Snowflake:
+        """ID of the member's guild."""
+        return Snowflake(self.payload["guild_id"])
+
+    @lazy_property
+    def user(self) -> User:
+        """The updated user."""
+        return User.from_data(self.bot, self.payload["user"])
+
+
+@attrs.define(kw_only=True)
+class GuildMemberRemoveEvent(GatewayEvent):
+    """Dispatched when a user leaves or is removed from a guild. Requires the ``GUILD_MEMBERS`` intent."""
+
+    name = "GUILD_MEMBER_REMOVE"
+
+    @property
+    def guild_id(self) -> Snowflake:
+        """ID of the guild the member left."""
+        return Snowflake(self.payload["guild_id"])
+
+    @lazy_property
+    def user(self) -> User:
+        """The user that left."""
+        return User.from_data(self.bot, self.payload["user"])
+
+
+@attrs.define(kw_only=True)
+class MessageCreateEvent(_GuildEventMixin, GatewayEvent):
+    """Dispatched when a message is sent."""
+
+    name = "MESSAGE_CREATE"
+
+    @property
+    def message_id(self) -> Snowflake:
+        """ID of the message."""
+        return Snowflake(self.payload["id"])
+
+    @property
+    def channel_id(self) -> Snowflake:
+        """ID of the channel the message was sent in."""
+        return Snowflake(self.payload["channel_id"])
+
+    @property
+    def content(self) -> str:
+        """Content of the message, empty without the ``MESSAGE_CONTENT`` intent."""
+        return self.payload.get("content", "")
+
+    @lazy_property
+    def author(self) -> User:
+        """Author of the message."""
+        return User.from_data(self.bot, self.payload["author"])
+
+    @lazy_property
+    def member(self) -> GuildMember | None:
+        """Member object of the author, ``None`` outside of guilds or for webhook messages."""
+        if (member := self.payload.get("member")) is None or (guild_id := self.guild_id) is None:
+            return None
+        return GuildMember.from_payload(self.bot, guild_id, {**member, "user": self.payload["author"]})
+
+
+@attrs.define(kw_only=True)
+class MessageUpdateEvent(_GuildEventMixin, GatewayEvent):
+    """Dispatched when a message is edited, the payload only holds the changed fields."""
+
+    name = "MESSAGE_UPDATE"
+
+    @property
+    def message_id(self) -> Snowflake:
+        """ID of the message."""
+        return Snowflake(self.payload["id"])
+
+    @property
+    def channel_id(self) -> Snowflake:
+        """ID of the channel the message is in."""
+        return Snowflake(self.payload["channel_id"])
+
+
+@attrs.define(kw_only=True)
+class MessageDeleteEvent(_GuildEventMixin, GatewayEvent):
+    """Dispatched when a message is deleted."""
+
+    name = "MESSAGE_DELETE"
+
+    @property
+    def message_id(self) -> Snowflake:
+        """ID of the deleted message."""
+        return Snowflake(self.payload["id"])
+
+    @property
+    def channel_id(self) -> Snowflake:
+        """ID of the channel the message was in."""
+        return Snowflake(self.payload["channel_id"])
+
+
+@attrs.define(kw_only=True)
+class TypingStartEvent(_GuildEventMixin, GatewayEvent):
+    """Dispatched when a user starts typing in a channel."""
+
+    name = "TYPING_START"
+
+    @property
+    def channel_id(self) -> Snowflake:
+        """ID of the channel."""
+        return Snowflake(self.payload["channel_id"])
+
+    @property
+    def user_id(self) -> Snowflake:
+        """ID of the user typing."""
+        return Snowflake(self.payload["user_id"])
+
+    @lazy_property
+    def timestamp(self) -> datetime.datetime:
+        """When the user started typing."""
+        return datetime.datetime.fromtimestamp(self.payload["timestamp"], tz=datetime.timezone.utc)
+
+    @lazy_property
+    def member(self) -> GuildMember | None:
+        """Member object of the user, ``None`` outside of guilds."""
+        if (member := self.payload.get("member")) is None or (guild_id := self.guild_id) is None:
+            return None
+        return GuildMember.from_payload(self.bot, guild_id, member)
+
+
+@attrs.define(kw_only=True)
+class PresenceUpdateEvent(_GuildEventMixin, GatewayEvent):
+    """Dispatched when a user's presence is updated. Requires the ``GUILD_PRESENCES`` intent."""
+
+    name = "PRESENCE_UPDATE"
+
+    @property
+    def user_id(self) -> Snowflake:
+        """ID of the user."""
+        return Snowflake(self.payload["user"]["id"])
+
+    @property
+    def status(self) -> str:
+        """The new status, either ``idle``, ``dnd``, ``online`` or ``offline``."""
+        return self.payload["status"]
+
+    @property
+    def activities(self) -> list[dict[str, typing.Any]]:
+        """Raw activities of the user."""
+        return self.payload.get("activities", [])
+
+
+DISPATCH_EVENTS: dict[str, type[GatewayEvent]] = {
+    event.name: event
+    for event in (
+        ReadyEvent,
+        ResumedEvent,
+        GuildCreateEvent,
+        GuildUpdateEvent,
+        GuildDeleteEvent,
+        GuildMemberAddEvent,
+        GuildMemberUpdateEvent,
+        GuildMemberRemoveEvent,
+        MessageCreateEvent,
+        MessageUpdateEvent,
+        MessageDeleteEvent,
+        TypingStartEvent,
+        PresenceUpdateEvent,
+    )
+}
+"""Mapping of dispatch names to the event class they are dispatched as."""
@@ -0,0 +1,119 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import json
+import typing
+
+import attrs
+
+__all__: tuple[str, ...] = ("JSONCodec", "STDLIB_CODEC", "get_codec")
+
+
+@attrs.define(frozen=True)
+class JSONCodec:
+    """A set of JSON encoding and decoding functions used by the gateway and REST paths."""
+
+    name: str
+    """Name of the module backing this codec."""
+    loads: typing.Callable[[str | bytes], typing.Any]
+    """Decodes a JSON document from either :class:`str` or :class:`bytes`."""
+    dumps: typing.Callable[[typing.Any], bytes]
+    """Encodes an object straight to UTF-8 :class:`bytes`."""
+    dumps_str: typing.Callable[[typing.Any], str]
+    """Encodes an object to :class:`str`, used for text websocket frames."""
+
+
+def _compact_json_dumps(obj: typing.Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+STDLIB_CODEC = JSONCodec(
+    name="json",
+    loads=json.loads,
+    dumps=lambda obj: _compact_json_dumps(obj).encode(),
+    dumps_str=_compact_json_dumps,
+)
+"""Codec backed by the standard library :mod:`json` module."""
+
+
+def _make_orjson_codec() -> JSONCodec:
+    import orjson  # type: ignore
+
+    return JSONCodec(
+        name="orjson",
+        loads=orjson.loads,  # type: ignore
+        dumps=orjson.dumps,  # type: ignore
+        dumps_str=lambda obj: orjson.dumps(obj).decode(),  # type: ignore
+    )
+
+
+def _make_ujson_codec() -> JSONCodec:
+    import ujson  # type: ignore
+
+    return JSONCodec(
+        name="ujson",
+        loads=ujson.loads,  # type: ignore
+        dumps=lambda obj: ujson.dumps(obj, ensure_ascii=False).encode(),  # type: ignore
+        dumps_str=lambda obj: ujson.dumps(obj, ensure_ascii=False),  # type: ignore
+    )
+
+
+_FACTORIES: dict[str, typing.Callable[[], JSONCodec]] = {
+    "orjson": _make_orjson_codec,
+    "ujson": _make_ujson_codec,
+    "json": lambda: STDLIB_CODEC,
+}
+
+
+def get_codec(name: str | None = None) -> JSONCodec:
+    """Returns a JSON codec.
+
+    Parameters
+    ----------
+    name: str | None
+        One of ``"orjson"``, ``"ujson"`` or ``"json"``. If not provided, the fastest installed
+        module is picked, falling back to the standard library.
+
+    Returns
+    -------
+    JSONCodec
+        The codec.
+
+    Raises
+    ------
+    ValueError
+        An unknown codec name was passed.
+    ImportError
+        The requested module is not installed.
+    """
+    if name is not None:
+        if (factory := _FACTORIES.get(name)) is None:
+            raise ValueError(f"unknown JSON codec {name!r}, expected one of {', '.join(_FACTORIES)}.")
+        return factory()
+    for factory in _FACTORIES.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return STDLIB_CODEC
@@ -0,0 +1,109 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import inspect
+import typing
+
+import aiohttp
+import attrs
+
+__all__: tuple[str, ...] = ("ConnectorConfig", "SharedSession")
+
+
+@attrs.define(kw_only=True, frozen=True)
+class ConnectorConfig:
+    """Settings of the connection pool used for REST requests and gateway connections.
+
+    The defaults are tuned for a high volume of requests to a single host, discord.com.
+    """
+
+    limit: int = 0
+    """Maximum number of open connections, ``0`` for no limit."""
+    limit_per_host: int = 64
+    """Maximum number of open connections to a single host."""
+    keepalive_timeout: float = 60
+    """Seconds an idle connection is kept open for reuse."""
+    use_dns_cache: bool = True
+    """Whether resolved hosts are cached."""
+    ttl_dns_cache: int | None = 300
+    """Seconds a resolved host stays cached, ``None`` to cache forever."""
+    happy_eyeballs_delay: float | None = 0.25
+    """Seconds to wait on a connection attempt before racing the next address (RFC 8305), ``None`` to disable.
+    Ignored on aiohttp versions which don't support it."""
+    connect_timeout: float | None = 10
+    """Seconds to wait for a connection to be established."""
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        kwargs: dict[str, typing.Any] = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "use_dns_cache": self.use_dns_cache,
+            "ttl_dns_cache": self.ttl_dns_cache,
+        }
+        if "happy_eyeballs_delay" in inspect.signature(aiohttp.TCPConnector).parameters:
+            kwargs["happy_eyeballs_delay"] = self.happy_eyeballs_delay
+        return aiohttp.TCPConnector(**kwargs)
+
+    def create_session(self) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
+            connector=self.create_connector(), timeout=aiohttp.ClientTimeout(total=None, connect=self.connect_timeout)
+        )
+
+
+@attrs.define(kw_only=True)
+class SharedSession:
+    """A client session shared by several :class:`.GatewayBot` instances in one process,
+    so they all draw from a single connection pool.
+
+    The session is opened by the first bot entering its context manager and closed when the last one exits.
+
+    Example
+    -------
+
+    .. highlight:: python
+    .. code-block:: python
+
+        session = wyvern.internals.connection.SharedSession()
+        bots = [wyvern.GatewayBot(token, session=session) for token in tokens]
+    """
+
+    config: ConnectorConfig = attrs.field(factory=ConnectorConfig)
+    """Settings of the shared connection pool."""
+    session: aiohttp.ClientSession | None = attrs.field(init=False, default=None)
+    """The session, if it is open."""
+    users: int = attrs.field(init=False, default=0)
+    """Number of bots currently using the session."""
+
+    def acquire(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = self.config.create_session()
+        self.users += 1
+        return self.session
+
+    async def release(self) -> None:
+        self.users -= 1
+        if self.users <= 0 and self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -0,0 +1,260 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pure python implementation of the subset of Erlang's external term format used by the discord gateway."""
+
+from __future__ import annotations
+
+import struct
+import typing
+import zlib
+
+__all__: tuple[str, ...] = ("ETFDecodeError", "loads", "dumps")
+
+FORMAT_VERSION = 131
+
+NEW_FLOAT_EXT = 70
+COMPRESSED = 80
+SMALL_INTEGER_EXT = 97
+INTEGER_EXT = 98
+FLOAT_EXT = 99
+ATOM_EXT = 100
+SMALL_TUPLE_EXT = 104
+LARGE_TUPLE_EXT = 105
+NIL_EXT = 106
+STRING_EXT = 107
+LIST_EXT = 108
+BINARY_EXT = 109
+SMALL_BIG_EXT = 110
+LARGE_BIG_EXT = 111
+SMALL_ATOM_EXT = 115
+MAP_EXT = 116
+ATOM_UTF8_EXT = 118
+SMALL_ATOM_UTF8_EXT = 119
+
+_ATOMS: dict[str, typing.Any] = {"nil": None, "null": None, "true": True, "false": False}
+
+_unpack_u16 = struct.Struct(">H").unpack_from
+_unpack_u32 = struct.Struct(">I").unpack_from
+_unpack_i32 = struct.Struct(">i").unpack_from
+_unpack_f64 = struct.Struct(">d").unpack_from
+_pack_u16 = struct.Struct(">H").pack
+_pack_u32 = struct.Struct(">I").pack
+_pack_i32 = struct.Struct(">i").pack
+_pack_f64 = struct.Struct(">d").pack
+
+
+class ETFDecodeError(ValueError):
+    """Raised when a payload is not a valid external term format document."""
+
+
+def _atom(name: str) -> typing.Any:
+    return _ATOMS.get(name, name)
+
+
+def _decode(view: memoryview, offset: int) -> tuple[typing.Any, int]:
+    # Tags are checked roughly in the order they show up in gateway payloads.
+    tag = view[offset]
+    offset += 1
+    if tag == BINARY_EXT:
+        (size,) = _unpack_u32(view, offset)
+        offset += 4
+        return str(view[offset : offset + size], "utf-8"), offset + size
+    if tag == MAP_EXT:
+        (arity,) = _unpack_u32(view, offset)
+        offset += 4
+        mapping: dict[typing.Any, typing.Any] = {}
+        for _ in range(arity):
+            key, offset = _decode(view, offset)
+            mapping[key], offset = _decode(view, offset)
+        return mapping, offset
+    if tag == SMALL_INTEGER_EXT:
+        return view[offset], offset + 1
+    if tag == SMALL_ATOM_UTF8_EXT or tag == SMALL_ATOM_EXT:
+        size = view[offset]
+        offset += 1
+        return _atom(str(view[offset : offset + size], "utf-8")), offset + size
+    if tag == ATOM_EXT or tag == ATOM_UTF8_EXT:
+        (size,) = _unpack_u16(view, offset)
+        offset += 2
+        return _atom(str(view[offset : offset + size], "utf-8")), offset + size
+    if tag == SMALL_BIG_EXT or tag == LARGE_BIG_EXT:
+        if tag == SMALL_BIG_EXT:
+            size = view[offset]
+            offset += 1
+        else:
+            (size,) = _unpack_u32(view, offset)
+            offset += 4
+        sign = view[offset]
+        offset += 1
+        value = int.from_bytes(view[offset : offset + size], "little")
+        return (-value if sign else value), offset + size
+    if tag == LIST_EXT:
+        (length,) = _unpack_u32(view, offset)
+        offset += 4
+        items: list[typing.Any] = []
+        append = items.append
+        for _ in range(length):
+            item, offset = _decode(view, offset)
+            append(item)
+        # Proper lists end with a NIL_EXT tail.
+        if view[offset] == NIL_EXT:
+            return items, offset + 1
+        tail, offset = _decode(view, offset)
+        append(tail)
+        return items, offset
+    if tag == NIL_EXT:
+        return [], offset
+    if tag == INTEGER_EXT:
+        return _unpack_i32(view, offset)[0], offset + 4
+    if tag == NEW_FLOAT_EXT:
+        return _unpack_f64(view, offset)[0], offset + 8
+    if tag == STRING_EXT:
+        (size,) = _unpack_u16(view, offset)
+        offset += 2
+        return str(view[offset : offset + size], "latin-1"), offset + size
+    if tag == SMALL_TUPLE_EXT or tag == LARGE_TUPLE_EXT:
+        if tag == SMALL_TUPLE_EXT:
+            arity = view[offset]
+            offset += 1
+        else:
+            (arity,) = _unpack_u32(view, offset)
+            offset += 4
+        elements: list[typing.Any] = []
+        for _ in range(arity):
+            item, offset = _decode(view, offset)
+            elements.append(item)
+        return tuple(elements), offset
+    if tag == FLOAT_EXT:
+        return float(str(view[offset : offset + 31], "ascii").rstrip("\x00")), offset + 31
+    raise ETFDecodeError(f"unsupported term tag {tag} at offset {offset - 1}.")
+
+
+def loads(data: bytes | bytearray | memoryview) -> typing.Any:
+    """Decodes an external term format document.
+
+    Binaries are decoded to :class:`str` and the ``nil``, ``true`` and ``false`` atoms are mapped to
+    their python counterparts. Snowflakes are sent as integers by the gateway and are returned as-is.
+
+    Parameters
+    ----------
+    data: bytes | bytearray | memoryview
+        The payload to decode, it is read in place without being copied.
+
+    Returns
+    -------
+    typing.Any
+        The decoded term.
+
+    Raises
+    ------
+    ETFDecodeError
+        The payload is malformed or uses an unsupported term.
+    """
+    view = memoryview(data)
+    if not view or view[0] != FORMAT_VERSION:
+        raise ETFDecodeError("payload does not start with the external term format version byte.")
+    try:
+        if view[1] == COMPRESSED:
+            (size,) = _unpack_u32(view, 2)
+            inflated = memoryview(zlib.decompress(view[6:], bufsize=size))
+            return _decode(inflated, 0)[0]
+        return _decode(view, 1)[0]
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise ETFDecodeError("payload ended unexpectedly or contains invalid data.") from e
+
+
+def _encode(obj: typing.Any, buffer: bytearray) -> None:
+    if obj is None:
+        buffer += b"\x77\x03nil"
+    elif obj is True:
+        buffer += b"\x77\x04true"
+    elif obj is False:
+        buffer += b"\x77\x05false"
+    elif isinstance(obj, str):
+        encoded = obj.encode()
+        buffer.append(BINARY_EXT)
+        buffer += _pack_u32(len(encoded))
+        buffer += encoded
+    elif isinstance(obj, int):
+        if 0 <= obj <= 255:
+            buffer.append(SMALL_INTEGER_EXT)
+            buffer.append(obj)
+        elif -(2**31) <= obj < 2**31:
+            buffer.append(INTEGER_EXT)
+            buffer += _pack_i32(obj)
+        else:
+            magnitude = abs(obj)
+            size = (magnitude.bit_length() + 7) // 8
+            buffer.append(SMALL_BIG_EXT)
+            buffer.append(size)
+            buffer.append(1 if obj < 0 else 0)
+            buffer += magnitude.to_bytes(size, "little")
+    elif isinstance(obj, float):
+        buffer.append(NEW_FLOAT_EXT)
+        buffer += _pack_f64(obj)
+    elif isinstance(obj, dict):
+        mapping = typing.cast("dict[typing.Any, typing.Any]", obj)
+        buffer.append(MAP_EXT)
+        buffer += _pack_u32(len(mapping))
+        for key, value in mapping.items():
+            _encode(key, buffer)
+            _encode(value, buffer)
+    elif isinstance(obj, (list, tuple)):
+        items = typing.cast("typing.Sequence[typing.Any]", obj)
+        if not items:
+            buffer.append(NIL_EXT)
+            return
+        buffer.append(LIST_EXT)
+        buffer += _pack_u32(len(items))
+        for item in items:
+            _encode(item, buffer)
+        buffer.append(NIL_EXT)
+    elif isinstance(obj, (bytes, bytearray)):
+        buffer.append(BINARY_EXT)
+        buffer += _pack_u32(len(obj))
+        buffer += obj
+    else:
+        raise TypeError(f"object of type {type(obj).__name__} is not ETF serializable.")
+
+
+def dumps(obj: typing.Any) -> bytes:
+    """Encodes an object to the external term format.
+
+    Parameters
+    ----------
+    obj: typing.Any
+        The object to encode, strings are encoded as binaries and ``None`` as the ``nil`` atom.
+
+    Returns
+    -------
+    bytes
+        The encoded document.
+
+    Raises
+    ------
+    TypeError
+        The object contains a value that can't be encoded.
+    """
+    buffer = bytearray((FORMAT_VERSION,))
+    _encode(obj, buffer)
+    return bytes(buffer)
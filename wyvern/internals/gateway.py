@@ -24,17 +24,22 @@ from __future__ import annotations
 
 import asyncio
 import enum
-import json
+import random
+import re
 import sys
 import time
 import typing
+import zlib
 
 import aiohttp
 
-from wyvern.events import lib_events
+from wyvern.internals import etf
+from wyvern.internals.heartbeat import HeartbeatScheduler, LatencyHistogram
+from wyvern.logger import main_logger
 
 if typing.TYPE_CHECKING:
     from wyvern.api.bot import GatewayBot
+    from wyvern.api.sharding import IdentifyGate
 
 import attrs
 
@@ -53,36 +58,403 @@ class OPCode(enum.IntEnum):
     HEARTBEAT_ACK = 11
 
 
+class CloseCode(enum.IntEnum):
+    UNKNOWN_ERROR = 4000
+    UNKNOWN_OPCODE = 4001
+    DECODE_ERROR = 4002
+    NOT_AUTHENTICATED = 4003
+    AUTHENTICATION_FAILED = 4004
+    ALREADY_AUTHENTICATED = 4005
+    INVALID_SEQUENCE = 4007
+    RATE_LIMITED = 4008
+    SESSION_TIMED_OUT = 4009
+    INVALID_SHARD = 4010
+    SHARDING_REQUIRED = 4011
+    INVALID_API_VERSION = 4012
+    INVALID_INTENTS = 4013
+    DISALLOWED_INTENTS = 4014
+
+
+FATAL_CLOSE_CODES: frozenset[int] = frozenset(
+    (
+        CloseCode.AUTHENTICATION_FAILED,
+        CloseCode.INVALID_SHARD,
+        CloseCode.SHARDING_REQUIRED,
+        CloseCode.INVALID_API_VERSION,
+        CloseCode.INVALID_INTENTS,
+        CloseCode.DISALLOWED_INTENTS,
+    )
+)
+"""Close codes after which reconnecting can't succeed."""
+
+SESSION_ENDING_CLOSE_CODES: frozenset[int] = frozenset((CloseCode.INVALID_SEQUENCE, CloseCode.SESSION_TIMED_OUT))
+"""Close codes after which the session can't be resumed and a new one has to be identified."""
+
+
+class GatewayCloseError(Exception):
+    """Raised when discord closes the gateway connection with a code that doesn't allow reconnecting."""
+
+    def __init__(self, code: int) -> None:
+        self.code = code
+        """The websocket close code."""
+        super().__init__(f"Gateway closed with code {code} ({CloseCode(code).name}).")
+
+
+ZLIB_SUFFIX: bytes = b"\x00\x00\xff\xff"
+"""Trailing bytes of a ``Z_SYNC_FLUSH``, marking the end of a complete zlib-stream payload."""
+
+
+class ShardStatus(enum.Enum):
+    """Connection status of a shard."""
+
+    DISCONNECTED = enum.auto()
+    """The shard is not connected."""
+    CONNECTING = enum.auto()
+    """The websocket is being opened."""
+    IDENTIFYING = enum.auto()
+    """The shard is waiting for its turn to identify, or has identified and waits for READY."""
+    RESUMING = enum.auto()
+    """The shard is resuming its previous session."""
+    READY = enum.auto()
+    """The shard is receiving events."""
+
+
+INTERNAL_DISPATCHES: frozenset[str] = frozenset(("READY", "RESUMED"))
+"""Dispatches the gateway itself needs, these are always decoded."""
+
+_DISPATCH_HEAD_STR = re.compile(r'"t":\s*"([A-Z_]+)".*?"s":\s*(\d+)|"s":\s*(\d+).*?"t":\s*"([A-Z_]+)"')
+_DISPATCH_HEAD_BYTES = re.compile(_DISPATCH_HEAD_STR.pattern.encode())
+
+
+def peek_dispatch(data: str | bytes) -> tuple[str, int] | None:
+    """Reads the dispatch name and sequence number of a JSON payload without decoding it.
+
+    Only the part in front of the ``"d"`` key is scanned, both keys have to be found there
+    for the payload to be recognised.
+
+    Parameters
+    ----------
+    data: str | bytes
+        The raw JSON payload.
+
+    Returns
+    -------
+    tuple[str, int] | None
+        The ``t`` and ``s`` fields, or ``None`` if the payload has to be decoded to find them.
+    """
+    if isinstance(data, str):
+        if (end := data.find('"d":')) == -1 or (match := _DISPATCH_HEAD_STR.search(data, 0, end)) is None:
+            return None
+        name, sequence, sequence_first, name_last = match.groups()
+        return (name or name_last), int(sequence or sequence_first)
+    if (end := data.find(b'"d":')) == -1 or (match := _DISPATCH_HEAD_BYTES.search(data, 0, end)) is None:
+        return None
+    name, sequence, sequence_first, name_last = match.groups()
+    return (name or name_last).decode(), int(sequence or sequence_first)
+
+
 @attrs.define
 class Gateway:
     bot: GatewayBot
+    shard_id: int = attrs.field(default=0, kw_only=True)
+    """ID of the shard this connection is for."""
+    shard_count: int = attrs.field(default=1, kw_only=True)
+    """Total number of shards of the bot."""
+    identify_gate: IdentifyGate | None = attrs.field(default=None, kw_only=True)
+    """Gate waited on before identifying, to stagger shards according to ``max_concurrency``."""
+    compress: bool = attrs.field(default=False, kw_only=True)
+    """Whether the connection uses ``zlib-stream`` transport compression."""
+    encoding: typing.Literal["json", "etf"] = attrs.field(default="json", kw_only=True)
+    """Payload encoding of the connection, either ``json`` or ``etf``."""
     socket: aiohttp.ClientWebSocketResponse = attrs.field(init=False)
-    latency: float = attrs.field(init=False, default=float("NaN"))
+    heartbeat_scheduler: HeartbeatScheduler = attrs.field(factory=HeartbeatScheduler, kw_only=True)
+    """Scheduler sending the heartbeats, shared by all shards of a :class:`.ShardManager`."""
+    latencies: LatencyHistogram = attrs.field(init=False, factory=LatencyHistogram)
+    """Rolling window of heartbeat latencies."""
     heartbeat_interval: float = attrs.field(init=False, default=0)
-    sequence: int = attrs.field(init=False, default=0)
+    sequence: int | None = attrs.field(init=False, default=None)
+    """Sequence number of the last dispatch received, sent with heartbeats and resumes."""
+    session_id: str | None = attrs.field(init=False, default=None)
+    """ID of the current session, ``None`` if there is no session to resume."""
+    resume_gateway_url: str | None = attrs.field(init=False, default=None)
+    """Gateway URL to resume the current session on."""
     last_heartbeat: float = attrs.field(init=False, default=0)
+    awaiting_ack: bool = attrs.field(init=False, default=False)
+    """Whether the last heartbeat wasn't acknowledged yet."""
+    status: ShardStatus = attrs.field(init=False, default=ShardStatus.DISCONNECTED)
+    """Connection status of the shard."""
+    hello_received: asyncio.Event = attrs.field(init=False, factory=asyncio.Event)
+    """Set once the first HELLO of the shard arrived."""
+    max_reconnect_delay: float = attrs.field(default=60, kw_only=True)
+    """Upper bound of the backoff between failed connection attempts."""
+    _inflator: typing.Any = attrs.field(init=False, default=None)
+    _buffer: bytearray = attrs.field(init=False, factory=bytearray)
+    _closing: bool = attrs.field(init=False, default=False)
+    _reconnect_requested: bool = attrs.field(init=False, default=False)
+    _identify_task: asyncio.Task[None] | None = attrs.field(init=False, default=None)
+    _processing: bool = attrs.field(init=False, default=False)
+    _attempt: int = attrs.field(init=False, default=0)
+
+    @property
+    def latency(self) -> float:
+        """The latest heartbeat latency in seconds, ``NaN`` if no heartbeat was acknowledged yet."""
+        return self.latencies.last
+
+    def _make_url(self, base: str) -> str:
+        url = f"{base.rstrip('/')}/?v={self.bot.rest.api_version}&encoding={self.encoding}"
+        if self.compress is True:
+            url += "&compress=zlib-stream"
+        return url
+
+    @property
+    def url(self) -> str:
+        return self._make_url("wss://gateway.discord.gg")
+
+    @property
+    def can_resume(self) -> bool:
+        """Whether the next connection resumes the current session instead of identifying."""
+        return self.session_id is not None and self.sequence is not None
+
+    def reset_session(self) -> None:
+        """Forgets the current session, the next connection identifies anew."""
+        self.session_id = None
+        self.resume_gateway_url = None
+        self.sequence = None
 
     async def connect(self) -> None:
-        self.bot.event_handler.dispatch(lib_events.StartingEvent(bot=self.bot))
-        self.socket = await self.bot.rest.client_session.ws_connect(  # type: ignore
-            f"wss://gateway.discord.gg/?v={self.bot.rest.api_version}&encoding=json"
-        )
-        await self.listen_gateway()
+        """|coro|
+
+        Connects to the gateway and keeps the connection alive, resuming the session after a disconnect
+        whenever discord allows it. Returns once :meth:`close` is called.
+
+        Raises
+        ------
+        GatewayCloseError
+            Discord closed the connection with a code that doesn't allow reconnecting.
+        """
+        self._closing = False
+        self._attempt = 0
+        while not self._closing:
+            resuming = self.can_resume
+            self.status = ShardStatus.RESUMING if resuming else ShardStatus.CONNECTING
+            url = self._make_url(self.resume_gateway_url) if resuming and self.resume_gateway_url else self.url
+            # zlib-stream shares one compression context across the whole connection,
+            # so every new socket needs a fresh inflator.
+            self._inflator = zlib.decompressobj()
+            self._buffer.clear()
+            self._reconnect_requested = False
+            try:
+                self.socket = await self.bot.rest.client_session.ws_connect(url)  # type: ignore
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self.status = ShardStatus.DISCONNECTED
+                delay = self._next_delay()
+                main_logger.warning(f"Shard {self.shard_id} failed to connect ({e!r}), retrying in {delay:.1f}s.")
+                await asyncio.sleep(delay)
+                continue
+            error: BaseException | None = None
+            try:
+                await self.listen_gateway()
+            except (aiohttp.ClientError, ConnectionError, asyncio.TimeoutError) as e:
+                error = e
+            finally:
+                self._cancel_identify()
+                self._stop_heartbeat()
+                self.status = ShardStatus.DISCONNECTED
+            if error is None:
+                self._handle_close()
+            elif not self.socket.closed:
+                await self.socket.close(code=CloseCode.UNKNOWN_ERROR)
+            if self._closing:
+                break
+            # Every reconnect is spaced out, the backoff only resets once a connection reaches READY or RESUMED,
+            # so a server closing the socket right away doesn't turn into a reconnect loop.
+            delay = self._next_delay()
+            if error is not None:
+                reason = f"lost its connection ({error!r})"
+            else:
+                reason = f"disconnected with code {self.socket.close_code}"
+            main_logger.warning(
+                f"Shard {self.shard_id} {reason}, {'resuming' if self.can_resume else 'reconnecting'} in {delay:.1f}s."
+            )
+            await asyncio.sleep(delay)
+
+    def _next_delay(self) -> float:
+        delay = min(self.max_reconnect_delay, 2**self._attempt) * random.uniform(0.5, 1)
+        self._attempt += 1
+        return delay
+
+    def _handle_close(self) -> None:
+        if self._closing or self._reconnect_requested:
+            return
+        code = self.socket.close_code or 0
+        if code in FATAL_CLOSE_CODES:
+            raise GatewayCloseError(code)
+        if code in SESSION_ENDING_CLOSE_CODES:
+            self.reset_session()
+
+    async def reconnect(self) -> None:
+        """|coro|
+
+        Closes the socket without ending the session, :meth:`connect` then resumes on a new one.
+        """
+        self._reconnect_requested = True
+        # Any close code other than 1000 and 1001 keeps the session resumable.
+        await self.socket.close(code=CloseCode.UNKNOWN_ERROR)
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the connection and ends the session.
+        """
+        self._closing = True
+        self._cancel_identify()
+        self._stop_heartbeat()
+        if hasattr(self, "socket") and not self.socket.closed:
+            await self.socket.close()
+        self.reset_session()
+
+    def _stop_heartbeat(self) -> None:
+        self.heartbeat_scheduler.unregister(self)
+        self.awaiting_ack = False
+
+    def decompress(self, data: bytes) -> bytes | None:
+        """Feeds a binary frame to the connection's inflator.
+
+        Parameters
+        ----------
+        data: bytes
+            The raw websocket frame.
+
+        Returns
+        -------
+        bytes | None
+            The inflated payload, or ``None`` if the frame did not end with the ``Z_SYNC_FLUSH`` suffix
+            and more frames are needed.
+        """
+        if len(data) < 4 or data[-4:] != ZLIB_SUFFIX:
+            self._buffer.extend(data)
+            return None
+        if not self._buffer:
+            return self._inflator.decompress(data)
+        self._buffer.extend(data)
+        inflated: bytes = self._inflator.decompress(self._buffer)
+        self._buffer.clear()
+        return inflated
+
+    def decode(self, data: str | bytes) -> typing.Any:
+        if self.encoding == "etf":
+            return etf.loads(data)  # type: ignore
+        return self.bot.codec.loads(data)
 
     async def process_gw_event(self, payload: dict[str, typing.Any]) -> None:
         op = payload["op"]
-        if op == OPCode.HELLO:
-            await self.socket.send_json(self.identify_payload)
+        if op == OPCode.DISPATCH:
+            if (sequence := payload.get("s")) is not None:
+                self.sequence = sequence
+            if payload["t"] == "READY":
+                self.session_id = payload["d"]["session_id"]
+                self.resume_gateway_url = payload["d"].get("resume_gateway_url")
+                self.status = ShardStatus.READY
+                self._attempt = 0
+            elif payload["t"] == "RESUMED":
+                self.status = ShardStatus.READY
+                self._attempt = 0
+            # A dispatch that can't be processed must not take the connection down with it.
+            try:
+                self.bot.cache.update(payload["t"], payload["d"])
+            except Exception as e:
+                main_logger.error(f"Shard {self.shard_id} failed to cache a {payload['t']} dispatch.", exc_info=e)
+            try:
+                await self.bot.event_handler.dispatch_payload(self.shard_id, payload["t"], payload["d"])
+            except Exception as e:
+                main_logger.error(f"Shard {self.shard_id} failed to dispatch {payload['t']}.", exc_info=e)
+        elif op == OPCode.HELLO:
             self.heartbeat_interval = payload["d"]["heartbeat_interval"] / 1000
-            asyncio.get_event_loop().create_task(self.keep_alive())
-        if op == OPCode.HEARTBEAT_ACK:
-            self.latency = time.perf_counter() - self.last_heartbeat
+            self.hello_received.set()
+            self.awaiting_ack = False
+            self.heartbeat_scheduler.register(self, self.heartbeat_interval)
+            if self.can_resume:
+                await self.resume()
+            else:
+                self._start_identify()
+        elif op == OPCode.HEARTBEAT_ACK:
+            self.awaiting_ack = False
+            self.latencies.record(time.monotonic() - self.last_heartbeat)
+        elif op == OPCode.HEARTBEAT:
+            await self.send({"op": OPCode.HEARTBEAT, "d": self.sequence})
+        elif op == OPCode.RECONNECT:
+            await self.reconnect()
+        elif op == OPCode.INVALID_SESSION:
+            if payload["d"] is True and self.can_resume:
+                await self.reconnect()
+            else:
+                # Discord asks for a random wait of 1 to 5 seconds before identifying again.
+                self.reset_session()
+                self._start_identify(random.uniform(1, 5))
 
-    async def keep_alive(self) -> None:
-        while True:
-            await self.socket.send_json({"op": OPCode.HEARTBEAT, "d": self.sequence})
-            self.last_heartbeat = time.perf_counter()
-            await asyncio.sleep(self.heartbeat_interval)
+    async def send(self, payload: dict[str, typing.Any]) -> None:
+        if self.encoding == "etf":
+            await self.socket.send_bytes(etf.dumps(payload))
+        else:
+            await self.socket.send_str(self.bot.codec.dumps_str(payload))
+
+    async def heartbeat(self) -> None:
+        """|coro|
+
+        Sends a heartbeat, or reconnects if the previous one was never acknowledged since the
+        connection is then most likely dead without having been closed.
+        """
+        if self.awaiting_ack and not self._processing:
+            main_logger.warning(f"Shard {self.shard_id} missed a heartbeat ACK, reconnecting.")
+            self._stop_heartbeat()
+            await self.reconnect()
+            return
+        # While a frame is being processed, for example a dispatch held back by a full event queue, the ACK
+        # may be sitting unread behind it, so the connection isn't considered dead.
+        self.awaiting_ack = True
+        self.last_heartbeat = time.monotonic()
+        await self.send({"op": OPCode.HEARTBEAT, "d": self.sequence})
+
+    async def identify(self) -> None:
+        self.status = ShardStatus.IDENTIFYING
+        if self.identify_gate is not None:
+            await self.identify_gate.acquire(self.shard_id)
+        await self.send(self.identify_payload)
+
+    def _start_identify(self, delay: float = 0) -> None:
+        # Waiting for an identify slot can take longer than a heartbeat interval, it runs next to the read loop
+        # so heartbeat ACKs keep being processed in the meantime.
+        self._cancel_identify()
+        self._identify_task = asyncio.ensure_future(self._identify_after(delay))
+        self._identify_task.add_done_callback(self._identify_done)
+
+    async def _identify_after(self, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self.identify()
+
+    def _identify_done(self, task: asyncio.Task[None]) -> None:
+        if self._identify_task is task:
+            self._identify_task = None
+        if not task.cancelled() and (error := task.exception()) is not None:
+            # The read loop notices the closed socket and reconnects on its own.
+            main_logger.warning(f"Shard {self.shard_id} failed to identify: {error!r}")
+
+    def _cancel_identify(self) -> None:
+        if self._identify_task is not None:
+            self._identify_task.cancel()
+            self._identify_task = None
+
+    async def resume(self) -> None:
+        self.status = ShardStatus.RESUMING
+        await self.send(self.resume_payload)
+
+    @property
+    def resume_payload(self) -> dict[str, typing.Any]:
+        return {
+            "op": OPCode.RESUME,
+            "d": {"token": self.bot.rest.token, "session_id": self.session_id, "seq": self.sequence},
+        }
 
     @property
     def identify_payload(self) -> dict[str, typing.Any]:
@@ -91,6 +463,7 @@ class Gateway:
             "d": {
                 "token": self.bot.rest.token,
                 "intents": self.bot.intents.value,
+                "shard": [self.shard_id, self.shard_count],
                 "properties": {
                     "os": sys.platform,
                     "browser": "wyvern",
@@ -100,9 +473,28 @@ class Gateway:
         }
 
     async def listen_gateway(self) -> None:
-        user = await self.bot.rest.fetch_current_user()
-
         async for msg in self.socket:
-            if self.heartbeat_interval == 0:
-                self.bot.event_handler.dispatch(lib_events.StartedEvent(bot=self.bot, user=user))
-            await self.process_gw_event(json.loads(msg.data))  # type: ignore
+            if msg.type is aiohttp.WSMsgType.ERROR:
+                # aiohttp hands read errors over as messages instead of raising them.
+                raise ConnectionError(f"Gateway read failed: {msg.data!r}") from msg.data
+            if msg.type is not aiohttp.WSMsgType.TEXT and msg.type is not aiohttp.WSMsgType.BINARY:
+                continue
+            data: str | bytes | None = msg.data  # type: ignore
+            if self.compress is True and msg.type == aiohttp.WSMsgType.BINARY:
+                if (data := self.decompress(msg.data)) is None:  # type: ignore
+                    continue
+            if self.encoding == "json" and (head := peek_dispatch(data)) is not None:  # type: ignore
+                # Dispatches nobody listens to or caches only need their sequence number, skip decoding them.
+                name, sequence = head
+                if (
+                    name not in INTERNAL_DISPATCHES
+                    and not self.bot.event_handler.wants(name)
+                    and not self.bot.cache.wants(name)
+                ):
+                    self.sequence = sequence
+                    continue
+            self._processing = True
+            try:
+                await self.process_gw_event(self.decode(data))  # type: ignore
+            finally:
+                self._processing = False
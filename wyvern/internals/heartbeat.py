@@ -0,0 +1,191 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import collections
+import heapq
+import itertools
+import math
+import random
+import time
+import typing
+
+import attrs
+
+from wyvern.logger import main_logger
+
+__all__: tuple[str, ...] = ("Heartbeater", "LatencyHistogram", "HeartbeatScheduler")
+
+
+class Heartbeater(typing.Protocol):
+    """Connection driven by a :class:`HeartbeatScheduler`."""
+
+    async def heartbeat(self) -> None:
+        """|coro|
+
+        Sends a heartbeat, called once every heartbeat interval.
+        """
+        ...
+
+
+@attrs.define(kw_only=True)
+class LatencyHistogram:
+    """Rolling window of the latest heartbeat latencies."""
+
+    size: int = 64
+    """Number of samples kept."""
+    samples: collections.deque[float] = attrs.field(
+        init=False,
+        default=attrs.Factory(lambda self: collections.deque(maxlen=self.size), takes_self=True),  # type: ignore
+    )
+    """The latencies in seconds, oldest first."""
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def record(self, latency: float) -> None:
+        self.samples.append(latency)
+
+    @property
+    def last(self) -> float:
+        """The latest latency, ``NaN`` if none was recorded yet."""
+        return self.samples[-1] if self.samples else math.nan
+
+    @property
+    def mean(self) -> float:
+        """Mean latency of the window, ``NaN`` if none was recorded yet."""
+        return sum(self.samples) / len(self.samples) if self.samples else math.nan
+
+    def percentile(self, percent: float) -> float:
+        """Nearest rank percentile of the window, ``NaN`` if no latency was recorded yet.
+
+        Parameters
+        ----------
+        percent: float
+            The percentile, between 0 and 100.
+        """
+        if not self.samples:
+            return math.nan
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+    def buckets(self, bounds: typing.Sequence[float]) -> list[int]:
+        """Counts the samples falling in each bucket.
+
+        Parameters
+        ----------
+        bounds: typing.Sequence[float]
+            Sorted upper bounds of the buckets in seconds.
+
+        Returns
+        -------
+        list[int]
+            Count per bucket, with one extra bucket for samples above the last bound.
+        """
+        counts = [0] * (len(bounds) + 1)
+        for sample in self.samples:
+            counts[bisect.bisect_left(bounds, sample)] += 1
+        return counts
+
+
+@attrs.define(eq=False)
+class _Entry:
+    target: Heartbeater
+    interval: float
+    cancelled: bool = False
+
+
+@attrs.define(kw_only=True)
+class HeartbeatScheduler:
+    """Drives the heartbeats of any number of connections from a single task.
+
+    The first heartbeat of a connection is sent after a random share of its interval, as discord
+    requires, the following ones on fixed monotonic deadlines so the time spent sending doesn't
+    add up to drift.
+    """
+
+    _entries: dict[int, _Entry] = attrs.field(init=False, factory=dict)
+    _queue: list[tuple[float, int, _Entry]] = attrs.field(init=False, factory=list)
+    _counter: typing.Iterator[int] = attrs.field(init=False, factory=itertools.count)
+    _task: asyncio.Task[None] | None = attrs.field(init=False, default=None)
+    _wakeup: asyncio.Event | None = attrs.field(init=False, default=None)
+    _pending: set[asyncio.Task[None]] = attrs.field(init=False, factory=set)
+
+    def register(self, target: Heartbeater, interval: float) -> None:
+        """Schedules heartbeats of a connection, replacing its previous schedule.
+
+        Parameters
+        ----------
+        target: Heartbeater
+            The connection.
+        interval: float
+            Seconds between two heartbeats.
+        """
+        self.unregister(target)
+        entry = self._entries[id(target)] = _Entry(target, interval)
+        deadline = time.monotonic() + interval * random.random()
+        if self._queue and deadline < self._queue[0][0] and self._wakeup is not None:
+            self._wakeup.set()
+        heapq.heappush(self._queue, (deadline, next(self._counter), entry))
+        if self._task is None:
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    def unregister(self, target: Heartbeater) -> None:
+        """Stops the heartbeats of a connection."""
+        if (entry := self._entries.pop(id(target), None)) is not None:
+            entry.cancelled = True
+
+    async def _run(self) -> None:
+        self._wakeup = asyncio.Event()
+        try:
+            while self._queue:
+                deadline, _, entry = self._queue[0]
+                if entry.cancelled:
+                    heapq.heappop(self._queue)
+                    continue
+                if (delay := deadline - time.monotonic()) > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                now = time.monotonic()
+                # Deadlines advance by whole intervals, a stalled loop skips the missed beats instead
+                # of sending them in a burst.
+                next_deadline = deadline + entry.interval
+                if next_deadline <= now:
+                    next_deadline = now + entry.interval
+                heapq.heapreplace(self._queue, (next_deadline, next(self._counter), entry))
+                task = asyncio.ensure_future(entry.target.heartbeat())
+                self._pending.add(task)
+                task.add_done_callback(self._heartbeat_done)
+        finally:
+            self._task = None
+
+    def _heartbeat_done(self, task: asyncio.Task[None]) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and (exception := task.exception()) is not None:
+            main_logger.error(f"Sending a heartbeat failed: {exception!r}")
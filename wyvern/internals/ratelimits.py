@@ -0,0 +1,359 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+import typing
+
+import attrs
+
+from wyvern.logger import main_logger
+
+if typing.TYPE_CHECKING:
+    import multidict
+
+    from wyvern.internals.rest import CompiledRoute
+
+__all__: tuple[str, ...] = (
+    "RouteBucket",
+    "GlobalRateLimitBackend",
+    "LocalGlobalRateLimitBackend",
+    "SharedMemoryGlobalRateLimitBackend",
+    "RateLimiter",
+)
+
+
+@attrs.define(kw_only=True)
+class RouteBucket:
+    """Tracks the state of a single discord rate limit bucket for one set of major parameters."""
+
+    key: str
+    """Key of the bucket in the :class:`RateLimiter`."""
+    limit: int = 1
+    """Number of requests that can be made in one window."""
+    remaining: int = 1
+    """Requests left in the current window."""
+    reset_at: float = 0
+    """Monotonic time at which the current window resets."""
+    window: float = 0
+    """Length of a full window in seconds, as last observed."""
+    resolved: bool = False
+    """Whether discord has reported limits for this bucket yet."""
+    unlimited: bool = False
+    """Whether responses in this bucket came without rate limit headers, such buckets aren't throttled."""
+    _lock: asyncio.Lock = attrs.field(init=False, factory=asyncio.Lock)
+
+    @property
+    def is_idle(self) -> bool:
+        return not self._lock.locked() and self.reset_at <= time.monotonic()
+
+    async def acquire(self) -> bool:
+        """|coro|
+
+        Waits until a request can be made in this bucket without hitting a 429.
+        Waiters are served in FIFO order.
+
+        Returns
+        -------
+        bool
+            True if the bucket is still unresolved, in which case the caller keeps the bucket locked
+            until :meth:`release` is called so only one request discovers its limits.
+        """
+        await self._lock.acquire()
+        if self.resolved is False:
+            return True
+        try:
+            if self.unlimited is True:
+                return False
+            now = time.monotonic()
+            if self.reset_at <= now:
+                self._refill(now)
+            elif self.remaining <= 0:
+                delay = self.reset_at - now
+                main_logger.debug(f"Bucket {self.key} exhausted, sleeping for {delay:.3f} seconds.")
+                await asyncio.sleep(delay)
+                self._refill(time.monotonic())
+            self.remaining -= 1
+        finally:
+            self._lock.release()
+        return False
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def _refill(self, now: float) -> None:
+        # The real reset time of the new window is only known once a response arrives,
+        # assume it is as long as the last one seen so requests don't overshoot in the meantime.
+        self.remaining = self.limit
+        self.reset_at = now + self.window
+
+    def update(self, headers: multidict.CIMultiDictProxy[str]) -> None:
+        """Updates the bucket from the ``X-RateLimit-*`` headers of a response.
+
+        Parameters
+        ----------
+        headers: multidict.CIMultiDictProxy[str]
+            The response headers.
+        """
+        if (limit := headers.get("X-RateLimit-Limit")) is None:
+            if self.resolved is False:
+                # Nothing will ever tell the limits of this bucket, stop serializing its requests.
+                self.resolved = self.unlimited = True
+            return
+        reset_after = float(headers.get("X-RateLimit-Reset-After", 0))
+        remaining = int(headers.get("X-RateLimit-Remaining", 0))
+        reset_at = time.monotonic() + reset_after
+        self.limit = int(limit)
+        if remaining == self.limit - 1 or self.window == 0:
+            self.window = reset_after
+        # Responses can arrive out of order, only trust a higher remaining count if it belongs to a newer window.
+        if reset_at > self.reset_at + 0.1:
+            self.remaining = remaining
+        else:
+            self.remaining = min(self.remaining, remaining)
+        self.reset_at = reset_at
+        self.resolved = True
+        self.unlimited = False
+
+    def exhaust(self, retry_after: float) -> None:
+        """Marks the bucket as empty for the given number of seconds."""
+        self.unlimited = False
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, time.monotonic() + retry_after)
+
+
+class GlobalRateLimitBackend(abc.ABC):
+    """Base class for backends of the global rate limit token bucket.
+
+    The bucket holds at most ``burst`` tokens and refills at ``rate - burst`` tokens per second, so no one
+    second window admits more than ``rate`` requests. Reservations are allowed to take the bucket below zero,
+    the deficit is how long the caller has to wait.
+    """
+
+    rate: float
+    burst: float
+
+    @abc.abstractmethod
+    def reserve(self) -> float:
+        """Reserves a request slot.
+
+        Returns
+        -------
+        float
+            Seconds to wait before the reserved slot can be used.
+        """
+
+    def _take(self, tokens: float, updated_at: float, now: float) -> tuple[float, float]:
+        refill = self.rate - self.burst
+        tokens = min(self.burst, tokens + (now - updated_at) * refill) - 1
+        return tokens, (-tokens / refill if tokens < 0 else 0.0)
+
+    @staticmethod
+    def _check(rate: float, burst: float) -> None:
+        if not 1 <= burst < rate:
+            raise ValueError(f"burst must be at least 1 and lower than rate, got burst={burst} and rate={rate}.")
+
+
+class LocalGlobalRateLimitBackend(GlobalRateLimitBackend):
+    """Global rate limit backend for a single process.
+
+    Parameters
+    ----------
+    rate: float
+        Requests allowed per second, defaults to discord's limit of 50.
+    burst: float
+        Requests that can be made at once after an idle period, defaults to 1.
+    """
+
+    def __init__(self, rate: float = 50, *, burst: float = 1) -> None:
+        self._check(rate, burst)
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self._tokens, delay = self._take(self._tokens, self._updated_at, now)
+        self._updated_at = now
+        return delay
+
+
+class SharedMemoryGlobalRateLimitBackend(GlobalRateLimitBackend):
+    """Global rate limit backend shared by every process on the host using the same ``name``.
+
+    The bucket lives in a small memory mapped file guarded by an advisory lock, so worker processes running
+    with the same token stay under the global limit together. Only available on POSIX systems.
+
+    Parameters
+    ----------
+    name: str
+        Name of the shared bucket, processes using the same name share the limit.
+    rate: float
+        Requests allowed per second across all processes, defaults to discord's limit of 50.
+    burst: float
+        Requests that can be made at once after an idle period, defaults to 1.
+    directory: str | None
+        Directory to create the bucket file in, defaults to the system's temporary directory.
+    """
+
+    _state = struct.Struct("<dd")
+
+    def __init__(self, name: str, rate: float = 50, *, burst: float = 1, directory: str | None = None) -> None:
+        import fcntl
+
+        self._check(rate, burst)
+        self._fcntl = fcntl
+        self.rate = rate
+        self.burst = burst
+        self.path = os.path.join(directory or tempfile.gettempdir(), f"wyvern-{name}.ratelimit")
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < self._state.size:
+                os.ftruncate(self._fd, self._state.size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, self._state.size)
+
+    @classmethod
+    def for_token(cls, token: str, rate: float = 50, *, burst: float = 1) -> SharedMemoryGlobalRateLimitBackend:
+        """Creates a backend shared by every process running with the same bot token."""
+        return cls(hashlib.sha256(token.encode()).hexdigest()[:16], rate, burst=burst)
+
+    def reserve(self) -> float:
+        self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+        try:
+            # Wall clock time, monotonic clocks aren't comparable across processes everywhere.
+            now = time.time()
+            tokens, updated_at = self._state.unpack_from(self._map)
+            if updated_at == 0:
+                tokens, updated_at = self.burst, now
+            tokens, delay = self._take(tokens, updated_at, now)
+            self._state.pack_into(self._map, 0, tokens, now)
+        finally:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+        return delay
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+
+@attrs.define(kw_only=True)
+class RateLimiter:
+    """Maps requests to their rate limit buckets and keeps track of the global rate limit."""
+
+    max_buckets: int = 4096
+    """Number of buckets after which idle buckets are purged."""
+    global_backend: GlobalRateLimitBackend = attrs.field(factory=LocalGlobalRateLimitBackend)
+    """Backend of the global requests per second limit."""
+    buckets: dict[str, RouteBucket] = attrs.field(init=False, factory=dict)
+    """Mapping of bucket keys to buckets."""
+    bucket_hashes: dict[str, str] = attrs.field(init=False, factory=dict)
+    """Mapping of route keys to the bucket hashes discord reported for them."""
+    _global_unlocked: asyncio.Event | None = attrs.field(init=False, default=None)
+
+    def get_bucket(self, method: str, route: CompiledRoute) -> RouteBucket:
+        """Returns the bucket a request will be made in.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        route: CompiledRoute
+            Route of the request.
+
+        Returns
+        -------
+        RouteBucket
+            The bucket for the request.
+        """
+        route_key = f"{method} {route.route.template}"
+        key = f"{self.bucket_hashes.get(route_key, route_key)}:{route.major_params}"
+        if (bucket := self.buckets.get(key)) is None:
+            if len(self.buckets) >= self.max_buckets:
+                self.purge_idle()
+            bucket = self.buckets[key] = RouteBucket(key=key)
+        return bucket
+
+    def purge_idle(self) -> None:
+        """Drops buckets which have no pending requests and whose window has passed."""
+        for key in [key for key, bucket in self.buckets.items() if bucket.is_idle]:
+            del self.buckets[key]
+
+    def update(
+        self, bucket: RouteBucket, method: str, route: CompiledRoute, headers: multidict.CIMultiDictProxy[str]
+    ) -> None:
+        """Updates a bucket and learns its hash from the headers of a response.
+
+        Parameters
+        ----------
+        bucket: RouteBucket
+            The bucket the request was made in.
+        method: str
+            HTTP method of the request.
+        route: CompiledRoute
+            Route of the request.
+        headers: multidict.CIMultiDictProxy[str]
+            The response headers.
+        """
+        bucket.update(headers)
+        if (bucket_hash := headers.get("X-RateLimit-Bucket")) is None:
+            return
+        route_key = f"{method} {route.route.template}"
+        if self.bucket_hashes.get(route_key) != bucket_hash:
+            self.bucket_hashes[route_key] = bucket_hash
+            self.buckets.setdefault(f"{bucket_hash}:{route.major_params}", bucket)
+
+    async def wait_global(self) -> None:
+        """|coro|
+
+        Waits for the global rate limit to be lifted, if it is active, and for a slot in the global
+        requests per second limit.
+        """
+        if self._global_unlocked is not None:
+            await self._global_unlocked.wait()
+        if (delay := self.global_backend.reserve()) > 0:
+            await asyncio.sleep(delay)
+
+    def lock_globally(self, retry_after: float) -> None:
+        """Blocks every request until the global rate limit resets.
+
+        Parameters
+        ----------
+        retry_after: float
+            Seconds after which the global rate limit resets.
+        """
+        main_logger.warning(f"Global rate limit hit, blocking requests for {retry_after:.3f} seconds.")
+        if self._global_unlocked is None:
+            self._global_unlocked = asyncio.Event()
+        self._global_unlocked.clear()
+        asyncio.get_running_loop().call_later(retry_after, self._global_unlocked.set)
@@ -0,0 +1,111 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import collections
+import time
+import typing
+
+import attrs
+
+if typing.TYPE_CHECKING:
+    from wyvern.internals.rest import RequestRoute, Route
+
+__all__: tuple[str, ...] = ("CachedResponse", "ResponseCache")
+
+
+@attrs.define(kw_only=True)
+class CachedResponse:
+    """A decoded response body stored in a :class:`ResponseCache`."""
+
+    body: typing.Any
+    """The decoded body."""
+    etag: str | None
+    """The ``ETag`` header of the response, if any."""
+    stored_at: float
+    """Monotonic time at which the response was stored or last revalidated."""
+
+
+@attrs.define(kw_only=True)
+class ResponseCache:
+    """An LRU cache of GET responses, keyed by the rendered route path.
+
+    Responses younger than their route's TTL are served without a request. Older ones are revalidated with
+    ``If-None-Match`` when discord sent an ``ETag``, and a ``304`` serves the cached body.
+    Successful non-GET requests drop the cached responses of the same path and of its parent paths, so
+    editing ``guilds/{id}/roles/{role_id}`` also drops ``guilds/{id}/roles`` and ``guilds/{id}``.
+
+    Example
+    -------
+
+    .. highlight:: python
+    .. code-block:: python
+
+        from wyvern.internals.response_cache import ResponseCache
+        from wyvern.internals.rest import Endpoints
+
+        cache = ResponseCache(ttl=30, route_ttls={Endpoints.GET_GUILD_ROLES: 300})
+        bot = wyvern.GatewayBot(token, response_cache=cache)
+    """
+
+    max_size: int = 1024
+    """Maximum number of responses kept, the least recently used ones are evicted first."""
+    ttl: float = 30
+    """Seconds a response is served without revalidation, ``0`` to always revalidate."""
+    route_ttls: dict[Route, float] = attrs.field(factory=dict)
+    """Per route overrides of :attr:`ttl`."""
+    entries: collections.OrderedDict[str, CachedResponse] = attrs.field(init=False, factory=collections.OrderedDict)
+    """The cached responses, from least to most recently used."""
+
+    def get(self, route: RequestRoute) -> CachedResponse | None:
+        """Returns the cached response for a route, fresh or not."""
+        if (entry := self.entries.get(route.end_url)) is not None:
+            self.entries.move_to_end(route.end_url)
+        return entry
+
+    def get_fresh(self, route: RequestRoute) -> CachedResponse | None:
+        """Returns the cached response for a route if it is younger than the route's TTL."""
+        if (entry := self.get(route)) is None:
+            return None
+        if time.monotonic() - entry.stored_at < self.route_ttls.get(route.route.route, self.ttl):
+            return entry
+        return None
+
+    def store(self, route: RequestRoute, body: typing.Any, etag: str | None) -> None:
+        self.entries[route.end_url] = CachedResponse(body=body, etag=etag, stored_at=time.monotonic())
+        self.entries.move_to_end(route.end_url)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def revalidated(self, entry: CachedResponse) -> None:
+        entry.stored_at = time.monotonic()
+
+    def invalidate(self, path: str) -> None:
+        """Drops the cached responses of a path and of the collections it belongs to."""
+        path = path.partition("?")[0]
+        while path:
+            self.entries.pop(path, None)
+            path = path.rpartition("/")[0]
+
+    def clear(self) -> None:
+        self.entries.clear()
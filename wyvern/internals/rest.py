@@ -22,12 +22,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import functools
+import re
 import typing
 
 import aiohttp
 import attrs
 import multidict
 
+from wyvern.internals.ratelimits import RateLimiter
+from wyvern.internals.response_cache import ResponseCache
+from wyvern.internals.retries import RetryPolicy
 from wyvern.logger import main_logger
 from wyvern.utils.consts import UNDEFINED, Undefined
 
@@ -35,7 +42,25 @@ if typing.TYPE_CHECKING:
     from wyvern.api.bot import GatewayBot
 
 
-__all__: tuple[str, ...] = ("RESTClient", "Endpoints")
+__all__: tuple[str, ...] = ("RESTClient", "RESTMetrics", "Route", "CompiledRoute", "RequestRoute", "Endpoints")
+
+
+@attrs.define
+class RESTMetrics:
+    """Per route counters of the requests made by a :class:`RESTClient`."""
+
+    requests: collections.Counter[Route] = attrs.field(factory=collections.Counter)
+    """HTTP requests sent, including retries."""
+    coalesced: collections.Counter[Route] = attrs.field(factory=collections.Counter)
+    """Calls that were served by an identical request already in flight, without sending one of their own."""
+    retries: collections.Counter[Route] = attrs.field(factory=collections.Counter)
+    """Requests retried after a server error or a dropped connection."""
+    ratelimited: collections.Counter[Route] = attrs.field(factory=collections.Counter)
+    """Responses with a 429 status."""
+    cache_hits: collections.Counter[Route] = attrs.field(factory=collections.Counter)
+    """Calls served from the response cache without a request."""
+    cache_revalidations: collections.Counter[Route] = attrs.field(factory=collections.Counter)
+    """Calls served from the response cache after a ``304`` response."""
 
 
 @attrs.define(kw_only=True)
@@ -44,645 +69,1198 @@ class RESTClient:
     bot: GatewayBot
     api_version: int
     client_session: aiohttp.ClientSession | Undefined = UNDEFINED
+    ratelimiter: RateLimiter = attrs.field(factory=RateLimiter)
+    """Rate limit handler used to queue requests before they hit a 429."""
+    max_ratelimit_retries: int = 5
+    """Number of times a request is retried after getting rate limited."""
+    retry_policy: RetryPolicy = attrs.field(factory=RetryPolicy)
+    """Policy for retrying requests that failed with a server error or a dropped connection."""
+    metrics: RESTMetrics = attrs.field(factory=RESTMetrics)
+    """Counters of the requests made by the client."""
+    response_cache: ResponseCache | None = None
+    """Cache of GET responses, ``None`` if responses aren't cached."""
+    _inflight: dict[str, asyncio.Task[typing.Any]] = attrs.field(init=False, factory=dict)
 
     @property
     def headers(self) -> dict[str, multidict.istr]:
-        return {"Authorization": multidict.istr(f"GatewayBot {self.token}")}
+        return {"Authorization": multidict.istr(f"Bot {self.token}")}
 
     async def request(self, route: RequestRoute) -> typing.Any:
+        """|coro|
+
+        Makes a request to the API.
+
+        Concurrent GET requests to the same url share a single HTTP request unless the route opts out
+        with ``coalesce=False``. If a :class:`.ResponseCache` is set, GET responses are served from it
+        unless the route opts out with ``cache=False``. In both cases the decoded body is shared between
+        callers, so it shouldn't be mutated in place.
+
+        Parameters
+        ----------
+        route: RequestRoute
+            The route to request.
+
+        Returns
+        -------
+        typing.Any
+            The decoded response body, ``None`` if the response has no body.
+        """
+        if route.type != "GET":
+            return await self._request(route)
+        if (
+            self.response_cache is not None
+            and route.cache is True
+            and (entry := self.response_cache.get_fresh(route)) is not None
+        ):
+            self.metrics.cache_hits[route.route.route] += 1
+            return entry.body
+        if route.coalesce is False:
+            return await self._request(route)
+        key = route.url
+        if (task := self._inflight.get(key)) is not None:
+            self.metrics.coalesced[route.route.route] += 1
+            return await asyncio.shield(task)
+        # The request runs in its own task so the callers sharing it aren't affected if the first one is cancelled.
+        task = self._inflight[key] = asyncio.ensure_future(self._request(route))
+        task.add_done_callback(functools.partial(self._finish_inflight, key))
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: asyncio.Task[typing.Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
+
+    async def _request(self, route: RequestRoute) -> typing.Any:
         headers = self.headers.copy()
         headers["Content-Type"] = multidict.istr("application/json")
         main_logger.debug(f"Creating a {route.type} request to {route.end_url} endpoint.")
-        assert isinstance((session := self.client_session), aiohttp.ClientSession)
-        res = await session.request(route.type, route.url, headers=headers, json=route.json)
+        data = self.bot.codec.dumps(route.json) if route.json is not None else None
+        cache = self.response_cache if route.cache is True else None
+        entry = cache.get(route) if cache is not None and route.type == "GET" else None
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = multidict.istr(entry.etag)
+        policy = self.retry_policy
+        retryable = policy.allows_retries(route.type, route.retry)
+        loop = asyncio.get_running_loop()
+        deadline = route.deadline if route.deadline is not None else policy.deadline
+        expires_at = loop.time() + deadline if deadline is not None else None
+        policy.budget.deposit()
+        attempt = 0
+        while True:
+            res: aiohttp.ClientResponse | None = None
+            try:
+                if expires_at is None:
+                    res = await self._send(route, headers, data)
+                else:
+                    res = await asyncio.wait_for(self._send(route, headers, data), expires_at - loop.time())
+            except policy.retry_exceptions as e:
+                error: BaseException | None = e
+            else:
+                if res.status not in policy.retry_statuses:
+                    break
+                error = None
+            delay = policy.backoff(attempt)
+            if (
+                retryable is False
+                or attempt >= policy.max_retries
+                or (expires_at is not None and loop.time() + delay >= expires_at)
+                or policy.budget.withdraw() is False
+            ):
+                if error is not None:
+                    raise error
+                break
+            if res is not None:
+                res.release()
+            reason = repr(error) if res is None else f"status {res.status}"
+            main_logger.warning(
+                f"{route.type} {route.end_url} failed with {reason}, retrying in {delay:.3f} seconds "
+                f"({attempt + 1}/{policy.max_retries})."
+            )
+            self.metrics.retries[route.route.route] += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+        if res.status == 304 and entry is not None and cache is not None:
+            res.release()
+            cache.revalidated(entry)
+            self.metrics.cache_revalidations[route.route.route] += 1
+            return entry.body
         res.raise_for_status()
+        if cache is not None and route.type != "GET":
+            cache.invalidate(route.end_url)
         if res.status in (200, 201):
-            return await res.json()
+            body = self.bot.codec.loads(await res.read())
+            if cache is not None and route.type == "GET":
+                cache.store(route, body, res.headers.get("ETag"))
+            return body
         if res.status in (204, 304):
             return
 
+    async def _send(
+        self, route: RequestRoute, headers: dict[str, multidict.istr], data: bytes | None
+    ) -> aiohttp.ClientResponse:
+        assert isinstance((session := self.client_session), aiohttp.ClientSession)
+        bucket = self.ratelimiter.get_bucket(route.type, route.route)
+        for _ in range(self.max_ratelimit_retries + 1):
+            discovering = await bucket.acquire()
+            try:
+                # Interaction responses are exempt from the global limit.
+                if route.route.route is not Endpoints.INTERACTION_CALLBACK:
+                    await self.ratelimiter.wait_global()
+                self.metrics.requests[route.route.route] += 1
+                res = await session.request(route.type, route.url, headers=headers, data=data)
+                self.ratelimiter.update(bucket, route.type, route.route, res.headers)
+            finally:
+                if discovering is True:
+                    bucket.release()
+            if res.status != 429:
+                return res
+            self.metrics.ratelimited[route.route.route] += 1
+            body = self.bot.codec.loads(await res.read())
+            retry_after = float(body.get("retry_after", res.headers.get("Retry-After", 1)))
+            if body.get("global", False) or res.headers.get("X-RateLimit-Global") == "true":
+                self.ratelimiter.lock_globally(retry_after)
+            else:
+                main_logger.warning(
+                    f"Rate limited on {route.type} {route.end_url}, retrying in {retry_after:.3f} seconds."
+                )
+                bucket.exhaust(retry_after)
+                if bucket.resolved is False:
+                    await asyncio.sleep(retry_after)
+        return res  # type: ignore
+
+
+_MAJOR_PARAMETERS = re.compile(r"^(?:(?:channels|guilds)/\{(\w+)\}|webhooks/\{(\w+)\}(?:/\{(\w+)\})?)")
+
+
+@functools.lru_cache(maxsize=None)
+def api_prefix(api_version: int) -> str:
+    """Returns the base url of the given API version, ``https://discord.com/api/v{api_version}/``."""
+    return f"https://discord.com/api/v{api_version}/"
+
+
+@attrs.define(frozen=True)
+class Route:
+    """An endpoint of the API, the method and path template of a request without its parameters filled in.
+
+    Routes are hashable and are used to key rate limit buckets, metrics and caches.
+    """
+
+    method: str
+    """HTTP method of the endpoint."""
+    template: str
+    """Path template of the endpoint, relative to the API base url. Example: ``channels/{channel_id}/messages``."""
+    major_params: tuple[str, ...] = attrs.field(init=False, eq=False)
+    """Names of the major parameters of the route, which discord scopes rate limits to."""
+    key: str = attrs.field(init=False, eq=False, repr=False)
+    """The method and template joined, used as the route's rate limit key."""
+
+    @major_params.default  # type: ignore
+    def _get_major_params(self) -> tuple[str, ...]:
+        if (match := _MAJOR_PARAMETERS.match(self.template)) is None:
+            return ()
+        return tuple(param for param in match.groups() if param)
+
+    @key.default  # type: ignore
+    def _get_key(self) -> str:
+        return f"{self.method} {self.template}"
+
+    def compile(self, **params: typing.Any) -> CompiledRoute:
+        """Fills in the parameters of the route.
+
+        Returns
+        -------
+        CompiledRoute
+            The route with its path rendered.
+        """
+        return CompiledRoute(
+            route=self,
+            path=self.template.format_map(params),
+            major_params=":".join(str(params[param]) for param in self.major_params),
+        )
+
+
+@attrs.define(frozen=True)
+class CompiledRoute:
+    """A :class:`Route` with its parameters filled in."""
+
+    route: Route
+    """The route this was compiled from."""
+    path: str
+    """The rendered path."""
+    major_params: str
+    """Values of the route's major parameters, joined by a colon."""
+
+    @property
+    def method(self) -> str:
+        return self.route.method
+
+    def url(self, api_version: int) -> str:
+        return api_prefix(api_version) + self.path
+
 
 @attrs.define
 class RequestRoute:
-    end_url: str
+    route: CompiledRoute
     api_version: int = 10
-    type: str = "GET"
+    type: str = attrs.field(default=attrs.Factory(lambda self: self.route.method, takes_self=True))  # type: ignore
     json: dict[str, typing.Any] | None = None
+    retry: bool | None = None
+    """Whether the request may be retried after a server error, ``None`` to retry only idempotent methods."""
+    deadline: float | None = None
+    """Seconds the request may take including retries, overriding the retry policy's deadline."""
+    coalesce: bool = True
+    """Whether a GET request may share the response of an identical request already in flight."""
+    cache: bool = True
+    """Whether a GET request may be served from, and stored in, the client's response cache."""
+
+    @property
+    def end_url(self) -> str:
+        return self.route.path
 
     @property
     def url(self) -> str:
-        return f"https://discord.com/api/v{self.api_version}/{self.end_url}"
+        return self.route.url(self.api_version)
 
 
 class Endpoints:
+    GUILD_AUDIT_LOGS = Route("GET", "guilds/{guild_id}/audit-logs")
+
     @classmethod
-    def guild_audit_logs(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/audit-logs"
+    def guild_audit_logs(cls, guild_id: int) -> CompiledRoute:
+        return cls.GUILD_AUDIT_LOGS.compile(guild_id=guild_id)
+
+    LIST_AUTO_MODERATION_RULES = Route("GET", "guilds/{guild_id}/auto-moderation/rules")
 
     @classmethod
-    def list_auto_moderation_rules(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/auto-moderation/rules"
+    def list_auto_moderation_rules(cls, guild_id: int) -> CompiledRoute:
+        return cls.LIST_AUTO_MODERATION_RULES.compile(guild_id=guild_id)
+
+    GET_AUTO_MODERATION_RULE = Route("GET", "guilds/{guild_id}/auto-moderation/rules/{rule_id}")
 
     @classmethod
-    def get_auto_moderation_rule(cls, guild_id: int, rule_id: int) -> str:
-        return f"guilds/{guild_id}/auto-moderation/rules/{rule_id}"
+    def get_auto_moderation_rule(cls, guild_id: int, rule_id: int) -> CompiledRoute:
+        return cls.GET_AUTO_MODERATION_RULE.compile(guild_id=guild_id, rule_id=rule_id)
+
+    CREATE_AUTO_MODERATION_RULE = Route("POST", "guilds/{guild_id}/auto-moderation/rules")
 
     @classmethod
-    def create_auto_moderation_rule(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/auto-moderation/rules"
+    def create_auto_moderation_rule(cls, guild_id: int) -> CompiledRoute:
+        return cls.CREATE_AUTO_MODERATION_RULE.compile(guild_id=guild_id)
+
+    MODIFY_AUTO_MODERATION_RULE = Route("PATCH", "guilds/{guild_id}/auto-moderation/rules/{rule_id}")
 
     @classmethod
-    def modify_auto_moderation_rule(cls, guild_id: int, rule_id: int) -> str:
-        return f"guilds/{guild_id}/auto-moderation/rules/{rule_id}"
+    def modify_auto_moderation_rule(cls, guild_id: int, rule_id: int) -> CompiledRoute:
+        return cls.MODIFY_AUTO_MODERATION_RULE.compile(guild_id=guild_id, rule_id=rule_id)
+
+    DELETE_AUTO_MODERATION_RULE = Route("DELETE", "guilds/{guild_id}/auto-moderation/rules/{rule_id}")
 
     @classmethod
-    def delete_auto_moderation_rule(cls, guild_id: int, rule_id: int) -> str:
-        return f"guilds/{guild_id}/auto-moderation/rules/{rule_id}"
+    def delete_auto_moderation_rule(cls, guild_id: int, rule_id: int) -> CompiledRoute:
+        return cls.DELETE_AUTO_MODERATION_RULE.compile(guild_id=guild_id, rule_id=rule_id)
+
+    GET_CHANNEL = Route("GET", "channels/{channel_id}")
 
     @classmethod
-    def get_channel(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}"
+    def get_channel(cls, channel_id: int) -> CompiledRoute:
+        return cls.GET_CHANNEL.compile(channel_id=channel_id)
+
+    MODIFY_CHANNEL = Route("PATCH", "channels/{channel_id}")
 
     @classmethod
-    def modify_channel(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}"
+    def modify_channel(cls, channel_id: int) -> CompiledRoute:
+        return cls.MODIFY_CHANNEL.compile(channel_id=channel_id)
+
+    DELETE_CHANNEL = Route("DELETE", "channels/{channel_id}")
 
     @classmethod
-    def delete_channel(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}"
+    def delete_channel(cls, channel_id: int) -> CompiledRoute:
+        return cls.DELETE_CHANNEL.compile(channel_id=channel_id)
+
+    GET_CHANNEL_MESSAGES = Route("GET", "channels/{channel_id}/messages")
 
     @classmethod
-    def get_channel_messages(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/messages"
+    def get_channel_messages(cls, channel_id: int) -> CompiledRoute:
+        return cls.GET_CHANNEL_MESSAGES.compile(channel_id=channel_id)
+
+    GET_CHANNEL_MESSAGE = Route("GET", "channels/{channel_id}/messages/{message_id}")
 
     @classmethod
-    def get_channel_message(cls, channel_id: int, message_id: int) -> str:
-        return f"channels/{channel_id}/messages/{message_id}"
+    def get_channel_message(cls, channel_id: int, message_id: int) -> CompiledRoute:
+        return cls.GET_CHANNEL_MESSAGE.compile(channel_id=channel_id, message_id=message_id)
+
+    CREATE_MESSAGE = Route("POST", "channels/{channel_id}/messages")
 
     @classmethod
-    def create_message(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/messages"
+    def create_message(cls, channel_id: int) -> CompiledRoute:
+        return cls.CREATE_MESSAGE.compile(channel_id=channel_id)
+
+    CROSSPOST_MESSAGE = Route("POST", "channels/{channel_id}/messages/{message_id}/crosspost")
 
     @classmethod
-    def crosspost_message(cls, channel_id: int, message_id: int) -> str:
-        return f"channels/{channel_id}/messages/{message_id}/crosspost"
+    def crosspost_message(cls, channel_id: int, message_id: int) -> CompiledRoute:
+        return cls.CROSSPOST_MESSAGE.compile(channel_id=channel_id, message_id=message_id)
+
+    CREATE_REACTION = Route("PUT", "channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me")
 
     @classmethod
-    def create_reaction(cls, channel_id: int, message_id: int, emoji: str) -> str:
-        return f"channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
+    def create_reaction(cls, channel_id: int, message_id: int, emoji: str) -> CompiledRoute:
+        return cls.CREATE_REACTION.compile(channel_id=channel_id, message_id=message_id, emoji=emoji)
+
+    DELETE_OWN_REACTION = Route("DELETE", "channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me")
 
     @classmethod
-    def delete_own_reaction(cls, channel_id: int, message_id: int, emoji: str) -> str:
-        return f"channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
+    def delete_own_reaction(cls, channel_id: int, message_id: int, emoji: str) -> CompiledRoute:
+        return cls.DELETE_OWN_REACTION.compile(channel_id=channel_id, message_id=message_id, emoji=emoji)
+
+    DELETE_USER_REACTION = Route("DELETE", "channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}")
 
     @classmethod
-    def delete_user_reaction(cls, channel_id: int, message_id: int, emoji: str, user_id: int) -> str:
-        return f"channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}"
+    def delete_user_reaction(cls, channel_id: int, message_id: int, emoji: str, user_id: int) -> CompiledRoute:
+        return cls.DELETE_USER_REACTION.compile(
+            channel_id=channel_id, message_id=message_id, emoji=emoji, user_id=user_id
+        )
+
+    GET_USER_REACTIONS = Route("GET", "channels/{channel_id}/messages/{message_id}/reactions/{emoji}")
 
     @classmethod
-    def get_user_reactions(cls, channel_id: int, message_id: int, emoji: str) -> str:
-        return f"channels/{channel_id}/messages/{message_id}/reactions/{emoji}"
+    def get_user_reactions(cls, channel_id: int, message_id: int, emoji: str) -> CompiledRoute:
+        return cls.GET_USER_REACTIONS.compile(channel_id=channel_id, message_id=message_id, emoji=emoji)
+
+    DELETE_ALL_REACTIONS = Route("DELETE", "channels/{channel_id}/messages/{message_id}/reactions")
 
     @classmethod
-    def delete_all_reactions(cls, channel_id: int, message_id: int) -> str:
-        return f"channels/{channel_id}/messages/{message_id}/reactions"
+    def delete_all_reactions(cls, channel_id: int, message_id: int) -> CompiledRoute:
+        return cls.DELETE_ALL_REACTIONS.compile(channel_id=channel_id, message_id=message_id)
+
+    DELETE_ALL_REACTIONS_FOR_EMOJI = Route("DELETE", "channels/{channel_id}/messages/{message_id}/reactions/{emoji}")
 
     @classmethod
-    def delete_all_reactions_for_emoji(cls, channel_id: int, message_id: int, emoji: str) -> str:
-        return f"channels/{channel_id}/messages/{message_id}/reactions/{emoji}"
+    def delete_all_reactions_for_emoji(cls, channel_id: int, message_id: int, emoji: str) -> CompiledRoute:
+        return cls.DELETE_ALL_REACTIONS_FOR_EMOJI.compile(channel_id=channel_id, message_id=message_id, emoji=emoji)
+
+    EDIT_MESSAGE = Route("PATCH", "channels/{channel_id}/messages/{message_id}")
 
     @classmethod
-    def edit_message(cls, channel_id: int, message_id: int) -> str:
-        return f"channels/{channel_id}/messages/{message_id}"
+    def edit_message(cls, channel_id: int, message_id: int) -> CompiledRoute:
+        return cls.EDIT_MESSAGE.compile(channel_id=channel_id, message_id=message_id)
+
+    DELETE_MESSAGE = Route("DELETE", "channels/{channel_id}/messages/{message_id}")
 
     @classmethod
-    def delete_message(cls, channel_id: int, message_id: int) -> str:
-        return f"channels/{channel_id}/messages/{message_id}"
+    def delete_message(cls, channel_id: int, message_id: int) -> CompiledRoute:
+        return cls.DELETE_MESSAGE.compile(channel_id=channel_id, message_id=message_id)
+
+    BULK_DELETE_MESSAGES = Route("POST", "channels/{channel_id}/messages/bulk-delete")
 
     @classmethod
-    def bulk_delete_messages(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/messages/bulk-delete"
+    def bulk_delete_messages(cls, channel_id: int) -> CompiledRoute:
+        return cls.BULK_DELETE_MESSAGES.compile(channel_id=channel_id)
+
+    EDIT_CHANNEL_PERMISSIONS = Route("PUT", "channels/{channel_id}/permissions/{overwrite_id}")
 
     @classmethod
-    def edit_channel_permissions(cls, channel_id: int, overwrite_id: int) -> str:
-        return f"channels/{channel_id}/permissions/{overwrite_id}"
+    def edit_channel_permissions(cls, channel_id: int, overwrite_id: int) -> CompiledRoute:
+        return cls.EDIT_CHANNEL_PERMISSIONS.compile(channel_id=channel_id, overwrite_id=overwrite_id)
+
+    GET_CHANNEL_INVITES = Route("GET", "channels/{channel_id}/invites")
 
     @classmethod
-    def get_channel_invites(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/invites"
+    def get_channel_invites(cls, channel_id: int) -> CompiledRoute:
+        return cls.GET_CHANNEL_INVITES.compile(channel_id=channel_id)
+
+    CREATE_CHANNEL_INVITE = Route("POST", "channels/{channel_id}/invites")
 
     @classmethod
-    def create_channel_invite(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/invites"
+    def create_channel_invite(cls, channel_id: int) -> CompiledRoute:
+        return cls.CREATE_CHANNEL_INVITE.compile(channel_id=channel_id)
+
+    DELETE_CHANNEL_PERMISSION = Route("DELETE", "channels/{channel_id}/permissions/{overwrite_id}")
 
     @classmethod
-    def delete_channel_permission(cls, channel_id: int, overwrite_id: int) -> str:
-        return f"channels/{channel_id}/permissions/{overwrite_id}"
+    def delete_channel_permission(cls, channel_id: int, overwrite_id: int) -> CompiledRoute:
+        return cls.DELETE_CHANNEL_PERMISSION.compile(channel_id=channel_id, overwrite_id=overwrite_id)
+
+    FOLLOW_NEWS_CHANNEL = Route("POST", "channels/{channel_id}/followers")
 
     @classmethod
-    def follow_news_channel(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/followers"
+    def follow_news_channel(cls, channel_id: int) -> CompiledRoute:
+        return cls.FOLLOW_NEWS_CHANNEL.compile(channel_id=channel_id)
+
+    TRIGGER_TYPING_INDICATOR = Route("POST", "channels/{channel_id}/typing")
 
     @classmethod
-    def trigger_typing_indicator(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/typing"
+    def trigger_typing_indicator(cls, channel_id: int) -> CompiledRoute:
+        return cls.TRIGGER_TYPING_INDICATOR.compile(channel_id=channel_id)
+
+    GET_PINNED_MESSAGES = Route("GET", "channels/{channel_id}/pins")
 
     @classmethod
-    def get_pinned_messages(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/pins"
+    def get_pinned_messages(cls, channel_id: int) -> CompiledRoute:
+        return cls.GET_PINNED_MESSAGES.compile(channel_id=channel_id)
+
+    ADD_PINNED_CHANNEL_MESSAGE = Route("PUT", "channels/{channel_id}/pins/{message_id}")
 
     @classmethod
-    def add_pinned_channel_message(cls, channel_id: int, message_id: int) -> str:
-        return f"channels/{channel_id}/pins/{message_id}"
+    def add_pinned_channel_message(cls, channel_id: int, message_id: int) -> CompiledRoute:
+        return cls.ADD_PINNED_CHANNEL_MESSAGE.compile(channel_id=channel_id, message_id=message_id)
+
+    DELETE_PINNED_CHANNEL_MESSAGE = Route("DELETE", "channels/{channel_id}/pins/{message_id}")
 
     @classmethod
-    def delete_pinned_channel_message(cls, channel_id: int, message_id: int) -> str:
-        return f"channels/{channel_id}/pins/{message_id}"
+    def delete_pinned_channel_message(cls, channel_id: int, message_id: int) -> CompiledRoute:
+        return cls.DELETE_PINNED_CHANNEL_MESSAGE.compile(channel_id=channel_id, message_id=message_id)
+
+    GROUP_DM_ADD_RECIPIENT = Route("PUT", "channels/{channel_id}/recipients/{user_id}")
 
     @classmethod
-    def group_dm_add_recipient(cls, channel_id: int, user_id: int) -> str:
-        return f"channels/{channel_id}/recipients/{user_id}"
+    def group_dm_add_recipient(cls, channel_id: int, user_id: int) -> CompiledRoute:
+        return cls.GROUP_DM_ADD_RECIPIENT.compile(channel_id=channel_id, user_id=user_id)
+
+    GROUP_DM_REMOVE_RECIPIENT = Route("DELETE", "channels/{channel_id}/recipients/{user_id}")
 
     @classmethod
-    def group_dm_remove_recipient(cls, channel_id: int, user_id: int) -> str:
-        return f"channels/{channel_id}/recipients/{user_id}"
+    def group_dm_remove_recipient(cls, channel_id: int, user_id: int) -> CompiledRoute:
+        return cls.GROUP_DM_REMOVE_RECIPIENT.compile(channel_id=channel_id, user_id=user_id)
+
+    START_THREAD_WITH_MESSAGE = Route("POST", "channels/{channel_id}/messages/{message_id}/threads")
 
     @classmethod
-    def start_thread_with_message(cls, channel_id: int, message_id: int) -> str:
-        return f"channels/{channel_id}/messages/{message_id}/threads"
+    def start_thread_with_message(cls, channel_id: int, message_id: int) -> CompiledRoute:
+        return cls.START_THREAD_WITH_MESSAGE.compile(channel_id=channel_id, message_id=message_id)
+
+    START_THREAD_WITHOUT_MESSAGE = Route("POST", "channels/{channel_id}/threads")
 
     @classmethod
-    def start_thread_without_message(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/threads"
+    def start_thread_without_message(cls, channel_id: int) -> CompiledRoute:
+        return cls.START_THREAD_WITHOUT_MESSAGE.compile(channel_id=channel_id)
+
+    START_THREAD_IN_FORUM = Route("POST", "channels/{channel_id}/threads")
 
     @classmethod
-    def start_thread_in_forum(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/threads"
+    def start_thread_in_forum(cls, channel_id: int) -> CompiledRoute:
+        return cls.START_THREAD_IN_FORUM.compile(channel_id=channel_id)
+
+    JOIN_THREAD = Route("PUT", "channels/{channel_id}/threads/{thread_id}/members/@me")
 
     @classmethod
-    def join_thread(cls, channel_id: int, thread_id: int) -> str:
-        return f"channels/{channel_id}/threads/{thread_id}/members/@me"
+    def join_thread(cls, channel_id: int, thread_id: int) -> CompiledRoute:
+        return cls.JOIN_THREAD.compile(channel_id=channel_id, thread_id=thread_id)
+
+    ADD_THREAD_MEMBER = Route("PUT", "channels/{channel_id}/threads/{thread_id}/members/{user_id}")
 
     @classmethod
-    def add_thread_member(cls, channel_id: int, thread_id: int, user_id: int) -> str:
-        return f"channels/{channel_id}/threads/{thread_id}/members/{user_id}"
+    def add_thread_member(cls, channel_id: int, thread_id: int, user_id: int) -> CompiledRoute:
+        return cls.ADD_THREAD_MEMBER.compile(channel_id=channel_id, thread_id=thread_id, user_id=user_id)
+
+    LEAVE_THREAD = Route("DELETE", "channels/{channel_id}/threads/{thread_id}/members/@me")
 
     @classmethod
-    def leave_thread(cls, channel_id: int, thread_id: int) -> str:
-        return f"channels/{channel_id}/threads/{thread_id}/members/@me"
+    def leave_thread(cls, channel_id: int, thread_id: int) -> CompiledRoute:
+        return cls.LEAVE_THREAD.compile(channel_id=channel_id, thread_id=thread_id)
+
+    REMOVE_THREAD_MEMBER = Route("DELETE", "channels/{channel_id}/threads/{thread_id}/members/{user_id}")
 
     @classmethod
-    def remove_thread_member(cls, channel_id: int, thread_id: int, user_id: int) -> str:
-        return f"channels/{channel_id}/threads/{thread_id}/members/{user_id}"
+    def remove_thread_member(cls, channel_id: int, thread_id: int, user_id: int) -> CompiledRoute:
+        return cls.REMOVE_THREAD_MEMBER.compile(channel_id=channel_id, thread_id=thread_id, user_id=user_id)
+
+    GET_THREAD_MEMBER = Route("GET", "channels/{channel_id}/threads/{thread_id}/members/{user_id}")
 
     @classmethod
-    def get_thread_member(cls, channel_id: int, thread_id: int, user_id: int) -> str:
-        return f"channels/{channel_id}/threads/{thread_id}/members/{user_id}"
+    def get_thread_member(cls, channel_id: int, thread_id: int, user_id: int) -> CompiledRoute:
+        return cls.GET_THREAD_MEMBER.compile(channel_id=channel_id, thread_id=thread_id, user_id=user_id)
+
+    LIST_THREAD_MEMBERS = Route("GET", "channels/{channel_id}/threads-members")
 
     @classmethod
-    def list_thread_members(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/threads-members"
+    def list_thread_members(cls, channel_id: int) -> CompiledRoute:
+        return cls.LIST_THREAD_MEMBERS.compile(channel_id=channel_id)
+
+    LIST_PUBLIC_ARCHIVED_THREADS = Route("GET", "channels/{channel_id}/threads/archived/public")
 
     @classmethod
-    def list_public_archived_threads(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/threads/archived/public"
+    def list_public_archived_threads(cls, channel_id: int) -> CompiledRoute:
+        return cls.LIST_PUBLIC_ARCHIVED_THREADS.compile(channel_id=channel_id)
+
+    LIST_PRIVATE_ARCHIVED_THREADS = Route("GET", "channels/{channel_id}/threads/archived/private")
 
     @classmethod
-    def list_private_archived_threads(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/threads/archived/private"
+    def list_private_archived_threads(cls, channel_id: int) -> CompiledRoute:
+        return cls.LIST_PRIVATE_ARCHIVED_THREADS.compile(channel_id=channel_id)
+
+    LIST_JOINED_PRIVATE_ARCHIVED_THREADS = Route("GET", "channels/{channel_id}/users/@me/threads/archived/private")
 
     @classmethod
-    def list_joined_private_archived_threads(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/users/@me/threads/archived/private"
+    def list_joined_private_archived_threads(cls, channel_id: int) -> CompiledRoute:
+        return cls.LIST_JOINED_PRIVATE_ARCHIVED_THREADS.compile(channel_id=channel_id)
+
+    LIST_GUILD_EMOJIS = Route("GET", "guilds/{guild_id}/emojis")
 
     @classmethod
-    def list_guild_emojis(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/emojis"
+    def list_guild_emojis(cls, guild_id: int) -> CompiledRoute:
+        return cls.LIST_GUILD_EMOJIS.compile(guild_id=guild_id)
+
+    GET_GUILD_EMOJI = Route("GET", "guilds/{guild_id}/emojis/{emoji_id}")
 
     @classmethod
-    def get_guild_emoji(cls, guild_id: int, emoji_id: int) -> str:
-        return f"guilds/{guild_id}/emojis/{emoji_id}"
+    def get_guild_emoji(cls, guild_id: int, emoji_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_EMOJI.compile(guild_id=guild_id, emoji_id=emoji_id)
+
+    CREATE_GUILD_EMOJI = Route("POST", "guilds/{guild_id}/emojis")
 
     @classmethod
-    def create_guild_emoji(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/emojis"
+    def create_guild_emoji(cls, guild_id: int) -> CompiledRoute:
+        return cls.CREATE_GUILD_EMOJI.compile(guild_id=guild_id)
+
+    MODIFY_GUILD_EMOJI = Route("PATCH", "guilds/{guild_id}/emojis/{emoji_id}")
 
     @classmethod
-    def modify_guild_emoji(cls, guild_id: int, emoji_id: int) -> str:
-        return f"guilds/{guild_id}/emojis/{emoji_id}"
+    def modify_guild_emoji(cls, guild_id: int, emoji_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_EMOJI.compile(guild_id=guild_id, emoji_id=emoji_id)
+
+    DELETE_GUILD_EMOJI = Route("DELETE", "guilds/{guild_id}/emojis/{emoji_id}")
 
     @classmethod
-    def delete_guild_emoji(cls, guild_id: int, emoji_id: int) -> str:
-        return f"guilds/{guild_id}/emojis/{emoji_id}"
+    def delete_guild_emoji(cls, guild_id: int, emoji_id: int) -> CompiledRoute:
+        return cls.DELETE_GUILD_EMOJI.compile(guild_id=guild_id, emoji_id=emoji_id)
+
+    CREATE_GUILD = Route("POST", "guilds")
 
     @classmethod
-    def create_guild(cls) -> str:
-        return "guilds"
+    def create_guild(cls) -> CompiledRoute:
+        return cls.CREATE_GUILD.compile()
+
+    GET_GUILD = Route("GET", "guilds/{guild_id}")
 
     @classmethod
-    def get_guild(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}"
+    def get_guild(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD.compile(guild_id=guild_id)
+
+    GET_GUILD_PREVIEW = Route("GET", "guilds/{guild_id}/preview")
 
     @classmethod
-    def get_guild_preview(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/preview"
+    def get_guild_preview(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_PREVIEW.compile(guild_id=guild_id)
+
+    EDIT_GUILD = Route("PATCH", "guilds/{guild_id}")
 
     @classmethod
-    def edit_guild(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}"
+    def edit_guild(cls, guild_id: int) -> CompiledRoute:
+        return cls.EDIT_GUILD.compile(guild_id=guild_id)
+
+    DELETE_GUILD = Route("DELETE", "guilds/{guild_id}")
 
     @classmethod
-    def delete_guild(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}"
+    def delete_guild(cls, guild_id: int) -> CompiledRoute:
+        return cls.DELETE_GUILD.compile(guild_id=guild_id)
+
+    GET_GUILD_CHANNELS = Route("GET", "guilds/{guild_id}/channels")
 
     @classmethod
-    def get_guild_channels(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/channels"
+    def get_guild_channels(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_CHANNELS.compile(guild_id=guild_id)
+
+    CREATE_GUILD_CHANNEL = Route("POST", "guilds/{guild_id}/channels")
 
     @classmethod
-    def create_guild_channel(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/channels"
+    def create_guild_channel(cls, guild_id: int) -> CompiledRoute:
+        return cls.CREATE_GUILD_CHANNEL.compile(guild_id=guild_id)
+
+    MODIFY_GUILD_CHANNEL_POSITIONS = Route("PATCH", "guilds/{guild_id}/channels")
 
     @classmethod
-    def modify_guild_channel_positions(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/channels"
+    def modify_guild_channel_positions(cls, guild_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_CHANNEL_POSITIONS.compile(guild_id=guild_id)
+
+    ACTIVE_GUILD_THREADS = Route("GET", "guilds/{guild_id}/threads/active")
 
     @classmethod
-    def active_guild_threads(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/threads/active"
+    def active_guild_threads(cls, guild_id: int) -> CompiledRoute:
+        return cls.ACTIVE_GUILD_THREADS.compile(guild_id=guild_id)
+
+    GET_GUILD_MEMBER = Route("GET", "guilds/{guild_id}/members/{user_id}")
 
     @classmethod
-    def get_guild_member(cls, guild_id: int, user_id: int) -> str:
-        return f"guilds/{guild_id}/members/{user_id}"
+    def get_guild_member(cls, guild_id: int, user_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_MEMBER.compile(guild_id=guild_id, user_id=user_id)
+
+    LIST_GUILD_MEMBERS = Route("GET", "guilds/{guild_id}/members")
 
     @classmethod
-    def list_guild_members(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/members"
+    def list_guild_members(cls, guild_id: int) -> CompiledRoute:
+        return cls.LIST_GUILD_MEMBERS.compile(guild_id=guild_id)
+
+    SEARCH_GUILD_MEMBERS = Route("GET", "guilds/{guild_id}/members/search")
 
     @classmethod
-    def search_guild_members(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/members/search"
+    def search_guild_members(cls, guild_id: int) -> CompiledRoute:
+        return cls.SEARCH_GUILD_MEMBERS.compile(guild_id=guild_id)
+
+    ADD_GUILD_MEMBER = Route("PUT", "guilds/{guild_id}/members/{user_id}")
 
     @classmethod
-    def add_guild_member(cls, guild_id: int, user_id: int) -> str:
-        return f"guilds/{guild_id}/members/{user_id}"
+    def add_guild_member(cls, guild_id: int, user_id: int) -> CompiledRoute:
+        return cls.ADD_GUILD_MEMBER.compile(guild_id=guild_id, user_id=user_id)
+
+    MODIFY_GUILD_MEMBER = Route("PATCH", "guilds/{guild_id}/members/{user_id}")
 
     @classmethod
-    def modify_guild_member(cls, guild_id: int, user_id: int) -> str:
-        return f"guilds/{guild_id}/members/{user_id}"
+    def modify_guild_member(cls, guild_id: int, user_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_MEMBER.compile(guild_id=guild_id, user_id=user_id)
+
+    MODIFY_CURRENT_MEMBER = Route("PATCH", "guilds/{guild_id}/members/@me")
 
     @classmethod
-    def modify_current_member(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/members/@me"
+    def modify_current_member(cls, guild_id: int) -> CompiledRoute:
+        return cls.MODIFY_CURRENT_MEMBER.compile(guild_id=guild_id)
+
+    GUILD_MEMBER_ADDROLE = Route("PUT", "guilds/{guild_id}/members/{user_id}/roles/{role_id}")
 
     @classmethod
-    def guild_member_addrole(cls, guild_id: int, user_id: int, role_id: int) -> str:
-        return f"guilds/{guild_id}/members/{user_id}/roles/{role_id}"
+    def guild_member_addrole(cls, guild_id: int, user_id: int, role_id: int) -> CompiledRoute:
+        return cls.GUILD_MEMBER_ADDROLE.compile(guild_id=guild_id, user_id=user_id, role_id=role_id)
+
+    GUILD_MEMBER_REMOVEROLE = Route("DELETE", "guilds/{guild_id}/members/{user_id}/roles/{role_id}")
 
     @classmethod
-    def guild_member_removerole(cls, guild_id: int, user_id: int, role_id: int) -> str:
-        return f"guilds/{guild_id}/members/{user_id}/roles/{role_id}"
+    def guild_member_removerole(cls, guild_id: int, user_id: int, role_id: int) -> CompiledRoute:
+        return cls.GUILD_MEMBER_REMOVEROLE.compile(guild_id=guild_id, user_id=user_id, role_id=role_id)
+
+    REMOVE_GUILD_MEMBER = Route("DELETE", "guilds/{guild_id}/members/{user_id}")
 
     @classmethod
-    def remove_guild_member(cls, guild_id: int, user_id: int) -> str:
-        return f"guilds/{guild_id}/members/{user_id}"
+    def remove_guild_member(cls, guild_id: int, user_id: int) -> CompiledRoute:
+        return cls.REMOVE_GUILD_MEMBER.compile(guild_id=guild_id, user_id=user_id)
+
+    GET_GUILD_BANS = Route("GET", "guilds/{guild_id}/bans")
 
     @classmethod
-    def get_guild_bans(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/bans"
+    def get_guild_bans(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_BANS.compile(guild_id=guild_id)
+
+    GET_GUILD_BAN = Route("GET", "guilds/{guild_id}/bans/{user_id}")
 
     @classmethod
-    def get_guild_ban(cls, guild_id: int, user_id: int) -> str:
-        return f"guilds/{guild_id}/bans/{user_id}"
+    def get_guild_ban(cls, guild_id: int, user_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_BAN.compile(guild_id=guild_id, user_id=user_id)
+
+    CREATE_GUILD_BAN = Route("PUT", "guilds/{guild_id}/bans/{user_id}")
 
     @classmethod
-    def create_guild_ban(cls, guild_id: int, user_id: int) -> str:
-        return f"guilds/{guild_id}/bans/{user_id}"
+    def create_guild_ban(cls, guild_id: int, user_id: int) -> CompiledRoute:
+        return cls.CREATE_GUILD_BAN.compile(guild_id=guild_id, user_id=user_id)
+
+    REMOVE_GUILD_BAN = Route("DELETE", "guilds/{guild_id}/bans/{user_id}")
 
     @classmethod
-    def remove_guild_ban(cls, guild_id: int, user_id: int) -> str:
-        return f"guilds/{guild_id}/bans/{user_id}"
+    def remove_guild_ban(cls, guild_id: int, user_id: int) -> CompiledRoute:
+        return cls.REMOVE_GUILD_BAN.compile(guild_id=guild_id, user_id=user_id)
+
+    GET_GUILD_ROLES = Route("GET", "guilds/{guild_id}/roles")
 
     @classmethod
-    def get_guild_roles(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/roles"
+    def get_guild_roles(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_ROLES.compile(guild_id=guild_id)
+
+    CREATE_GUILD_ROLE = Route("POST", "guilds/{guild_id}/roles")
 
     @classmethod
-    def create_guild_role(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/roles"
+    def create_guild_role(cls, guild_id: int) -> CompiledRoute:
+        return cls.CREATE_GUILD_ROLE.compile(guild_id=guild_id)
+
+    MODIFY_GUILD_ROLE_POSITIONS = Route("PATCH", "guilds/{guild_id}/roles")
 
     @classmethod
-    def modify_guild_role_positions(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/roles"
+    def modify_guild_role_positions(cls, guild_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_ROLE_POSITIONS.compile(guild_id=guild_id)
+
+    MODIFY_GUILD_ROLE = Route("PATCH", "guilds/{guild_id}/roles/{role_id}")
 
     @classmethod
-    def modify_guild_role(cls, guild_id: int, role_id: int) -> str:
-        return f"guilds/{guild_id}/roles/{role_id}"
+    def modify_guild_role(cls, guild_id: int, role_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_ROLE.compile(guild_id=guild_id, role_id=role_id)
+
+    MODIFY_GUILD_MFA = Route("POST", "guilds/{guild_id}/mfa")
 
     @classmethod
-    def modify_guild_mfa(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/mfa"
+    def modify_guild_mfa(cls, guild_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_MFA.compile(guild_id=guild_id)
+
+    DELETE_GUILD_ROLE = Route("DELETE", "guilds/{guild_id}/roles/{role_id}")
 
     @classmethod
-    def delete_guild_role(cls, guild_id: int, role_id: int) -> str:
-        return f"guilds/{guild_id}/roles/{role_id}"
+    def delete_guild_role(cls, guild_id: int, role_id: int) -> CompiledRoute:
+        return cls.DELETE_GUILD_ROLE.compile(guild_id=guild_id, role_id=role_id)
+
+    GET_GUILD_PRUNE_COUNT = Route("GET", "guilds/{guild_id}/prune")
 
     @classmethod
-    def get_guild_prune_count(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/prune"
+    def get_guild_prune_count(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_PRUNE_COUNT.compile(guild_id=guild_id)
+
+    BEGIN_GUILD_PRUNE = Route("POST", "guilds/{guild_id}/prune")
 
     @classmethod
-    def begin_guild_prune(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/prune"
+    def begin_guild_prune(cls, guild_id: int) -> CompiledRoute:
+        return cls.BEGIN_GUILD_PRUNE.compile(guild_id=guild_id)
+
+    GUILD_VOICE_REGIONS = Route("GET", "guilds/{guild_id}/regions")
 
     @classmethod
-    def guild_voice_regions(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/regions"
+    def guild_voice_regions(cls, guild_id: int) -> CompiledRoute:
+        return cls.GUILD_VOICE_REGIONS.compile(guild_id=guild_id)
+
+    GET_GUILD_INVITES = Route("GET", "guilds/{guild_id}/invites")
 
     @classmethod
-    def get_guild_invites(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/invites"
+    def get_guild_invites(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_INVITES.compile(guild_id=guild_id)
+
+    GET_GUILD_INTEGRATIONS = Route("GET", "guilds/{guild_id}/integrations")
 
     @classmethod
-    def get_guild_integrations(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/integrations"
+    def get_guild_integrations(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_INTEGRATIONS.compile(guild_id=guild_id)
+
+    DELETE_GUILD_INTEGRATION = Route("DELETE", "guilds/{guild_id}/integrations/{integration_id}")
 
     @classmethod
-    def delete_guild_integration(cls, guild_id: int, integration_id: int) -> str:
-        return f"guilds/{guild_id}/integrations/{integration_id}"
+    def delete_guild_integration(cls, guild_id: int, integration_id: int) -> CompiledRoute:
+        return cls.DELETE_GUILD_INTEGRATION.compile(guild_id=guild_id, integration_id=integration_id)
+
+    GET_GUILD_WIDGET_SETTINGS = Route("GET", "guilds/{guild_id}/widget")
 
     @classmethod
-    def get_guild_widget_settings(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/widget"
+    def get_guild_widget_settings(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_WIDGET_SETTINGS.compile(guild_id=guild_id)
+
+    MODIFY_GUILD_WIDGET = Route("PATCH", "guilds/{guild_id}/widget")
 
     @classmethod
-    def modify_guild_widget(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/widget"
+    def modify_guild_widget(cls, guild_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_WIDGET.compile(guild_id=guild_id)
+
+    GET_GUILD_WIDGET = Route("GET", "guilds/{guild_id}/widget.json")
 
     @classmethod
-    def get_guild_widget(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/widget.json"
+    def get_guild_widget(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_WIDGET.compile(guild_id=guild_id)
+
+    GUILD_VANITY_URL = Route("GET", "guilds/{guild_id}/vanity-url")
 
     @classmethod
-    def guild_vanity_url(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/vanity-url"
+    def guild_vanity_url(cls, guild_id: int) -> CompiledRoute:
+        return cls.GUILD_VANITY_URL.compile(guild_id=guild_id)
+
+    GET_GUILD_WIDGET_IMAGE = Route("GET", "guilds/{guild_id}/widget.png")
 
     @classmethod
-    def get_guild_widget_image(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/widget.png"
+    def get_guild_widget_image(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_WIDGET_IMAGE.compile(guild_id=guild_id)
+
+    GET_GUILD_WELCOME_SCREEN = Route("GET", "guilds/{guild_id}/welcome-screen")
 
     @classmethod
-    def get_guild_welcome_screen(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/welcome-screen"
+    def get_guild_welcome_screen(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_WELCOME_SCREEN.compile(guild_id=guild_id)
+
+    MODIFY_GUILD_WELCOME_SCREEN = Route("PATCH", "guilds/{guild_id}/welcome-screen")
 
     @classmethod
-    def modify_guild_welcome_screen(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/welcome-screen"
+    def modify_guild_welcome_screen(cls, guild_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_WELCOME_SCREEN.compile(guild_id=guild_id)
+
+    MODIFY_CURRENT_USER_VOICE_STATE = Route("PATCH", "guilds/{guild_id}/voice-states/@me")
 
     @classmethod
-    def modify_current_user_voice_state(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/voice-states/@me"
+    def modify_current_user_voice_state(cls, guild_id: int) -> CompiledRoute:
+        return cls.MODIFY_CURRENT_USER_VOICE_STATE.compile(guild_id=guild_id)
+
+    MODIFY_USER_VOICE_STATE = Route("PATCH", "guilds/{guild_id}/voice-states/{user_id}")
 
     @classmethod
-    def modify_user_voice_state(cls, guild_id: int, user_id: int) -> str:
-        return f"guilds/{guild_id}/voice-states/{user_id}"
+    def modify_user_voice_state(cls, guild_id: int, user_id: int) -> CompiledRoute:
+        return cls.MODIFY_USER_VOICE_STATE.compile(guild_id=guild_id, user_id=user_id)
+
+    LIST_SCHEDULED_GUILD_EVENTS = Route("GET", "guilds/{guild_id}/scheduled-events")
 
     @classmethod
-    def list_scheduled_guild_events(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/scheduled-events"
+    def list_scheduled_guild_events(cls, guild_id: int) -> CompiledRoute:
+        return cls.LIST_SCHEDULED_GUILD_EVENTS.compile(guild_id=guild_id)
+
+    CREATE_SCHEDULED_GUILD_EVENT = Route("POST", "guilds/{guild_id}/scheduled-events")
 
     @classmethod
-    def create_scheduled_guild_event(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/scheduled-events"
+    def create_scheduled_guild_event(cls, guild_id: int) -> CompiledRoute:
+        return cls.CREATE_SCHEDULED_GUILD_EVENT.compile(guild_id=guild_id)
+
+    GET_SCHEDULED_GUILD_EVENT = Route("GET", "guilds/{guild_id}/scheduled-events/{event_id}")
 
     @classmethod
-    def get_scheduled_guild_event(cls, guild_id: int, event_id: int) -> str:
-        return f"guilds/{guild_id}/scheduled-events/{event_id}"
+    def get_scheduled_guild_event(cls, guild_id: int, event_id: int) -> CompiledRoute:
+        return cls.GET_SCHEDULED_GUILD_EVENT.compile(guild_id=guild_id, event_id=event_id)
+
+    MODIFY_SCHEDULED_GUILD_EVENT = Route("PATCH", "guilds/{guild_id}/scheduled-events/{event_id}")
 
     @classmethod
-    def modify_scheduled_guild_event(cls, guild_id: int, event_id: int) -> str:
-        return f"guilds/{guild_id}/scheduled-events/{event_id}"
+    def modify_scheduled_guild_event(cls, guild_id: int, event_id: int) -> CompiledRoute:
+        return cls.MODIFY_SCHEDULED_GUILD_EVENT.compile(guild_id=guild_id, event_id=event_id)
+
+    DELETE_SCHEDULED_GUILD_EVENT = Route("DELETE", "guilds/{guild_id}/scheduled-events/{event_id}")
 
     @classmethod
-    def delete_scheduled_guild_event(cls, guild_id: int, event_id: int) -> str:
-        return f"guilds/{guild_id}/scheduled-events/{event_id}"
+    def delete_scheduled_guild_event(cls, guild_id: int, event_id: int) -> CompiledRoute:
+        return cls.DELETE_SCHEDULED_GUILD_EVENT.compile(guild_id=guild_id, event_id=event_id)
+
+    GET_SCHEDULED_GUILD_EVENT_USERS = Route("GET", "guilds/{guild_id}/scheduled-events/{event_id}/users")
 
     @classmethod
-    def get_scheduled_guild_event_users(cls, guild_id: int, event_id: int) -> str:
-        return f"guilds/{guild_id}/scheduled-events/{event_id}/users"
+    def get_scheduled_guild_event_users(cls, guild_id: int, event_id: int) -> CompiledRoute:
+        return cls.GET_SCHEDULED_GUILD_EVENT_USERS.compile(guild_id=guild_id, event_id=event_id)
+
+    GET_GUILD_TEMPLATE = Route("GET", "guilds/{guild_id}/templates/{template_code}")
 
     @classmethod
-    def get_guild_template(cls, guild_id: int, template_code: str) -> str:
-        return f"guilds/{guild_id}/templates/{template_code}"
+    def get_guild_template(cls, guild_id: int, template_code: str) -> CompiledRoute:
+        return cls.GET_GUILD_TEMPLATE.compile(guild_id=guild_id, template_code=template_code)
+
+    CREATE_GUILD_FROM_TEMPLATE = Route("POST", "guilds/{guild_id}/templates/{template_code}")
 
     @classmethod
-    def create_guild_from_template(cls, guild_id: int, template_code: str) -> str:
-        return f"guilds/{guild_id}/templates/{template_code}"
+    def create_guild_from_template(cls, guild_id: int, template_code: str) -> CompiledRoute:
+        return cls.CREATE_GUILD_FROM_TEMPLATE.compile(guild_id=guild_id, template_code=template_code)
+
+    GET_GUILD_TEMPLATES = Route("GET", "guilds/{guild_id}/templates")
 
     @classmethod
-    def get_guild_templates(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/templates"
+    def get_guild_templates(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_TEMPLATES.compile(guild_id=guild_id)
+
+    CREATE_GUILD_TEMPLATE = Route("POST", "guilds/{guild_id}/templates")
 
     @classmethod
-    def create_guild_template(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/templates"
+    def create_guild_template(cls, guild_id: int) -> CompiledRoute:
+        return cls.CREATE_GUILD_TEMPLATE.compile(guild_id=guild_id)
+
+    SYNC_GUILD_TEMPLATE = Route("PUT", "guilds/{guild_id}/templates/{template_code}")
 
     @classmethod
-    def sync_guild_template(cls, guild_id: int, template_code: str) -> str:
-        return f"guilds/{guild_id}/templates/{template_code}"
+    def sync_guild_template(cls, guild_id: int, template_code: str) -> CompiledRoute:
+        return cls.SYNC_GUILD_TEMPLATE.compile(guild_id=guild_id, template_code=template_code)
+
+    MODIFY_GUILD_TEMPLATE = Route("PATCH", "guilds/{guild_id}/templates/{template_code}")
 
     @classmethod
-    def modify_guild_template(cls, guild_id: int, template_code: str) -> str:
-        return f"guilds/{guild_id}/templates/{template_code}"
+    def modify_guild_template(cls, guild_id: int, template_code: str) -> CompiledRoute:
+        return cls.MODIFY_GUILD_TEMPLATE.compile(guild_id=guild_id, template_code=template_code)
+
+    DELETE_GUILD_TEMPLATE = Route("DELETE", "guilds/{guild_id}/templates/{template_code}")
 
     @classmethod
-    def delete_guild_template(cls, guild_id: int, template_code: str) -> str:
-        return f"guilds/{guild_id}/templates/{template_code}"
+    def delete_guild_template(cls, guild_id: int, template_code: str) -> CompiledRoute:
+        return cls.DELETE_GUILD_TEMPLATE.compile(guild_id=guild_id, template_code=template_code)
+
+    GET_INVITE = Route("GET", "invites/{invite_code}")
 
     @classmethod
-    def get_invite(cls, invite_code: str) -> str:
-        return f"invites/{invite_code}"
+    def get_invite(cls, invite_code: str) -> CompiledRoute:
+        return cls.GET_INVITE.compile(invite_code=invite_code)
+
+    DELETE_INVITE = Route("DELETE", "invites/{invite_code}")
 
     @classmethod
-    def delete_invite(cls, invite_code: str) -> str:
-        return f"invites/{invite_code}"
+    def delete_invite(cls, invite_code: str) -> CompiledRoute:
+        return cls.DELETE_INVITE.compile(invite_code=invite_code)
+
+    CREATE_STAGE_INSTANCE = Route("POST", "stage-instances")
 
     @classmethod
-    def create_stage_instance(cls) -> str:
-        return "stage-instances"
+    def create_stage_instance(cls) -> CompiledRoute:
+        return cls.CREATE_STAGE_INSTANCE.compile()
+
+    GET_STAGE_INSTANCE = Route("GET", "stage-instances/{channel_id}")
 
     @classmethod
-    def get_stage_instance(cls, channel_id: int) -> str:
-        return f"stage-instances/{channel_id}"
+    def get_stage_instance(cls, channel_id: int) -> CompiledRoute:
+        return cls.GET_STAGE_INSTANCE.compile(channel_id=channel_id)
+
+    MODIFY_STAGE_INSTANCE = Route("PATCH", "stage-instances/{channel_id}")
 
     @classmethod
-    def modify_stage_instance(cls, channel_id: int) -> str:
-        return f"stage-instances/{channel_id}"
+    def modify_stage_instance(cls, channel_id: int) -> CompiledRoute:
+        return cls.MODIFY_STAGE_INSTANCE.compile(channel_id=channel_id)
+
+    DELETE_STAGE_INSTANCE = Route("DELETE", "stage-instances/{channel_id}")
 
     @classmethod
-    def delete_stage_instance(cls, channel_id: int) -> str:
-        return f"stage-instances/{channel_id}"
+    def delete_stage_instance(cls, channel_id: int) -> CompiledRoute:
+        return cls.DELETE_STAGE_INSTANCE.compile(channel_id=channel_id)
+
+    GET_STICKER = Route("GET", "stickers/{sticker_id}")
 
     @classmethod
-    def get_sticker(cls, sticker_id: int) -> str:
-        return f"stickers/{sticker_id}"
+    def get_sticker(cls, sticker_id: int) -> CompiledRoute:
+        return cls.GET_STICKER.compile(sticker_id=sticker_id)
+
+    LIST_NITRO_STICKER_PACKS = Route("GET", "sticker-packs")
 
     @classmethod
-    def list_nitro_sticker_packs(cls) -> str:
-        return "sticker-packs"
+    def list_nitro_sticker_packs(cls) -> CompiledRoute:
+        return cls.LIST_NITRO_STICKER_PACKS.compile()
+
+    LIST_GUILD_STICKERS = Route("GET", "guilds/{guild_id}/stickers")
 
     @classmethod
-    def list_guild_stickers(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/stickers"
+    def list_guild_stickers(cls, guild_id: int) -> CompiledRoute:
+        return cls.LIST_GUILD_STICKERS.compile(guild_id=guild_id)
+
+    CREATE_GUILD_STICKER = Route("POST", "guilds/{guild_id}/stickers")
 
     @classmethod
-    def create_guild_sticker(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/stickers"
+    def create_guild_sticker(cls, guild_id: int) -> CompiledRoute:
+        return cls.CREATE_GUILD_STICKER.compile(guild_id=guild_id)
+
+    GET_GUILD_STICKER = Route("GET", "guilds/{guild_id}/stickers/{sticker_id}")
 
     @classmethod
-    def get_guild_sticker(cls, guild_id: int, sticker_id: int) -> str:
-        return f"guilds/{guild_id}/stickers/{sticker_id}"
+    def get_guild_sticker(cls, guild_id: int, sticker_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_STICKER.compile(guild_id=guild_id, sticker_id=sticker_id)
+
+    MODIFY_GUILD_STICKER = Route("PATCH", "guilds/{guild_id}/stickers/{sticker_id}")
 
     @classmethod
-    def modify_guild_sticker(cls, guild_id: int, sticker_id: int) -> str:
-        return f"guilds/{guild_id}/stickers/{sticker_id}"
+    def modify_guild_sticker(cls, guild_id: int, sticker_id: int) -> CompiledRoute:
+        return cls.MODIFY_GUILD_STICKER.compile(guild_id=guild_id, sticker_id=sticker_id)
+
+    DELETE_GUILD_STICKER = Route("DELETE", "guilds/{guild_id}/stickers/{sticker_id}")
 
     @classmethod
-    def delete_guild_sticker(cls, guild_id: int, sticker_id: int) -> str:
-        return f"guilds/{guild_id}/stickers/{sticker_id}"
+    def delete_guild_sticker(cls, guild_id: int, sticker_id: int) -> CompiledRoute:
+        return cls.DELETE_GUILD_STICKER.compile(guild_id=guild_id, sticker_id=sticker_id)
+
+    GET_CURRENT_USER = Route("GET", "users/@me")
 
     @classmethod
-    def get_current_user(cls) -> str:
-        return "users/@me"
+    def get_current_user(cls) -> CompiledRoute:
+        return cls.GET_CURRENT_USER.compile()
+
+    GET_USER = Route("GET", "users/{user_id}")
 
     @classmethod
-    def get_user(cls, user_id: int) -> str:
-        return f"users/{user_id}"
+    def get_user(cls, user_id: int) -> CompiledRoute:
+        return cls.GET_USER.compile(user_id=user_id)
+
+    MODIFY_CURRENT_USER = Route("PATCH", "users/@me")
 
     @classmethod
-    def modify_current_user(cls) -> str:
-        return "users/@me"
+    def modify_current_user(cls) -> CompiledRoute:
+        return cls.MODIFY_CURRENT_USER.compile()
+
+    GET_CURRENT_USER_GUILDS = Route("GET", "users/@me/guilds")
 
     @classmethod
-    def get_current_user_guilds(cls) -> str:
-        return "users/@me/guilds"
+    def get_current_user_guilds(cls) -> CompiledRoute:
+        return cls.GET_CURRENT_USER_GUILDS.compile()
+
+    GET_CURRENT_USER_GUILDS_MEMBERSHIP = Route("GET", "users/@me/guilds/{guild_id}/member")
 
     @classmethod
-    def get_current_user_guilds_membership(cls, guild_id: int) -> str:
-        return f"users/@me/guilds/{guild_id}/member"
+    def get_current_user_guilds_membership(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_CURRENT_USER_GUILDS_MEMBERSHIP.compile(guild_id=guild_id)
+
+    LEAVE_GUILD = Route("DELETE", "users/@me/guilds/{guild_id}")
 
     @classmethod
-    def leave_guild(cls, guild_id: int) -> str:
-        return f"users/@me/guilds/{guild_id}"
+    def leave_guild(cls, guild_id: int) -> CompiledRoute:
+        return cls.LEAVE_GUILD.compile(guild_id=guild_id)
+
+    CREATE_DM = Route("POST", "users/@me/channels")
 
     @classmethod
-    def create_dm(cls) -> str:
-        return "users/@me/channels"
+    def create_dm(cls) -> CompiledRoute:
+        return cls.CREATE_DM.compile()
+
+    CREATE_GROUP_DM = Route("POST", "users/@me/channels")
 
     @classmethod
-    def create_group_dm(cls) -> str:
-        return "users/@me/channels"
+    def create_group_dm(cls) -> CompiledRoute:
+        return cls.CREATE_GROUP_DM.compile()
+
+    GET_USER_CONNECTIONS = Route("GET", "users/@me/connections")
 
     @classmethod
-    def get_user_connections(cls) -> str:
-        return "users/@me/connections"
+    def get_user_connections(cls) -> CompiledRoute:
+        return cls.GET_USER_CONNECTIONS.compile()
+
+    LIST_VOICE_REGIONS = Route("GET", "voice/regions")
 
     @classmethod
-    def list_voice_regions(cls) -> str:
-        return "voice/regions"
+    def list_voice_regions(cls) -> CompiledRoute:
+        return cls.LIST_VOICE_REGIONS.compile()
+
+    CREATE_WEBHOOK = Route("POST", "channels/{channel_id}/webhooks")
 
     @classmethod
-    def create_webhook(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/webhooks"
+    def create_webhook(cls, channel_id: int) -> CompiledRoute:
+        return cls.CREATE_WEBHOOK.compile(channel_id=channel_id)
+
+    GET_CHANNEL_WEBHOOKS = Route("GET", "channels/{channel_id}/webhooks")
 
     @classmethod
-    def get_channel_webhooks(cls, channel_id: int) -> str:
-        return f"channels/{channel_id}/webhooks"
+    def get_channel_webhooks(cls, channel_id: int) -> CompiledRoute:
+        return cls.GET_CHANNEL_WEBHOOKS.compile(channel_id=channel_id)
+
+    GET_WEBHOOK = Route("GET", "webhooks/{webhook_id}")
 
     @classmethod
-    def get_webhook(cls, webhook_id: int) -> str:
-        return f"webhooks/{webhook_id}"
+    def get_webhook(cls, webhook_id: int) -> CompiledRoute:
+        return cls.GET_WEBHOOK.compile(webhook_id=webhook_id)
+
+    GET_WEBHOOK_WITH_TOKEN = Route("GET", "webhooks/{webhook_id}/{webhook_token}")
 
     @classmethod
-    def get_webhook_with_token(cls, webhook_id: int, webhook_token: str) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}"
+    def get_webhook_with_token(cls, webhook_id: int, webhook_token: str) -> CompiledRoute:
+        return cls.GET_WEBHOOK_WITH_TOKEN.compile(webhook_id=webhook_id, webhook_token=webhook_token)
+
+    MODIFY_WEBHOOK = Route("PATCH", "webhooks/{webhook_id}")
 
     @classmethod
-    def modify_webhook(cls, webhook_id: int) -> str:
-        return f"webhooks/{webhook_id}"
+    def modify_webhook(cls, webhook_id: int) -> CompiledRoute:
+        return cls.MODIFY_WEBHOOK.compile(webhook_id=webhook_id)
+
+    MODIFY_WEBHOOK_WITH_TOKEN = Route("PATCH", "webhooks/{webhook_id}/{webhook_token}")
 
     @classmethod
-    def modify_webhook_with_token(cls, webhook_id: int, webhook_token: str) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}"
+    def modify_webhook_with_token(cls, webhook_id: int, webhook_token: str) -> CompiledRoute:
+        return cls.MODIFY_WEBHOOK_WITH_TOKEN.compile(webhook_id=webhook_id, webhook_token=webhook_token)
+
+    DELETE_WEBHOOK = Route("DELETE", "webhooks/{webhook_id}")
 
     @classmethod
-    def delete_webhook(cls, webhook_id: int) -> str:
-        return f"webhooks/{webhook_id}"
+    def delete_webhook(cls, webhook_id: int) -> CompiledRoute:
+        return cls.DELETE_WEBHOOK.compile(webhook_id=webhook_id)
+
+    DELETE_WEBHOOK_WITH_TOKEN = Route("DELETE", "webhooks/{webhook_id}/{webhook_token}")
 
     @classmethod
-    def delete_webhook_with_token(cls, webhook_id: int, webhook_token: str) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}"
+    def delete_webhook_with_token(cls, webhook_id: int, webhook_token: str) -> CompiledRoute:
+        return cls.DELETE_WEBHOOK_WITH_TOKEN.compile(webhook_id=webhook_id, webhook_token=webhook_token)
+
+    EXECUTE_WEBHOOK = Route("POST", "webhooks/{webhook_id}/{webhook_token}")
+
+    @classmethod
+    def execute_webhook(cls, webhook_id: int, webhook_token: str) -> CompiledRoute:
+        return cls.EXECUTE_WEBHOOK.compile(webhook_id=webhook_id, webhook_token=webhook_token)
+
+    EXECUTE_SLACK_COMPATIBLE_WEBHOOK = Route("POST", "webhooks/{webhook_id}/{webhook_token}/slack")
 
     @classmethod
-    def execute_webhook(cls, webhook_id: int, webhook_token: str) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}"
+    def execute_slack_compatible_webhook(cls, webhook_id: int, webhook_token: str) -> CompiledRoute:
+        return cls.EXECUTE_SLACK_COMPATIBLE_WEBHOOK.compile(webhook_id=webhook_id, webhook_token=webhook_token)
+
+    EXECUTE_GITHUB_COMPATIBLE_WEBHOOK = Route("POST", "webhooks/{webhook_id}/{webhook_token}/github")
 
     @classmethod
-    def execute_slack_compatible_webhook(cls, webhook_id: int, webhook_token: str) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}/slack"
+    def execute_github_compatible_webhook(cls, webhook_id: int, webhook_token: str) -> CompiledRoute:
+        return cls.EXECUTE_GITHUB_COMPATIBLE_WEBHOOK.compile(webhook_id=webhook_id, webhook_token=webhook_token)
+
+    GET_WEBHOOK_MESSAGE = Route("GET", "webhooks/{webhook_id}/{webhook_token}/messages/{message_id}")
 
     @classmethod
-    def execute_github_compatible_webhook(cls, webhook_id: int, webhook_token: str) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}/github"
+    def get_webhook_message(cls, webhook_id: int, webhook_token: str, message_id: int) -> CompiledRoute:
+        return cls.GET_WEBHOOK_MESSAGE.compile(
+            webhook_id=webhook_id, webhook_token=webhook_token, message_id=message_id
+        )
+
+    EDIT_WEBHOOK_MESSAGE = Route("PATCH", "webhooks/{webhook_id}/{webhook_token}/messages/{message_id}")
 
     @classmethod
-    def get_webhook_message(cls, webhook_id: int, webhook_token: str, message_id: int) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
+    def edit_webhook_message(cls, webhook_id: int, webhook_token: str, message_id: int) -> CompiledRoute:
+        return cls.EDIT_WEBHOOK_MESSAGE.compile(
+            webhook_id=webhook_id, webhook_token=webhook_token, message_id=message_id
+        )
+
+    DELETE_WEBHOOK_MESSAGE = Route("DELETE", "webhooks/{webhook_id}/{webhook_token}/messages/{message_id}")
 
     @classmethod
-    def edit_webhook_message(cls, webhook_id: int, webhook_token: str, message_id: int) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
+    def delete_webhook_message(cls, webhook_id: int, webhook_token: str, message_id: int) -> CompiledRoute:
+        return cls.DELETE_WEBHOOK_MESSAGE.compile(
+            webhook_id=webhook_id, webhook_token=webhook_token, message_id=message_id
+        )
+
+    GET_GUILD_WEBHOOKS = Route("GET", "guilds/{guild_id}/webhooks")
 
     @classmethod
-    def delete_webhook_message(cls, webhook_id: int, webhook_token: str, message_id: int) -> str:
-        return f"webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"
+    def get_guild_webhooks(cls, guild_id: int) -> CompiledRoute:
+        return cls.GET_GUILD_WEBHOOKS.compile(guild_id=guild_id)
+
+    INTERACTION_COMMAND = Route("GET", "applications/{app_id}/commands")
 
     @classmethod
-    def get_guild_webhooks(cls, guild_id: int) -> str:
-        return f"guilds/{guild_id}/webhooks"
+    def interaction_command(cls, app_id: int) -> CompiledRoute:
+        return cls.INTERACTION_COMMAND.compile(app_id=app_id)
+
+    INTERACTION_CALLBACK = Route("POST", "interactions/{interaction_id}/{interaction_token}/callback")
 
     @classmethod
-    def interaction_command(cls, app_id: int) -> str:
-        return f"applications/{app_id}/commands"
+    def interaction_callback(cls, interaction_id: int, interaction_token: str) -> CompiledRoute:
+        return cls.INTERACTION_CALLBACK.compile(interaction_id=interaction_id, interaction_token=interaction_token)
+
+    GET_ORIGINAL_INTERACTION = Route("GET", "webhooks/{interaction_id}/{interaction_token}/messages/@original")
 
     @classmethod
-    def interaction_callback(cls, interaction_id: int, interaction_token: str) -> str:
-        return f"interactions/{interaction_id}/{interaction_token}/callback"
+    def get_original_interaction(cls, interaction_id: int, interaction_token: str) -> CompiledRoute:
+        return cls.GET_ORIGINAL_INTERACTION.compile(interaction_id=interaction_id, interaction_token=interaction_token)
+
+    EDIT_ORIGINAL_INTERACTION = Route("PATCH", "webhooks/{interaction_id}/{interaction_token}/messages/@original")
 
     @classmethod
-    def get_original_interaction(cls, interaction_id: int, interaction_token: str) -> str:
-        return f"/webhooks/{interaction_id}/{interaction_token}/messages/@original"
+    def edit_original_interaction(cls, interaction_id: int, interaction_token: str) -> CompiledRoute:
+        return cls.EDIT_ORIGINAL_INTERACTION.compile(interaction_id=interaction_id, interaction_token=interaction_token)
+
+    DELETE_ORIGINAL_INTERACTION = Route("DELETE", "webhooks/{interaction_id}/{interaction_token}/messages/@original")
 
     @classmethod
-    def edit_original_interaction(cls, interaction_id: int, interaction_token: str) -> str:
-        return f"/webhooks/{interaction_id}/{interaction_token}/messages/@original"
+    def delete_original_interaction(cls, interaction_id: int, interaction_token: str) -> CompiledRoute:
+        return cls.DELETE_ORIGINAL_INTERACTION.compile(
+            interaction_id=interaction_id, interaction_token=interaction_token
+        )
+
+    CREATE_FOLLOWUP_MESSAGE = Route("POST", "webhooks/{interaction_id}/{interaction_token}")
 
     @classmethod
-    def delete_original_interaction(cls, interaction_id: int, interaction_token: str) -> str:
-        return f"/webhooks/{interaction_id}/{interaction_token}/messages/@original"
+    def create_followup_message(cls, interaction_id: int, interaction_token: str) -> CompiledRoute:
+        return cls.CREATE_FOLLOWUP_MESSAGE.compile(interaction_id=interaction_id, interaction_token=interaction_token)
+
+    GET_FOLLOWUP_MESSAGE = Route("GET", "webhooks/{interaction_id}/{interaction_token}/messages/{message_id}")
 
     @classmethod
-    def create_followup_message(cls, interaction_id: int, interaction_token: str) -> str:
-        return f"/webhooks/{interaction_id}/{interaction_token}"
+    def get_followup_message(cls, interaction_id: int, interaction_token: str, message_id: int) -> CompiledRoute:
+        return cls.GET_FOLLOWUP_MESSAGE.compile(
+            interaction_id=interaction_id, interaction_token=interaction_token, message_id=message_id
+        )
+
+    EDIT_FOLLOWUP_MESSAGE = Route("PATCH", "webhooks/{interaction_id}/{interaction_token}/messages/{message_id}")
 
     @classmethod
-    def get_followup_message(cls, interaction_id: int, interaction_token: str, message_id: int) -> str:
-        return f"/webhooks/{interaction_id}/{interaction_token}/messages/{message_id}"
+    def edit_followup_message(cls, interaction_id: int, interaction_token: str, message_id: int) -> CompiledRoute:
+        return cls.EDIT_FOLLOWUP_MESSAGE.compile(
+            interaction_id=interaction_id, interaction_token=interaction_token, message_id=message_id
+        )
+
+    DELETE_FOLLOWUP_MESSAGE = Route("DELETE", "webhooks/{interaction_id}/{interaction_token}/messages/{message_id}")
 
     @classmethod
-    def edit_followup_message(cls, interaction_id: int, interaction_token: str, message_id: int) -> str:
-        return f"/webhooks/{interaction_id}/{interaction_token}/messages/{message_id}"
+    def delete_followup_message(cls, interaction_id: int, interaction_token: str, message_id: int) -> CompiledRoute:
+        return cls.DELETE_FOLLOWUP_MESSAGE.compile(
+            interaction_id=interaction_id, interaction_token=interaction_token, message_id=message_id
+        )
+
+    GET_GATEWAY_BOT = Route("GET", "gateway/bot")
 
     @classmethod
-    def delete_followup_message(cls, interaction_id: int, interaction_token: str, message_id: int) -> str:
-        return f"/webhooks/{interaction_id}/{interaction_token}/messages/{message_id}"
+    def get_gateway_bot(cls) -> CompiledRoute:
+        return cls.GET_GATEWAY_BOT.compile()
@@ -0,0 +1,129 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+import aiohttp
+import attrs
+
+__all__: tuple[str, ...] = ("RetryBudget", "RetryPolicy")
+
+
+@attrs.define(kw_only=True)
+class RetryBudget:
+    """Caps retries to a share of the requests being made, so an outage on discord's end
+    doesn't get amplified by every failed request being sent multiple times.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, on top of a reserve
+    of ``min_per_second`` retries per second that is always available.
+    """
+
+    ratio: float = 0.2
+    """Retries allowed per request made."""
+    min_per_second: float = 10
+    """Retries per second allowed regardless of the request volume."""
+    max_tokens: float = 20
+    """Maximum number of retries that can be saved up."""
+    _tokens: float = attrs.field(init=False, default=0)
+    _reserve: float = attrs.field(
+        init=False, default=attrs.Factory(lambda self: self.min_per_second, takes_self=True)  # type: ignore
+    )
+    _updated_at: float = attrs.field(init=False, factory=time.monotonic)
+
+    def deposit(self) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Takes a retry out of the budget.
+
+        Returns
+        -------
+        bool
+            False if the budget is spent and the request shouldn't be retried.
+        """
+        now = time.monotonic()
+        self._reserve = min(self.min_per_second, self._reserve + (now - self._updated_at) * self.min_per_second)
+        self._updated_at = now
+        if self._reserve >= 1:
+            self._reserve -= 1
+            return True
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+
+@attrs.define(kw_only=True)
+class RetryPolicy:
+    """Decides which failed requests are retried and how long to wait in between.
+
+    Retries are spaced with exponential backoff and full jitter. Only idempotent methods are retried
+    unless a request opts in, since a POST that failed with a 502 may still have gone through.
+    """
+
+    max_retries: int = 3
+    """Maximum number of retries for a single request."""
+    base_delay: float = 0.5
+    """Upper bound of the first backoff, in seconds. It doubles with every retry."""
+    max_delay: float = 10
+    """Upper bound of any single backoff, in seconds."""
+    deadline: float | None = None
+    """Default number of seconds a request may take in total including retries, ``None`` for no limit."""
+    retry_statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+    """Response statuses that are retried."""
+    retry_exceptions: tuple[type[BaseException], ...] = (
+        aiohttp.ServerDisconnectedError,
+        aiohttp.ClientConnectionError,
+        asyncio.TimeoutError,
+    )
+    """Exceptions that are retried."""
+    idempotent_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    """Methods which are retried by default."""
+    budget: RetryBudget = attrs.field(factory=RetryBudget)
+    """The retry budget shared by every request made with this policy."""
+
+    def allows_retries(self, method: str, opt_in: bool | None = None) -> bool:
+        """Checks if requests with the given method can be retried.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        opt_in: bool | None
+            Per request override, ``None`` to go by the method.
+
+        Returns
+        -------
+        bool
+            True if the request can be retried.
+        """
+        if opt_in is not None:
+            return opt_in
+        return method in self.idempotent_methods
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the number of seconds to wait before the retry following ``attempt``, which starts at 0."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
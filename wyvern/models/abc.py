@@ -31,6 +31,8 @@ if typing.TYPE_CHECKING:
 
 
 class ImplementsMessage(pyabc.ABC):
+    __slots__ = ()
+
     id: Snowflake
     bot: GatewayBot
 
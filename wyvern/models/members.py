@@ -5,8 +5,9 @@ import typing
 
 import attrs
 
-from wyvern.models.snowflake import Snowflake
-from wyvern.models.users import PartialUser, User
+from wyvern.models.abc import ImplementsMessage
+from wyvern.models.snowflake import DiscordObject, Snowflake
+from wyvern.models.users import User
 
 if typing.TYPE_CHECKING:
     import discord_typings
@@ -17,31 +18,75 @@ __all__: tuple[str, ...] = ("GuildMember",)
 
 
 @attrs.define(kw_only=True)
-class GuildMember(User):
-    raw: discord_typings.GuildMemberData  # type: ignore
-    """Raw payload."""
+class GuildMember(DiscordObject, ImplementsMessage):
+    """Object representing a member of a guild.
+
+    User fields aren't copied onto the member, they are read from :attr:`user`, which may be shared
+    by the members of the same user in other guilds.
+    """
+
     user: User
     """User of the member."""
     guild_id: Snowflake
     """ID of the guild this member belongs to."""
     nickname: str | None
     """Nickname of the member, if any."""
-    role_ids: list[Snowflake]
-    """List of role ids."""
+    role_ids: tuple[Snowflake, ...]
+    """IDs of the member's roles."""
     joined_at: datetime.datetime
     """Datetime on which the member joined the guild."""
     premium_since: datetime.datetime | None
     """Datetime since member has been boosting the guild."""
     deaf: bool | None
-    """True if member is deafened."""
+    """True if member is deafened, ``None`` if the payload didn't include it."""
     mute: bool | None
-    """True if member is muted."""
+    """True if member is muted, ``None`` if the payload didn't include it."""
     pending: bool
     """True if member is in pending state."""
     communication_disabled_until: datetime.datetime | None
     """Timeout for the member."""
     guild_avatar_hash: str | None
     """Avatar hash for the guild."""
+    raw: discord_typings.GuildMemberData | None = None
+    """Raw payload, ``None`` if it wasn't retained."""
+
+    def __str__(self) -> str:
+        return self.user.tag
+
+    @property
+    def id(self) -> Snowflake:  # type: ignore[override]
+        """ID of the member's user."""
+        return self.user.id
+
+    @property
+    def bot(self) -> GatewayBot:  # type: ignore[override]
+        """The current bot application."""
+        return self.user.bot
+
+    @property
+    def username(self) -> str:
+        """Username of the member's user."""
+        return self.user.username
+
+    @property
+    def discriminator(self) -> str:
+        """Discriminator of the member's user."""
+        return self.user.discriminator
+
+    @property
+    def tag(self) -> str:
+        """Return user tag ( ``username#disciminator`` )"""
+        return self.user.tag
+
+    @property
+    def avatar_hash(self) -> str | None:
+        """Hash of the user's avatar."""
+        return self.user.avatar_hash
+
+    @property
+    def is_bot(self) -> bool:
+        """True if the user is a bot."""
+        return self.user.is_bot
 
     @property
     def display_name(self) -> str:
@@ -51,37 +96,52 @@ class GuildMember(User):
         str
             Nickname of the user if exists, else the username.
         """
-        return self.nickname or self.username
+        return self.nickname or self.user.username
+
+    async def create_message(self, content: str) -> ...:
+        return await self.user.create_message(content)
 
     @classmethod
-    def from_payload(cls, bot: GatewayBot, guild_id: int, payload: discord_typings.GuildMemberData) -> GuildMember:
-        user: User = User.from_partial(bot, PartialUser.from_payload(payload["user"]))  # type: ignore
+    def from_payload(
+        cls,
+        bot: GatewayBot,
+        guild_id: int,
+        payload: discord_typings.GuildMemberData,
+        *,
+        user: User | None = None,
+        retain_raw: bool = True,
+    ) -> GuildMember:
+        """Creates a member from its payload.
+
+        Parameters
+        ----------
+        bot: GatewayBot
+            The current bot application.
+        guild_id: int
+            ID of the guild the member belongs to.
+        payload: discord_typings.GuildMemberData
+            The member payload.
+        user: User | None
+            An existing user to reference, created from ``payload["user"]`` if not passed.
+        retain_raw: bool
+            Whether to keep the payload in :attr:`raw`, defaults to ``True``.
+
+        Returns
+        -------
+        GuildMember
+            The member.
+        """
         return GuildMember(
-            user=user,
-            id=user.id,
-            username=user.username,
-            discriminator=user.discriminator,
-            raw=payload,
-            avatar_hash=user.avatar_hash,
-            is_bot=user.is_bot,
-            is_system=user.is_system,
-            is_mfa_enabled=user.is_mfa_enabled,
-            banner_hash=user.banner_hash,
-            accent_color=user.accent_color,
-            locale=user.locale,
-            flags_value=user.flags_value,
-            premium_type_value=user.premium_type_value,
-            public_flags_value=user.public_flags_value,
-            bot=bot,
-            partial_user=user.partial_user,
-            guild_id=Snowflake(guild_id),
+            user=user or User.from_data(bot, payload["user"], retain_raw=retain_raw),  # type: ignore
+            guild_id=guild_id if isinstance(guild_id, Snowflake) else Snowflake(guild_id),
             nickname=payload.get("nick"),
-            role_ids=[Snowflake(_id) for _id in payload["roles"]],
+            role_ids=tuple(Snowflake(_id) for _id in payload["roles"]),
             joined_at=datetime.datetime.fromisoformat(payload["joined_at"]),
             premium_since=datetime.datetime.fromisoformat(ps) if (ps := payload.get("premium_since")) else None,
-            deaf=payload["deaf"],
-            mute=payload["mute"],
+            deaf=payload.get("deaf"),
+            mute=payload.get("mute"),
             pending=payload.get("pending") or False,
             communication_disabled_until=payload.get("communication_disabled_until"),
             guild_avatar_hash=av if (av := payload.get("avatar")) else None,
+            raw=payload if retain_raw else None,
         )
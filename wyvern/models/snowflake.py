@@ -35,6 +35,8 @@ class Snowflake(int):
 class DiscordObject(abc.ABC):
     """Base class for all discord snowflake models. Models like :class:`.User` inherit from this."""
 
+    __slots__ = ()
+
     id: Snowflake
     """ID of the object."""
 
@@ -72,8 +72,8 @@ class UserLike(DiscordObject):
 class PartialUser(UserLike):
     """Object representing a user object."""
 
-    raw: discord_typings.UserData
-    """The raw data from discord this object was constructed from."""
+    raw: discord_typings.UserData | None = None
+    """The raw data from discord this object was constructed from, ``None`` if it wasn't retained."""
     id: Snowflake
     """ID of the user."""
     username: str
@@ -102,9 +102,9 @@ class PartialUser(UserLike):
     """Integer value for user's public flags"""
 
     @classmethod
-    def from_payload(cls, payload: discord_typings.UserData) -> PartialUser:
+    def from_payload(cls, payload: discord_typings.UserData, *, retain_raw: bool = True) -> PartialUser:
         return PartialUser(
-            raw=payload,
+            raw=payload if retain_raw else None,
             id=Snowflake(payload["id"]),
             username=payload["username"],
             discriminator=payload["discriminator"],
@@ -131,6 +131,42 @@ class User(PartialUser, ImplementsMessage):
     async def create_message(self, content: str) -> ...:
         return await super().create_message(content)
 
+    @classmethod
+    def from_data(cls, bot: GatewayBot, payload: discord_typings.UserData, *, retain_raw: bool = True) -> User:
+        """Creates a user straight from its payload, without keeping a :class:`PartialUser` around.
+
+        Parameters
+        ----------
+        bot: GatewayBot
+            The current bot application.
+        payload: discord_typings.UserData
+            The user payload.
+        retain_raw: bool
+            Whether to keep the payload in :attr:`raw`, defaults to ``True``.
+
+        Returns
+        -------
+        User
+            The user.
+        """
+        return cls(
+            raw=payload if retain_raw else None,
+            id=Snowflake(payload["id"]),
+            username=payload["username"],
+            discriminator=payload["discriminator"],
+            avatar_hash=payload.get("avatar"),
+            is_bot=payload.get("bot", False),
+            is_system=payload.get("system", False),
+            is_mfa_enabled=payload.get("mfa_enabled", False),
+            banner_hash=payload.get("banner"),
+            accent_color=payload.get("accent_color"),
+            locale=payload.get("locale"),
+            flags_value=payload.get("flags"),
+            premium_type_value=payload.get("premium_type"),
+            public_flags_value=payload.get("public_flags"),
+            bot=bot,
+        )
+
     @classmethod
     def from_partial(cls, bot: GatewayBot, partial_user: PartialUser) -> User:
         return User(
@@ -153,6 +189,7 @@ class User(PartialUser, ImplementsMessage):
         )
 
 
+@attrs.define(kw_only=True)
 class BotUser(User):
     @classmethod
     def from_partial(cls, bot: GatewayBot, partial_user: PartialUser) -> BotUser:
@@ -35,4 +35,7 @@ if typing.TYPE_CHECKING:
     NullOr = typing.Union[utils.Null, T]
     Snowflakish = typing.Union[T, models.Snowflake, int]
     AnyCallbackT: TypeAlias = typing.Callable[..., typing.Awaitable[typing.Any]]
-    EventListenerCallbackT: TypeAlias = typing.Callable[[typing.Any], typing.Awaitable[typing.Any]]
+    # Listener callbacks can be coroutine functions or plain functions, which run inline or offloaded.
+    EventListenerCallbackT: TypeAlias = typing.Callable[
+        [typing.Any], typing.Union[typing.Awaitable[typing.Any], typing.Any]
+    ]
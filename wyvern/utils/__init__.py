@@ -22,3 +22,4 @@
 
 from .consts import *
 from .hooks import *
+from .lazy import *
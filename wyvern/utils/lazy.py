@@ -0,0 +1,63 @@
+# MIT License
+
+# Copyright (c) 2023 Sarthak
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import typing
+
+__all__: tuple[str, ...] = ("lazy_property",)
+
+T = typing.TypeVar("T")
+
+
+class lazy_property(typing.Generic[T]):
+    """A :func:`functools.cached_property` for slotted classes.
+
+    The computed value is stored in the instance's ``_lazy_cache`` dict, which slotted
+    classes using this descriptor have to provide, instead of the instance ``__dict__``.
+    """
+
+    def __init__(self, func: typing.Callable[[typing.Any], T]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @typing.overload
+    def __get__(self, instance: None, owner: type | None = None) -> lazy_property[T]:
+        ...
+
+    @typing.overload
+    def __get__(self, instance: object, owner: type | None = None) -> T:
+        ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> T | lazy_property[T]:
+        if instance is None:
+            return self
+        cache: dict[str, typing.Any] = instance._lazy_cache  # type: ignore
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(instance)
+            return value